@@ -12,12 +12,13 @@ Key Principle: Safety first - always validate before and after operations.
 """
 
 import os
-import shutil
 import sqlite3
 import logging
 from datetime import datetime
 from pathlib import Path
 
+from radio_monitor.database.schema import rebuild_artists_fts
+
 logger = logging.getLogger(__name__)
 
 
@@ -58,6 +59,57 @@ def is_valid_sqlite_db(file_path):
         return False
 
 
+def checkpoint_wal(db_path):
+    """Checkpoint the write-ahead log so the database file is self-contained
+
+    No-op for databases in rollback-journal mode.
+
+    Args:
+        db_path: Path to database file
+
+    Returns:
+        True if the checkpoint completed, False if it failed or was blocked
+        by other connections (busy)
+    """
+    try:
+        conn = sqlite3.connect(db_path, timeout=30)
+        try:
+            busy, _, _ = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning(f"WAL checkpoint failed for {db_path}: {e}")
+        return False
+
+    if busy:
+        logger.warning(f"WAL checkpoint for {db_path} was blocked by other connections")
+        return False
+    return True
+
+
+def copy_database(source_path, dest_path):
+    """Copy a database with SQLite's online backup API
+
+    Unlike a file copy, this reads committed WAL content from the source and
+    writes the destination through SQLite's own locking, so connections that
+    already have the destination open (the app, scrape pools) see the new
+    contents instead of replaying a stale WAL over them.
+
+    Args:
+        source_path: Path to database to copy from
+        dest_path: Path to database to overwrite (created if missing)
+    """
+    source = sqlite3.connect(source_path, timeout=30)
+    try:
+        dest = sqlite3.connect(dest_path, timeout=30)
+        try:
+            source.backup(dest)
+        finally:
+            dest.close()
+    finally:
+        source.close()
+
+
 def backup_database(db_path, backup_dir='backups/', settings=None):
     """Create a timestamped backup of the database
 
@@ -79,8 +131,8 @@ def backup_database(db_path, backup_dir='backups/', settings=None):
         backup_name = f"{db_name.replace('.db', '')}_{timestamp}.db"
         backup_path = os.path.join(backup_dir, backup_name)
 
-        # Copy database
-        shutil.copy2(db_path, backup_path)
+        # Copy database (including WAL content written by pooled connections)
+        copy_database(db_path, backup_path)
 
         # Validate backup
         if not is_valid_sqlite_db(backup_path):
@@ -132,20 +184,25 @@ def restore_database(backup_path, db_path, backup_dir='backups/'):
         )
 
         if os.path.exists(db_path):
-            shutil.copy2(db_path, pre_restore_backup)
+            # Don't restore while other connections hold the WAL open mid-read/write
+            if not checkpoint_wal(db_path):
+                logger.error("Error: Database is busy, aborting restore")
+                return False
+            copy_database(db_path, pre_restore_backup)
             logger.info(f"Pre-restore backup created: {pre_restore_backup}")
         else:
             logger.warning(f"Database file not found: {db_path}")
             return False
 
-        # Step 3: Restore from backup
-        shutil.copy2(backup_path, db_path)
+        # Step 3: Restore from backup (through SQLite, since the live database
+        # stays open in the app and scrape pools)
+        copy_database(backup_path, db_path)
         logger.info(f"Database copied from {backup_path}")
 
         # Step 4: Validate restored database
         if not is_valid_sqlite_db(db_path):
             logger.error("Error: Restore failed, restoring from pre-restore backup")
-            shutil.copy2(pre_restore_backup, db_path)
+            copy_database(pre_restore_backup, db_path)
             return False
 
         logger.info(f"[OK] Database restored successfully")
@@ -158,7 +215,7 @@ def restore_database(backup_path, db_path, backup_dir='backups/'):
         # Attempt rollback
         try:
             if os.path.exists(pre_restore_backup):
-                shutil.copy2(pre_restore_backup, db_path)
+                copy_database(pre_restore_backup, db_path)
                 logger.info("Restored from pre-restore backup after failure")
         except:
             logger.error("Rollback failed")
@@ -303,6 +360,8 @@ def vacuum_database(db_path):
 
         conn = sqlite3.connect(db_path)
         conn.execute('VACUUM')
+        rebuild_artists_fts(conn)
+        conn.commit()
         conn.close()
 
         logger.info("[OK] Database vacuumed successfully")
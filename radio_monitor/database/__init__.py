@@ -8,21 +8,25 @@ This package provides a modular database interface with:
 - crud.py: INSERT/UPDATE/DELETE operations
 - exports.py: Lidarr/Plex export functions
 - activity.py: Activity logging functions
+- pool.py: SQLite connection pool for background jobs
 
 The main RadioDatabase class (below) provides a unified interface
 to all database operations with backward compatibility.
 
-Schema Version: 21 (Song Verification Support)
+Schema Version: 26 (Plex failure keyset pagination indexes)
 """
 
 import sqlite3
 import logging
+from contextlib import contextmanager
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 # Import schema functions
 from .schema import create_tables, populate_stations
+# Prepared statement cache size shared with pooled connections
+from .pool import STATEMENT_CACHE_SIZE, RadioConnection, apply_pragmas, is_uri
 # Import migration functions
 from .migrations import _initialize_schema
 # Import query functions
@@ -59,10 +63,11 @@ class RadioDatabase:
     - plex_manual_overrides: Manual Plex track matching overrides (v16)
     - spotiflac_downloads: SpotiFLAC download job tracking (v19)
     - artist_song_verification: Song verification tracking (v21)
+    - artists_fts: Full-text artist name search index (v24)
     """
 
     # Current schema version
-    SCHEMA_VERSION = 21
+    SCHEMA_VERSION = 26
 
     def __init__(self, db_path):
         self.db_path = db_path
@@ -72,11 +77,13 @@ class RadioDatabase:
     def connect(self):
         """Connect to database and create/update schema if needed"""
         # Allow connection to be used across threads (required for Flask multi-threading)
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                    cached_statements=STATEMENT_CACHE_SIZE,
+                                    uri=is_uri(self.db_path), factory=RadioConnection)
         self.cursor = self.conn.cursor()
 
-        # Enable foreign keys
-        self.cursor.execute("PRAGMA foreign_keys = ON")
+        # Enable foreign keys (plus WAL and mmap for file databases)
+        apply_pragmas(self.conn, self.db_path)
 
         # Check if we need to migrate or create schema
         _initialize_schema(self.cursor, self.conn, self.db_path, self.SCHEMA_VERSION)
@@ -89,6 +96,48 @@ class RadioDatabase:
         """
         return self.conn.cursor()
 
+    @contextmanager
+    def transaction(self):
+        """Run a block of writes as one BEGIN IMMEDIATE ... COMMIT transaction
+
+        Rolls back if the block raises. Write methods called inside the block
+        must be passed commit=False so they don't end the transaction early.
+
+        Usage:
+            with db.transaction():
+                db.record_play(song_id, station_id, commit=False)
+        """
+        if self.conn.in_transaction:
+            self.conn.commit()
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self
+        except Exception:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+
+    @contextmanager
+    def savepoint(self, name='sp'):
+        """Make a block atomic inside transaction() without ending it
+
+        If the block raises, only its own writes are rolled back.
+
+        Args:
+            name: Savepoint name (must be a plain identifier)
+        """
+        self.conn.execute(f"SAVEPOINT {name}")
+        try:
+            yield self
+        except Exception:
+            self.conn.execute(f"ROLLBACK TO SAVEPOINT {name}")
+            self.conn.execute(f"RELEASE SAVEPOINT {name}")
+            raise
+        else:
+            self.conn.execute(f"RELEASE SAVEPOINT {name}")
+
     # ==================== STATION METHODS ====================
 
     def get_all_stations(self):
@@ -193,6 +242,14 @@ class RadioDatabase:
         finally:
             cursor.close()
 
+    def get_artist_mbids_by_names(self, names):
+        """Get {name: mbid} for artists with a real MBID, in one query"""
+        cursor = self.conn.cursor()
+        try:
+            return queries.get_artist_mbids_by_names(cursor, names)
+        finally:
+            cursor.close()
+
     def get_artist_by_mbid(self, mbid):
         """Get artist by MBID"""
         cursor = self.conn.cursor()
@@ -330,6 +387,14 @@ class RadioDatabase:
         finally:
             cursor.close()
 
+    def get_artist_import_stats(self, include_imported=True):
+        """Get {mbid: (total_plays, song_count, imported)} for all artists (auto-import thresholds)"""
+        cursor = self.conn.cursor()
+        try:
+            return queries.get_artist_import_stats(cursor, include_imported)
+        finally:
+            cursor.close()
+
     def get_artists_for_import(self, min_plays=5, station_id=None, sort='total_plays', direction='desc'):
         """Get artists that need Lidarr import
 
@@ -557,7 +622,7 @@ class RadioDatabase:
         finally:
             cursor.close()
 
-    def add_artist_and_song_if_new(self, artist_mbid, artist_name, song_title):
+    def add_artist_and_song_if_new(self, artist_mbid, artist_name, song_title, commit=True):
         """Add artist and song atomically - prevents orphaned artists
 
         This is the preferred method for adding new songs during scraping.
@@ -567,13 +632,14 @@ class RadioDatabase:
             artist_mbid: Artist's MusicBrainz ID (can be PENDING-xxx or valid MBID)
             artist_name: Artist name (will be normalized)
             song_title: Song title (will be normalized)
+            commit: Commit when done (pass False inside transaction())
 
         Returns:
             Tuple of (artist_added: bool, song_added: bool, song_id: int or None)
         """
         cursor = self.conn.cursor()
         try:
-            return crud.add_artist_and_song_if_new(cursor, self.conn, artist_mbid, artist_name, song_title)
+            return crud.add_artist_and_song_if_new(cursor, self.conn, artist_mbid, artist_name, song_title, commit)
         finally:
             cursor.close()
 
@@ -588,11 +654,19 @@ class RadioDatabase:
         finally:
             cursor.close()
 
-    def record_play(self, song_id, station_id, play_count=1):
+    def record_play(self, song_id, station_id, play_count=1, commit=True):
         """Record a play for a song on a station"""
         cursor = self.conn.cursor()
         try:
-            return crud.record_play(cursor, self.conn, song_id, station_id, play_count)
+            return crud.record_play(cursor, self.conn, song_id, station_id, play_count, commit)
+        finally:
+            cursor.close()
+
+    def record_plays(self, song_ids, station_id, play_count=1, commit=True):
+        """Record plays for many songs on one station (returns the recorded song IDs)"""
+        cursor = self.conn.cursor()
+        try:
+            return crud.record_plays(cursor, self.conn, song_ids, station_id, play_count, commit)
         finally:
             cursor.close()
 
@@ -947,9 +1021,11 @@ class RadioDatabase:
             RadioDatabase instance with a new connection
         """
         thread_local_db = RadioDatabase(self.db_path)
-        thread_local_db.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        thread_local_db.conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                              cached_statements=STATEMENT_CACHE_SIZE,
+                                              uri=is_uri(self.db_path), factory=RadioConnection)
         thread_local_db.cursor = thread_local_db.conn.cursor()
-        thread_local_db.cursor.execute("PRAGMA foreign_keys = ON")
+        apply_pragmas(thread_local_db.conn, self.db_path)
         return thread_local_db
 
 
@@ -26,6 +26,8 @@ import logging
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 
+from .queries import encode_page_cursor, decode_page_cursor
+
 logger = logging.getLogger(__name__)
 
 
@@ -76,23 +78,31 @@ def get_activity_paginated(
     limit: int = 50,
     event_type: Optional[str] = None,
     severity: Optional[str] = None,
-    days: Optional[int] = None
+    days: Optional[int] = None,
+    after: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """Get activity log entries with pagination and filtering
 
     Args:
         cursor: SQLite cursor object
-        page: Page number (1-indexed)
+        page: Page number (1-indexed, ignored when `after` is given)
         limit: Items per page
         event_type: Filter by event type (optional)
         severity: Filter by severity (optional)
         days: Only show entries from last N days (optional)
+        after: Cursor from activity_page_cursor() for the previous page's
+               last entry (keyset pagination, no OFFSET scan)
 
     Returns:
         List of activity log entries as dictionaries
+
+    Raises:
+        ValueError: If `after` is not a valid cursor
     """
+    keyset = decode_page_cursor(after) if after else None
+
     try:
-        offset = (page - 1) * limit
+        offset = 0 if keyset else (page - 1) * limit
 
         # Build query with filters
         where_clauses = []
@@ -111,6 +121,11 @@ def get_activity_paginated(
             where_clauses.append("timestamp >= ?")
             params.append(cutoff_date.isoformat())
 
+        if keyset:
+            # Start below the cursor row (seeks idx_activity_timestamp_id)
+            where_clauses.append("timestamp <= ? AND (timestamp, id) < (?, ?)")
+            params.extend([keyset[0], keyset[0], keyset[1]])
+
         where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
 
         query = f"""
@@ -118,7 +133,7 @@ def get_activity_paginated(
                    description, metadata, source
             FROM activity_log
             WHERE {where_sql}
-            ORDER BY timestamp DESC
+            ORDER BY timestamp DESC, id DESC
             LIMIT ? OFFSET ?
         """
 
@@ -149,6 +164,21 @@ def get_activity_paginated(
         return []
 
 
+def activity_page_cursor(activities: List[Dict[str, Any]], limit: int) -> Optional[str]:
+    """Build the cursor for the page after a get_activity_paginated() result
+
+    Args:
+        activities: Entries returned for the current page
+        limit: Page size that was requested
+
+    Returns:
+        Cursor string, or None if this was the last page
+    """
+    if len(activities) < limit:
+        return None
+    return encode_page_cursor(activities[-1]['timestamp'], activities[-1]['id'])
+
+
 def get_activity_stats(
     cursor,
     days: int = 7
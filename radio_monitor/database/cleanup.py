@@ -13,9 +13,24 @@ Scheduled cleanup runs daily via APScheduler to maintain database health.
 import logging
 from datetime import datetime, timedelta
 
+from .schema import rebuild_artists_fts
+
 logger = logging.getLogger(__name__)
 
 
+def _delete_artists(cursor, mbids):
+    """Delete artists by MBID, 500 per DELETE ... IN statement
+
+    Args:
+        cursor: Database cursor
+        mbids: List of artist MBIDs
+    """
+    for start in range(0, len(mbids), 500):
+        chunk = mbids[start:start + 500]
+        placeholders = ','.join('?' * len(chunk))
+        cursor.execute(f"DELETE FROM artists WHERE mbid IN ({placeholders})", chunk)
+
+
 def cleanup_corrupted_artists(cursor, conn, dry_run=False):
     """Remove artists with corrupted data that slipped through validation
 
@@ -48,8 +63,7 @@ def cleanup_corrupted_artists(cursor, conn, dry_run=False):
         logger.info(f"Found {len(null_mbid_artists)} artists with NULL mbid")
         if not dry_run:
             # Delete songs first (CASCADE should handle this, but let's be explicit)
-            for artist_mbid, artist_name in null_mbid_artists:
-                cursor.execute("DELETE FROM songs WHERE artist_mbid IS NULL")
+            cursor.execute("DELETE FROM songs WHERE artist_mbid IS NULL")
             cursor.execute("DELETE FROM artists WHERE mbid IS NULL")
             stats['null_mbid_deleted'] = cursor.rowcount
         else:
@@ -71,7 +85,7 @@ def cleanup_corrupted_artists(cursor, conn, dry_run=False):
         if not dry_run:
             for artist_mbid, artist_name in invalid_names:
                 logger.debug(f"Deleting artist with invalid name: {artist_name[:50]}...")
-                cursor.execute("DELETE FROM artists WHERE mbid = ?", (artist_mbid,))
+            _delete_artists(cursor, [artist_mbid for artist_mbid, _ in invalid_names])
             stats['invalid_names_deleted'] = len(invalid_names)
         else:
             stats['invalid_names_deleted'] = len(invalid_names)
@@ -92,7 +106,7 @@ def cleanup_corrupted_artists(cursor, conn, dry_run=False):
         if not dry_run:
             for artist_mbid, artist_name in orphaned_artists:
                 logger.debug(f"Deleting orphaned artist: {artist_name}")
-                cursor.execute("DELETE FROM artists WHERE mbid = ?", (artist_mbid,))
+            _delete_artists(cursor, [artist_mbid for artist_mbid, _ in orphaned_artists])
             stats['orphaned_artists_deleted'] = len(orphaned_artists)
         else:
             stats['orphaned_artists_deleted'] = len(orphaned_artists)
@@ -113,7 +127,7 @@ def cleanup_corrupted_artists(cursor, conn, dry_run=False):
         if not dry_run:
             for artist_mbid, artist_name in pending_no_songs:
                 logger.debug(f"Deleting PENDING artist with no songs: {artist_name}")
-                cursor.execute("DELETE FROM artists WHERE mbid = ?", (artist_mbid,))
+            _delete_artists(cursor, [artist_mbid for artist_mbid, _ in pending_no_songs])
             stats['pending_no_songs_deleted'] = len(pending_no_songs)
         else:
             stats['pending_no_songs_deleted'] = len(pending_no_songs)
@@ -196,6 +210,8 @@ def run_daily_cleanup(cursor, conn, dry_run=False):
     if not dry_run:
         logger.info("Vacuuming database to reclaim space...")
         cursor.execute("VACUUM")
+        rebuild_artists_fts(cursor)
+        conn.commit()
         logger.info("Database vacuum complete")
 
     logger.info("=" * 60)
@@ -241,51 +241,45 @@ def add_artist(cursor, conn, mbid, name, first_seen_station):
     """
     # Normalize name (consistent with database schema)
     normalized_name = normalize_artist_name(name)
+    now = datetime.now()
 
-    # Check if artist exists by MBID
-    cursor.execute("SELECT mbid, name FROM artists WHERE mbid = ?", (mbid,))
-    existing_by_mbid = cursor.fetchone()
+    # Artist already known by MBID (the common case): just update last_seen.
+    # Writing first and checking rowcount saves a SELECT per call.
+    cursor.execute("""
+        UPDATE artists
+        SET last_seen_at = ?
+        WHERE mbid = ?
+    """, (now, mbid))
 
-    if existing_by_mbid:
-        # Artist exists with this MBID - update last_seen
-        now = datetime.now()
-        cursor.execute("""
-            UPDATE artists
-            SET last_seen_at = ?
-            WHERE mbid = ?
-        """, (now, mbid))
+    if cursor.rowcount > 0:
         conn.commit()
         return False
 
-    # Check if artist exists by name (UNIQUE constraint on name)
-    cursor.execute("SELECT mbid, name FROM artists WHERE name = ?", (normalized_name,))
-    existing_by_name = cursor.fetchone()
-
-    if existing_by_name:
-        existing_id, existing_name = existing_by_name
-        # Artist with this name already exists but different MBID
-        # Keep the existing record (first one wins) to avoid UNIQUE constraint violation
-        logger.warning(f"Artist '{normalized_name}' already exists with MBID {existing_id}, "
-                      f"ignoring new MBID {mbid}")
-        # Update last_seen for the existing artist
-        now = datetime.now()
-        cursor.execute("""
-            UPDATE artists
-            SET last_seen_at = ?
-            WHERE mbid = ?
-        """, (now, existing_id))
-        conn.commit()
-        return False
-    else:
-        # Insert new artist
-        now = datetime.now()
-        cursor.execute("""
-            INSERT INTO artists (mbid, name, first_seen_station, first_seen_at, last_seen_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (mbid, normalized_name, first_seen_station, now, now))
+    # Insert new artist; skipped if the name (or, racing another writer, the
+    # MBID) is taken. Only uniqueness conflicts are ignored - NOT NULL/CHECK
+    # violations still raise, unlike INSERT OR IGNORE.
+    cursor.execute("""
+        INSERT INTO artists (mbid, name, first_seen_station, first_seen_at, last_seen_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT DO NOTHING
+    """, (mbid, normalized_name, first_seen_station, now, now))
+
+    if cursor.rowcount > 0:
         conn.commit()
         return True
 
+    # Artist with this name already exists but different MBID
+    # Keep the existing record (first one wins) and update its last_seen
+    logger.warning(f"Artist '{normalized_name}' already exists with another MBID, "
+                  f"ignoring new MBID {mbid}")
+    cursor.execute("""
+        UPDATE artists
+        SET last_seen_at = ?
+        WHERE name = ?
+    """, (now, normalized_name))
+    conn.commit()
+    return False
+
 def update_artist_last_seen(cursor, conn, mbid):
     """Update artist's last_seen_at timestamp
 
@@ -314,15 +308,16 @@ def mark_artists_imported_to_lidarr(cursor, conn, mbids):
         Number of artists marked
     """
     try:
-        marked = 0
-        for mbid in mbids:
-            cursor.execute("""
-                UPDATE artists
-                SET lidarr_imported_at = ?
-                WHERE mbid = ?
-            """, (datetime.now(), mbid))
-            if cursor.rowcount > 0:
-                marked += 1
+        if not mbids:
+            return 0
+
+        now = datetime.now()
+        cursor.executemany("""
+            UPDATE artists
+            SET lidarr_imported_at = ?
+            WHERE mbid = ?
+        """, [(now, mbid) for mbid in mbids])
+        marked = cursor.rowcount
 
         conn.commit()
         return marked
@@ -1380,6 +1375,26 @@ def get_manual_mbid_override(cursor, artist_name):
     result = cursor.fetchone()
     return result[0] if result else None
 
+def get_manual_mbid_override_map(cursor):
+    """Load every manual MBID override for in-memory lookups
+
+    The overrides table is small (one row per user correction), so the
+    scraper loads it once per run instead of querying per artist.
+
+    Args:
+        cursor: Database cursor
+
+    Returns:
+        dict: {artist_name_normalized: mbid} - look up with
+        normalize_artist_name(name).lower(), same as get_manual_mbid_override()
+    """
+    cursor.execute("""
+        SELECT artist_name_normalized, mbid
+        FROM manual_mbid_overrides
+    """)
+
+    return dict(cursor.fetchall())
+
 def get_all_manual_mbid_overrides(cursor, limit=None, offset=None):
     """Get all manual MBID overrides with pagination
 
@@ -1403,12 +1418,17 @@ def get_all_manual_mbid_overrides(cursor, limit=None, offset=None):
         ORDER BY artist_name_original COLLATE NOCASE
     """
 
+    params = []
     if limit:
-        query += f" LIMIT {limit}"
+        query += " LIMIT ?"
+        params.append(limit)
     if offset:
-        query += f" OFFSET {offset}"
+        if not limit:
+            query += " LIMIT -1"
+        query += " OFFSET ?"
+        params.append(offset)
 
-    cursor.execute(query)
+    cursor.execute(query, params)
 
     results = []
     for row in cursor.fetchall():
@@ -1522,7 +1542,7 @@ def add_artist_if_new(cursor, conn, mbid, name):
         conn.rollback()
         raise
 
-def add_artist_and_song_if_new(cursor, conn, artist_mbid, artist_name, song_title):
+def add_artist_and_song_if_new(cursor, conn, artist_mbid, artist_name, song_title, commit=True):
     """Add artist and song to database atomically - prevents orphaned artists
 
     This function ensures that if the song creation fails, the artist is also rolled back.
@@ -1546,6 +1566,8 @@ def add_artist_and_song_if_new(cursor, conn, artist_mbid, artist_name, song_titl
         artist_mbid: Artist's MusicBrainz ID (can be PENDING-xxx or valid MBID)
         artist_name: Artist name (will be normalized)
         song_title: Song title (will be normalized)
+        commit: Commit when done (False when the caller owns the transaction,
+            e.g. RadioDatabase.transaction() during scraping)
 
     Returns:
         Tuple of (artist_added: bool, song_added: bool, song_id: int or None)
@@ -1679,7 +1701,8 @@ def add_artist_and_song_if_new(cursor, conn, artist_mbid, artist_name, song_titl
         existing_song = cursor.fetchone()
         if existing_song:
             # Song already exists - commit any artist changes and return
-            conn.commit()
+            if commit:
+                conn.commit()
             return (artist_added, False, existing_song[0])
 
         # Add new song
@@ -1691,14 +1714,16 @@ def add_artist_and_song_if_new(cursor, conn, artist_mbid, artist_name, song_titl
         song_id = cursor.lastrowid
 
         # Commit both artist and song together
-        conn.commit()
+        if commit:
+            conn.commit()
 
         return (artist_added, True, song_id)
 
     except Exception as e:
         # Roll back both artist and song on any error
         logger.error(f"Error adding artist '{artist_name}' and song '{song_title}': {e}")
-        conn.rollback()
+        if commit:
+            conn.rollback()
         raise
 
 
@@ -1764,7 +1789,7 @@ def add_song_if_new(cursor, conn, artist_mbid, song_title):
         conn.rollback()
         raise
 
-def record_play(cursor, conn, song_id, station_id, play_count=1):
+def record_play(cursor, conn, song_id, station_id, play_count=1, commit=True):
     """Record a play for a song on a station
 
     Args:
@@ -1773,6 +1798,7 @@ def record_play(cursor, conn, song_id, station_id, play_count=1):
         song_id: Song ID from songs table
         station_id: Station ID from stations table
         play_count: Number of plays to record (default: 1)
+        commit: Commit when done (False when the caller owns the transaction)
 
     Returns:
         True if successful, False if skipped (duplicate)
@@ -1814,36 +1840,22 @@ def record_play(cursor, conn, song_id, station_id, play_count=1):
                 # If play was recorded recently (within time window), skip
                 # Use <= to catch exact hourly scraping (60 min) plus buffer (5 min = 65 min)
                 if time_diff_min <= duplicate_window_min:
-                    logger.debug(f"Skipping duplicate play: song_id={song_id}, station_id={station_id}, "
-                               f"time_diff={time_diff_min}min <= window={duplicate_window_min}min")
+                    logger.debug("Skipping duplicate play: song_id=%s, station_id=%s, time_diff=%smin <= window=%smin",
+                                 song_id, station_id, time_diff_min, duplicate_window_min)
                     duplicate_found = True
                     break  # Found duplicate, stop checking
 
         if duplicate_found:
             return False  # Skip recording
 
-        # Step 2: Check if there's already a record in the current hour (to update vs insert)
+        # Step 2: Insert the current hour's record, or add to it if it already exists (UPSERT)
         cursor.execute("""
-            SELECT play_count
-            FROM song_plays_daily
-            WHERE song_id = ? AND station_id = ? AND date = ? AND hour = ?
-        """, (song_id, station_id, today, current_hour))
-
-        current_hour_record = cursor.fetchone()
-
-        if current_hour_record:
-            # Update existing record in current hour
-            cursor.execute("""
-                UPDATE song_plays_daily
-                SET play_count = play_count + ?, minute = ?
-                WHERE song_id = ? AND station_id = ? AND date = ? AND hour = ?
-            """, (play_count, current_minute, song_id, station_id, today, current_hour))
-        else:
-            # Create new record
-            cursor.execute("""
-                INSERT INTO song_plays_daily (song_id, station_id, date, hour, minute, play_count)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (song_id, station_id, today, current_hour, current_minute, play_count))
+            INSERT INTO song_plays_daily (song_id, station_id, date, hour, minute, play_count)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(date, hour, song_id, station_id) DO UPDATE SET
+                play_count = play_count + excluded.play_count,
+                minute = excluded.minute
+        """, (song_id, station_id, today, current_hour, current_minute, play_count))
 
         # Also update song's total play count and last_seen_at
         cursor.execute("""
@@ -1860,14 +1872,113 @@ def record_play(cursor, conn, song_id, station_id, play_count=1):
             WHERE mbid = (SELECT artist_mbid FROM songs WHERE id = ?)
         """, (now, song_id))
 
-        conn.commit()
+        if commit:
+            conn.commit()
         return True
 
     except Exception as e:
         logger.error(f"Error recording play for song_id {song_id}: {e}")
-        conn.rollback()
+        if commit:
+            conn.rollback()
+        raise
+
+def record_plays(cursor, conn, song_ids, station_id, play_count=1, commit=True):
+    """Record plays for many songs on one station in a few batched statements
+
+    Applies the same duplicate detection as record_play(), including songs
+    repeated within the batch, then writes all plays with executemany.
+
+    Args:
+        cursor: SQLite cursor object
+        conn: SQLite connection object
+        song_ids: Song IDs in the order they were played
+        station_id: Station ID from stations table
+        play_count: Number of plays to record per song (default: 1)
+        commit: Commit when done (False when the caller owns the transaction)
+
+    Returns:
+        list: Song IDs whose play was recorded (duplicates are left out)
+    """
+    try:
+        from datetime import datetime
+        from radio_monitor.gui import load_settings
+
+        # Get settings for duplicate detection window
+        settings = load_settings() or {}
+        duplicate_window_min = settings.get('duplicate_detection_window_minutes', 20)
+
+        # CRITICAL: Single timestamp for the whole batch to avoid midnight rollover bugs
+        now = datetime.now()
+        today = now.date().isoformat()
+        current_hour = now.hour
+        current_minute = now.minute
+        current_total_min = current_hour * 60 + current_minute
+
+        # Step 1: Load recent plays (previous, current and next hour) for every song at once
+        unique_ids = list(dict.fromkeys(song_ids))
+        recent_minutes = {}
+        for start in range(0, len(unique_ids), 500):
+            chunk = unique_ids[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(f"""
+                SELECT song_id, hour, minute
+                FROM song_plays_daily
+                WHERE station_id = ? AND date = ?
+                AND hour IN (?, ?, ?)
+                AND song_id IN ({placeholders})
+            """, (station_id, today, current_hour - 1, current_hour, current_hour + 1, *chunk))
+
+            for song_id, existing_hour, existing_minute in cursor.fetchall():
+                if existing_minute is not None:
+                    recent_minutes.setdefault(song_id, []).append(existing_hour * 60 + existing_minute)
+
+        # Step 2: Duplicate detection in memory (a song repeated in the batch is a duplicate too)
+        recorded = []
+        for song_id in song_ids:
+            if any(abs(current_total_min - existing_total_min) <= duplicate_window_min
+                   for existing_total_min in recent_minutes.get(song_id, ())):
+                logger.debug("Skipping duplicate play: song_id=%s, station_id=%s", song_id, station_id)
+                continue
+
+            recorded.append(song_id)
+            recent_minutes.setdefault(song_id, []).append(current_total_min)
+
+        if not recorded:
+            return recorded
+
+        # Step 3: Write plays, song totals and artist last_seen_at in batches
+        cursor.executemany("""
+            INSERT INTO song_plays_daily (song_id, station_id, date, hour, minute, play_count)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(date, hour, song_id, station_id) DO UPDATE SET
+                play_count = play_count + excluded.play_count,
+                minute = excluded.minute
+        """, [(song_id, station_id, today, current_hour, current_minute, play_count) for song_id in recorded])
+
+        cursor.executemany("""
+            UPDATE songs
+            SET play_count = play_count + ?,
+                last_seen_at = ?
+            WHERE id = ?
+        """, [(play_count, now, song_id) for song_id in recorded])
+
+        cursor.executemany("""
+            UPDATE artists
+            SET last_seen_at = ?
+            WHERE mbid = (SELECT artist_mbid FROM songs WHERE id = ?)
+        """, [(now, song_id) for song_id in dict.fromkeys(recorded)])
+
+        if commit:
+            conn.commit()
+        return recorded
+
+    except Exception as e:
+        logger.error(f"Error recording plays for station {station_id}: {e}")
+        if commit:
+            conn.rollback()
         raise
 
+
 def delete_pending_artists_older_than(cursor, conn, days=30):
     """Delete PENDING artists older than specified days
 
@@ -1883,24 +1994,34 @@ def delete_pending_artists_older_than(cursor, conn, days=30):
         Number of artists deleted
     """
     try:
-        # Delete PENDING artists older than specified days
         cursor.execute("""
-            DELETE FROM artists
+            SELECT mbid FROM artists
             WHERE mbid LIKE 'PENDING-%'
               AND first_seen_at < datetime('now', '-' || ? || ' days')
         """, (days,))
-
-        artists_deleted = cursor.rowcount
-        logger.info(f"Deleted {artists_deleted} PENDING artists older than {days} days")
-
-        # Delete orphaned songs (songs whose PENDING artist was deleted)
+        mbids = [row[0] for row in cursor.fetchall()]
+
+        # Delete by MBID, 500 per statement: songs first (they reference the
+        # artist), each an index seek rather than a LIKE scan plus anti-join
+        songs_deleted = 0
+        artists_deleted = 0
+        for start in range(0, len(mbids), 500):
+            chunk = mbids[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(f"DELETE FROM songs WHERE artist_mbid IN ({placeholders})", chunk)
+            songs_deleted += cursor.rowcount
+            cursor.execute(f"DELETE FROM artists WHERE mbid IN ({placeholders})", chunk)
+            artists_deleted += cursor.rowcount
+
+        # Also sweep PENDING songs already orphaned by earlier deletions
         cursor.execute("""
             DELETE FROM songs
             WHERE artist_mbid LIKE 'PENDING-%'
               AND artist_mbid NOT IN (SELECT mbid FROM artists)
         """)
+        songs_deleted += cursor.rowcount
 
-        songs_deleted = cursor.rowcount
+        logger.info(f"Deleted {artists_deleted} PENDING artists older than {days} days")
         logger.info(f"Deleted {songs_deleted} orphaned songs from deleted PENDING artists")
 
         conn.commit()
@@ -2219,13 +2340,14 @@ def remove_song_from_builder_state(cursor, conn, session_id, song_id):
         conn.rollback()
         raise
 
-def clear_builder_state(cursor, conn, session_id):
+def clear_builder_state(cursor, conn, session_id, commit=True):
     """Clear all songs from the playlist builder state for a session
 
     Args:
         cursor: SQLite cursor object
         conn: SQLite connection object
         session_id: Flask session ID
+        commit: Commit when done (pass False to commit with later writes)
 
     Returns:
         Number of songs removed
@@ -2237,7 +2359,8 @@ def clear_builder_state(cursor, conn, session_id):
         """, (session_id,))
 
         count = cursor.rowcount
-        conn.commit()
+        if commit:
+            conn.commit()
         logger.info(f"Cleared {count} songs from builder state for session {session_id}")
         return count
 
@@ -2259,21 +2382,38 @@ def add_songs_to_builder_state_batch(cursor, session_id, song_ids):
 
     Note:
         This function does NOT commit. Caller must commit after calling.
+        Song IDs that don't exist are skipped.
     """
+    if not song_ids:
+        return 0
+
     now = datetime.now()
     added_count = 0
 
+    valid_ids = []
     for song_id in song_ids:
         try:
-            cursor.execute("""
-                INSERT OR IGNORE INTO playlist_builder_state (session_id, song_id, created_at, updated_at)
-                VALUES (?, ?, ?, ?)
-            """, (session_id, song_id, now, now))
+            valid_ids.append(int(song_id))
+        except (TypeError, ValueError):
+            logger.warning(f"Error adding song {song_id!r} to builder state: invalid song ID")
+
+    # One statement per 500 songs; selecting from songs skips unknown IDs
+    # instead of failing the whole batch on the foreign key
+    for start in range(0, len(valid_ids), 500):
+        chunk = valid_ids[start:start + 500]
+        placeholders = ','.join('?' * len(chunk))
+        cursor.execute(f"""
+            INSERT OR IGNORE INTO playlist_builder_state (session_id, song_id, created_at, updated_at)
+            SELECT ?, id, ?, ? FROM songs WHERE id IN ({placeholders})
+        """, [session_id, now, now] + chunk)
+        added_count += cursor.rowcount
 
-            if cursor.rowcount > 0:
-                added_count += 1
-        except Exception as e:
-            logger.warning(f"Error adding song {song_id} to builder state: {e}")
+        # Fewer rows than IDs: some were already selected, or don't exist
+        if cursor.rowcount < len(chunk):
+            cursor.execute(f"SELECT id FROM songs WHERE id IN ({placeholders})", chunk)
+            missing = set(chunk).difference(row[0] for row in cursor.fetchall())
+            if missing:
+                logger.warning(f"Skipped {len(missing)} unknown song IDs adding to builder state: {sorted(missing)[:20]}")
 
     return added_count
 
@@ -2291,18 +2431,19 @@ def remove_songs_from_builder_state_batch(cursor, session_id, song_ids):
     Note:
         This function does NOT commit. Caller must commit after calling.
     """
-    if not song_ids:
-        return 0
-
-    # Build placeholders for IN clause
-    placeholders = ','.join(['?' for _ in song_ids])
+    removed_count = 0
 
-    cursor.execute(f"""
-        DELETE FROM playlist_builder_state
-        WHERE session_id = ? AND song_id IN ({placeholders})
-    """, [session_id] + song_ids)
+    # One DELETE ... IN per 500 songs (stays under SQLite's bound parameter limit)
+    for start in range(0, len(song_ids), 500):
+        chunk = song_ids[start:start + 500]
+        placeholders = ','.join('?' * len(chunk))
+        cursor.execute(f"""
+            DELETE FROM playlist_builder_state
+            WHERE session_id = ? AND song_id IN ({placeholders})
+        """, [session_id] + list(chunk))
+        removed_count += cursor.rowcount
 
-    return cursor.rowcount
+    return removed_count
 
 
 # ==================== BLOCKLIST CRUD (v14) ====================
@@ -153,6 +153,26 @@ def _initialize_schema(cursor, conn, db_path, SCHEMA_VERSION):
             if current_version < 21:
                 _migrate_to_v21(cursor, conn)
 
+            # Migrate to version 22 (add keyset pagination indexes)
+            if current_version < 22:
+                _migrate_to_v22(cursor, conn)
+
+            # Migrate to version 23 (add indexed artists.mbid_status column)
+            if current_version < 23:
+                _migrate_to_v23(cursor, conn)
+
+            # Migrate to version 24 (add artists_fts search index)
+            if current_version < 24:
+                _migrate_to_v24(cursor, conn)
+
+            # Migrate to version 25 (keyset pagination indexes for activity/history)
+            if current_version < 25:
+                _migrate_to_v25(cursor, conn)
+
+            # Migrate to version 26 (keyset pagination indexes for Plex failures)
+            if current_version < 26:
+                _migrate_to_v26(cursor, conn)
+
 
 def _create_new_schema(cursor, conn, SCHEMA_VERSION):
     """Create new schema (6 tables: stations, artists, songs, song_plays_daily, schema_version, playlists)
@@ -1471,3 +1491,173 @@ def _migrate_to_v21(cursor, conn):
 
     conn.commit()
     print("Migration to version 21 complete!")
+
+
+def _migrate_to_v22(cursor, conn):
+    """Migrate database from v21 to v22 (add keyset pagination indexes)
+
+    The artists and songs lists page by name/title (case-insensitive) with a
+    unique tie-breaker. These indexes match that ordering so each page is an
+    index range scan instead of an OFFSET scan over all earlier rows.
+    """
+    print("Migrating from schema v21 to v22...")
+    print("  - Adding keyset pagination indexes...")
+
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_artists_name_nocase ON artists(name COLLATE NOCASE, mbid)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_songs_title_nocase ON songs(song_title COLLATE NOCASE, id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_songs_artist_name_nocase ON songs(artist_name COLLATE NOCASE, id)")
+
+    # Update schema version
+    cursor.execute("""
+        INSERT INTO schema_version (version, description)
+        VALUES (22, 'Add keyset pagination indexes for artists and songs')
+    """)
+
+    # Log migration completion
+    cursor.execute("""
+        INSERT INTO activity_log (event_type, title, description, event_severity, source)
+        VALUES ('system', 'success', 'Database Migration', 'Migrated from schema v21 to v22: added keyset pagination indexes', 'system')
+    """)
+
+    conn.commit()
+    print("Migration to version 22 complete!")
+
+
+def _migrate_to_v23(cursor, conn):
+    """Migrate database from v22 to v23 (add indexed artists.mbid_status column)
+
+    mbid_status is a virtual generated column ('none', 'pending' or 'valid')
+    derived from mbid, so the artists list can filter by MBID status with an
+    index lookup instead of a LIKE scan over every artist.
+    """
+    print("Migrating from schema v22 to v23...")
+    print("  - Adding mbid_status column to artists...")
+
+    cursor.execute("PRAGMA table_xinfo(artists)")
+    column_names = [col[1] for col in cursor.fetchall()]
+
+    if 'mbid_status' not in column_names:
+        cursor.execute("""
+            ALTER TABLE artists ADD COLUMN mbid_status TEXT GENERATED ALWAYS AS (
+                CASE WHEN mbid IS NULL THEN 'none'
+                     WHEN mbid LIKE 'PENDING-%' THEN 'pending'
+                     ELSE 'valid' END
+            ) VIRTUAL
+        """)
+    else:
+        print("  - mbid_status column already exists (fresh database)")
+
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_artists_mbid_status ON artists(mbid_status, first_seen_station)")
+
+    # Update schema version
+    cursor.execute("""
+        INSERT INTO schema_version (version, description)
+        VALUES (23, 'Add indexed mbid_status generated column to artists')
+    """)
+
+    # Log migration completion
+    cursor.execute("""
+        INSERT INTO activity_log (event_type, title, description, event_severity, source)
+        VALUES ('system', 'success', 'Database Migration', 'Migrated from schema v22 to v23: added indexed mbid_status column to artists', 'system')
+    """)
+
+    conn.commit()
+    print("Migration to version 23 complete!")
+
+
+def _migrate_to_v24(cursor, conn):
+    """Migrate database from v23 to v24 (add artists_fts search index)
+
+    artists_fts is a trigram FTS5 index over artist names, kept in sync by
+    triggers, so the artists list search (name LIKE '%term%') no longer
+    scans every artist.
+    """
+    print("Migrating from schema v23 to v24...")
+    print("  - Adding artists_fts search index...")
+
+    from radio_monitor.database.schema import create_artists_fts, rebuild_artists_fts
+
+    if create_artists_fts(cursor):
+        # Index the existing artists
+        rebuild_artists_fts(cursor)
+    else:
+        print("  - FTS5 trigram not supported by this SQLite build, artist search will scan")
+
+    # Update schema version
+    cursor.execute("""
+        INSERT INTO schema_version (version, description)
+        VALUES (24, 'Add artists_fts trigram search index')
+    """)
+
+    # Log migration completion
+    cursor.execute("""
+        INSERT INTO activity_log (event_type, title, description, event_severity, source)
+        VALUES ('system', 'success', 'Database Migration', 'Migrated from schema v23 to v24: added artists_fts search index', 'system')
+    """)
+
+    conn.commit()
+    print("Migration to version 24 complete!")
+
+
+def _migrate_to_v25(cursor, conn):
+    """Migrate database from v24 to v25 (keyset pagination indexes for activity/history)
+
+    The activity log and notification history page newest-first by
+    (timestamp, id). The old timestamp DESC indexes store rowids ascending
+    within a timestamp, so SQLite needed a temp B-tree for the id tiebreak;
+    ascending (timestamp, id) indexes serve the order with a reverse scan.
+    """
+    print("Migrating from schema v24 to v25...")
+    print("  - Replacing activity_log/notification_history timestamp indexes...")
+
+    cursor.execute("DROP INDEX IF EXISTS idx_activity_timestamp")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_activity_timestamp_id ON activity_log(timestamp, id)")
+    cursor.execute("DROP INDEX IF EXISTS idx_history_sent_at")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_sent_at_id ON notification_history(sent_at, id)")
+
+    # Update schema version
+    cursor.execute("""
+        INSERT INTO schema_version (version, description)
+        VALUES (25, 'Add keyset pagination indexes for activity log and notification history')
+    """)
+
+    # Log migration completion
+    cursor.execute("""
+        INSERT INTO activity_log (event_type, title, description, event_severity, source)
+        VALUES ('system', 'success', 'Database Migration', 'Migrated from schema v24 to v25: added activity/history keyset indexes', 'system')
+    """)
+
+    conn.commit()
+    print("Migration to version 25 complete!")
+
+
+def _migrate_to_v26(cursor, conn):
+    """Migrate database from v25 to v26 (keyset pagination indexes for Plex failures)
+
+    The Plex failures list pages by (failure_date, id). Like the v25 indexes,
+    an ascending (failure_date, id) index serves both sort directions without
+    a temp B-tree for the id tiebreak; (resolved, failure_date, id) does the
+    same for the resolved/unresolved filter and still serves resolved lookups.
+    """
+    print("Migrating from schema v25 to v26...")
+    print("  - Replacing plex_match_failures failure_date/resolved indexes...")
+
+    cursor.execute("DROP INDEX IF EXISTS idx_failures_date")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_failures_date_id ON plex_match_failures(failure_date, id)")
+    cursor.execute("DROP INDEX IF EXISTS idx_failures_resolved")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_failures_resolved_date_id ON plex_match_failures(resolved, failure_date, id)")
+
+    # Update schema version
+    cursor.execute("""
+        INSERT INTO schema_version (version, description)
+        VALUES (26, 'Add keyset pagination indexes for Plex failures')
+    """)
+
+    # Log migration completion
+    cursor.execute("""
+        INSERT INTO activity_log (event_type, title, description, event_severity, source)
+        VALUES ('system', 'success', 'Database Migration', 'Migrated from schema v25 to v26: added Plex failures keyset indexes', 'system')
+    """)
+
+    conn.commit()
+    print("Migration to version 26 complete!")
@@ -18,6 +18,8 @@ import logging
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
+from .queries import encode_page_cursor, decode_page_cursor
+
 logger = logging.getLogger(__name__)
 
 
@@ -139,32 +141,32 @@ def get_notifications_for_event(cursor, event_type: str) -> List[Dict[str, Any]]
     Returns:
         List of matching notification configurations
     """
+    # Match the trigger in SQL so only matching rows are fetched and decoded
     cursor.execute("""
         SELECT id, notification_type, name, enabled, config, triggers,
                created_at, last_triggered, failure_count
         FROM notifications
         WHERE enabled = 1
+          AND EXISTS (SELECT 1 FROM json_each(notifications.triggers) WHERE value = ?)
         ORDER BY created_at DESC
-    """)
+    """, (event_type,))
 
     notifications = []
     for row in cursor.fetchall():
         (notif_id, notification_type, name, enabled, config_json,
          triggers_json, created_at, last_triggered, failure_count) = row
 
-        triggers = json.loads(triggers_json)
-        if event_type in triggers:
-            notifications.append({
-                'id': notif_id,
-                'notification_type': notification_type,
-                'name': name,
-                'enabled': bool(enabled),
-                'config': json.loads(config_json),
-                'triggers': triggers,
-                'created_at': created_at,
-                'last_triggered': last_triggered,
-                'failure_count': failure_count
-            })
+        notifications.append({
+            'id': notif_id,
+            'notification_type': notification_type,
+            'name': name,
+            'enabled': bool(enabled),
+            'config': json.loads(config_json),
+            'triggers': json.loads(triggers_json),
+            'created_at': created_at,
+            'last_triggered': last_triggered,
+            'failure_count': failure_count
+        })
 
     return notifications
 
@@ -312,20 +314,46 @@ def log_notification_send(cursor, notification_id: int, event_type: str,
     return cursor.lastrowid
 
 
+def log_notification_sends(cursor, entries) -> int:
+    """Log several notification send attempts to history in one statement
+
+    Args:
+        cursor: SQLite cursor object
+        entries: Iterable of (notification_id, event_type, severity, title,
+                 message, success, error_message) tuples
+
+    Returns:
+        int: Number of history records inserted
+    """
+    cursor.executemany("""
+        INSERT INTO notification_history
+        (notification_id, event_type, event_severity, title, message, success, error_message)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, entries)
+
+    return cursor.rowcount
+
+
 def get_notification_history(cursor, notification_id: Optional[int] = None,
                              limit: int = 100, offset: int = 0,
-                             success_only: Optional[bool] = None) -> List[Dict[str, Any]]:
+                             success_only: Optional[bool] = None,
+                             after: Optional[str] = None) -> List[Dict[str, Any]]:
     """Get notification send history
 
     Args:
         cursor: SQLite cursor object
         notification_id: Filter by notification ID (None = all)
         limit: Maximum records to return
-        offset: Number of records to skip
+        offset: Number of records to skip (ignored when `after` is given)
         success_only: Filter by success status (None = all)
+        after: Cursor from history_page_cursor() for the previous page's
+               last record (keyset pagination, no OFFSET scan)
 
     Returns:
         List of history records
+
+    Raises:
+        ValueError: If `after` is not a valid cursor
     """
     query = """
         SELECT
@@ -346,7 +374,14 @@ def get_notification_history(cursor, notification_id: Optional[int] = None,
         query += " AND h.success = ?"
         params.append(1 if success_only else 0)
 
-    query += " ORDER BY h.sent_at DESC LIMIT ? OFFSET ?"
+    if after:
+        # Start below the cursor row (seeks idx_history_sent_at_id)
+        sent_at, history_id = decode_page_cursor(after)
+        query += " AND h.sent_at <= ? AND (h.sent_at, h.id) < (?, ?)"
+        params.extend([sent_at, sent_at, history_id])
+        offset = 0
+
+    query += " ORDER BY h.sent_at DESC, h.id DESC LIMIT ? OFFSET ?"
     params.extend([limit, offset])
 
     cursor.execute(query, params)
@@ -373,6 +408,21 @@ def get_notification_history(cursor, notification_id: Optional[int] = None,
     return history
 
 
+def history_page_cursor(history: List[Dict[str, Any]], limit: int) -> Optional[str]:
+    """Build the cursor for the page after a get_notification_history() result
+
+    Args:
+        history: Records returned for the current page
+        limit: Page size that was requested
+
+    Returns:
+        Cursor string, or None if this was the last page
+    """
+    if len(history) < limit:
+        return None
+    return encode_page_cursor(history[-1]['sent_at'], history[-1]['id'])
+
+
 def get_notification_stats(cursor, notification_id: int) -> Dict[str, Any]:
     """Get statistics for a specific notification
 
@@ -13,13 +13,29 @@ Failure Types:
 - plex_error: Plex API/connection error
 """
 
+import csv
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from io import StringIO
+from typing import List, Dict, Any, Optional, Tuple, Iterator
+
+from .queries import encode_page_cursor, decode_page_cursor
 
 logger = logging.getLogger(__name__)
 
+# Column headers for CSV exports
+CSV_HEADER = [
+    'Failure ID', 'Artist', 'Song Title', 'Failure Date',
+    'Failure Reason', 'Search Attempts', 'Search Terms',
+    'Resolved', 'Resolved At', 'Playlist'
+]
+
+
+def _encode_search_terms(search_terms: Optional[Dict[str, str]]) -> Optional[str]:
+    """Encode search terms as compact JSON (no whitespace) for storage"""
+    return json.dumps(search_terms, separators=(',', ':')) if search_terms else None
+
 
 def log_plex_failure(cursor, song_id: int, playlist_id: Optional[int],
                      failure_reason: str, search_attempts: int = 1,
@@ -37,7 +53,7 @@ def log_plex_failure(cursor, song_id: int, playlist_id: Optional[int],
     Returns:
         int: ID of the inserted failure record
     """
-    search_terms_json = json.dumps(search_terms) if search_terms else None
+    search_terms_json = _encode_search_terms(search_terms)
 
     cursor.execute("""
         INSERT INTO plex_match_failures
@@ -50,25 +66,65 @@ def log_plex_failure(cursor, song_id: int, playlist_id: Optional[int],
     return failure_id
 
 
+def log_plex_failures(cursor, failures: List[Dict[str, Any]]) -> int:
+    """Log several Plex matching failures in one statement
+
+    Args:
+        cursor: SQLite cursor object
+        failures: List of dicts with the log_plex_failure() arguments (song_id
+                  and failure_reason required; playlist_id, search_attempts
+                  and search_terms optional)
+
+    Returns:
+        int: Number of failure records inserted
+    """
+    rows = [(
+        failure['song_id'],
+        failure.get('playlist_id'),
+        failure['failure_reason'],
+        failure.get('search_attempts', 1),
+        _encode_search_terms(failure.get('search_terms'))
+    ) for failure in failures]
+
+    cursor.executemany("""
+        INSERT INTO plex_match_failures
+        (song_id, playlist_id, failure_reason, search_attempts, search_terms_used)
+        VALUES (?, ?, ?, ?, ?)
+    """, rows)
+
+    logger.debug(f"Logged {len(rows)} Plex failures")
+    return len(rows)
+
+
 def get_failures(cursor, limit: int = 100, offset: int = 0,
                  resolved: Optional[bool] = None,
                  failure_reason: Optional[str] = None,
                  sort: str = 'failure_date',
-                 direction: str = 'desc') -> List[Dict[str, Any]]:
+                 direction: str = 'desc',
+                 after: Optional[str] = None) -> List[Dict[str, Any]]:
     """Get Plex match failures with pagination and filtering
 
     Args:
         cursor: SQLite cursor object
         limit: Maximum number of failures to return
-        offset: Number of failures to skip
+        offset: Number of failures to skip (ignored when `after` is given)
         resolved: Filter by resolved status (None = all)
         failure_reason: Filter by failure reason (None = all)
         sort: Sort column (failure_date, song_title, artist_name, failure_reason, search_attempts)
         direction: Sort direction (asc or desc)
+        after: Cursor from failure_page_cursor() for the previous page's last
+               failure (keyset pagination, failure_date sort only)
 
     Returns:
         List of failure records with song details
+
+    Raises:
+        ValueError: If `after` is not a valid cursor or sort isn't failure_date
     """
+    if after and sort != 'failure_date':
+        raise ValueError("Cursor pagination is only supported when sorting by failure_date")
+    keyset = decode_page_cursor(after) if after else None
+
     query = """
         SELECT
             f.id, f.song_id, f.playlist_id, f.failure_date,
@@ -91,6 +147,15 @@ def get_failures(cursor, limit: int = 100, offset: int = 0,
         query += " AND f.failure_reason = ?"
         params.append(failure_reason)
 
+    if keyset:
+        # Start past the cursor row (seeks idx_failures_date_id / idx_failures_resolved_date_id)
+        if direction == 'asc':
+            query += " AND f.failure_date >= ? AND (f.failure_date, f.id) > (?, ?)"
+        else:
+            query += " AND f.failure_date <= ? AND (f.failure_date, f.id) < (?, ?)"
+        params.extend([keyset[0], keyset[0], keyset[1]])
+        offset = 0
+
     # Build ORDER BY clause dynamically based on sort and direction
     # Map sort parameter to database column
     sort_column_mapping = {
@@ -108,6 +173,9 @@ def get_failures(cursor, limit: int = 100, offset: int = 0,
     # Use COLLATE NOCASE for case-insensitive text sorting
     if sort in ['song_title', 'artist_name', 'failure_reason']:
         order_by = f"{sort_column} COLLATE NOCASE {direction.upper()}"
+    elif sort_column == 'f.failure_date':
+        # Tie-break on id so pages have a stable order
+        order_by = f"f.failure_date {direction.upper()}, f.id {direction.upper()}"
     else:
         order_by = f"{sort_column} {direction.upper()}"
 
@@ -148,14 +216,31 @@ def get_failures(cursor, limit: int = 100, offset: int = 0,
     return failures
 
 
+def failure_page_cursor(failures: List[Dict[str, Any]], limit: int) -> Optional[str]:
+    """Build the cursor for the page after a get_failures() result
+
+    Args:
+        failures: Failures returned for the current page
+        limit: Page size that was requested
+
+    Returns:
+        Cursor string, or None if this was the last page
+    """
+    if len(failures) < limit:
+        return None
+    return encode_page_cursor(failures[-1]['failure_date'], failures[-1]['id'])
+
+
 def get_failure_count(cursor, resolved: Optional[bool] = None,
-                      failure_reason: Optional[str] = None) -> int:
+                      failure_reason: Optional[str] = None,
+                      days: Optional[int] = None) -> int:
     """Get total count of Plex match failures
 
     Args:
         cursor: SQLite cursor object
         resolved: Filter by resolved status (None = all)
         failure_reason: Filter by failure reason (None = all)
+        days: Only count failures from the last N days (None = all)
 
     Returns:
         int: Total count of matching failures
@@ -163,6 +248,10 @@ def get_failure_count(cursor, resolved: Optional[bool] = None,
     query = "SELECT COUNT(*) FROM plex_match_failures WHERE 1=1"
     params = []
 
+    if days is not None:
+        query += " AND failure_date >= ?"
+        params.append(datetime.now() - timedelta(days=days))
+
     if resolved is not None:
         query += " AND resolved = ?"
         params.append(1 if resolved else 0)
@@ -304,26 +393,16 @@ def get_failure_stats(cursor, days: int = 30) -> Dict[str, Any]:
     """
     since_date = datetime.now() - timedelta(days=days)
 
-    # Total failures
+    # Total, unresolved and resolved failures in one pass
     cursor.execute("""
-        SELECT COUNT(*) FROM plex_match_failures
+        SELECT
+            COUNT(*),
+            COALESCE(SUM(resolved = 0), 0),
+            COALESCE(SUM(resolved = 1), 0)
+        FROM plex_match_failures
         WHERE failure_date >= ?
     """, (since_date,))
-    total_failures = cursor.fetchone()[0]
-
-    # Unresolved failures
-    cursor.execute("""
-        SELECT COUNT(*) FROM plex_match_failures
-        WHERE failure_date >= ? AND resolved = 0
-    """, (since_date,))
-    unresolved_failures = cursor.fetchone()[0]
-
-    # Resolved failures
-    cursor.execute("""
-        SELECT COUNT(*) FROM plex_match_failures
-        WHERE failure_date >= ? AND resolved = 1
-    """, (since_date,))
-    resolved_failures = cursor.fetchone()[0]
+    total_failures, unresolved_failures, resolved_failures = cursor.fetchone()
 
     # Failures by reason
     cursor.execute("""
@@ -412,22 +491,19 @@ def delete_old_failures(cursor, days: int = 7) -> int:
     return deleted
 
 
-def export_failures_to_csv(cursor, output_path: str,
-                           resolved: Optional[bool] = None,
-                           days: int = 30) -> int:
-    """Export failures to CSV file
+def _iter_export_rows(cursor, resolved: Optional[bool], days: int,
+                      batch_size: int) -> Iterator[List[List[Any]]]:
+    """Yield failures for CSV export as batches of row values
 
     Args:
         cursor: SQLite cursor object
-        output_path: Path to output CSV file
         resolved: Filter by resolved status (None = all)
-        days: Number of days to include (default 30)
+        days: Number of days to include
+        batch_size: Rows fetched per batch
 
-    Returns:
-        int: Number of failures exported
+    Yields:
+        List of CSV rows (one list of column values per failure)
     """
-    import csv
-
     since_date = datetime.now() - timedelta(days=days)
 
     query = """
@@ -450,34 +526,82 @@ def export_failures_to_csv(cursor, output_path: str,
 
     cursor.execute(query, params)
 
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+
+        yield [[
+            failure_id,
+            artist_name or '',
+            song_title or '',
+            failure_date,
+            failure_reason,
+            search_attempts,
+            search_terms_json or '',
+            'Yes' if resolved else 'No',
+            resolved_at or '',
+            playlist_name or ''
+        ] for (failure_id, artist_name, song_title, failure_date,
+               failure_reason, search_attempts, search_terms_json,
+               resolved, resolved_at, playlist_name) in rows]
+
+
+def iter_failures_csv(cursor, resolved: Optional[bool] = None,
+                      days: int = 30, batch_size: int = 1000) -> Iterator[str]:
+    """Stream failures as CSV text
+
+    Only one batch of rows is held in memory at a time, so the output can be
+    sent as a streaming HTTP response however many failures there are.
+
+    Args:
+        cursor: SQLite cursor object (must stay open until iteration finishes)
+        resolved: Filter by resolved status (None = all)
+        days: Number of days to include (default 30)
+        batch_size: Rows fetched and encoded per chunk
+
+    Yields:
+        str: CSV text, the header first and then one chunk per batch
+    """
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(CSV_HEADER)
+    yield buffer.getvalue()
+
+    for rows in _iter_export_rows(cursor, resolved, days, batch_size):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(rows)
+        yield buffer.getvalue()
+
+
+def export_failures_to_csv(cursor, output_path: str,
+                           resolved: Optional[bool] = None,
+                           days: int = 30) -> int:
+    """Export failures to CSV file
+
+    Args:
+        cursor: SQLite cursor object
+        output_path: Path to output CSV file
+        resolved: Filter by resolved status (None = all)
+        days: Number of days to include (default 30)
+
+    Returns:
+        int: Number of failures exported
+    """
+    exported = 0
+
     with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
         writer = csv.writer(csvfile)
-        writer.writerow([
-            'Failure ID', 'Artist', 'Song Title', 'Failure Date',
-            'Failure Reason', 'Search Attempts', 'Search Terms',
-            'Resolved', 'Resolved At', 'Playlist'
-        ])
-
-        for row in cursor.fetchall():
-            (failure_id, artist_name, song_title, failure_date,
-             failure_reason, search_attempts, search_terms_json,
-             resolved, resolved_at, playlist_name) = row
-
-            writer.writerow([
-                failure_id,
-                artist_name or '',
-                song_title or '',
-                failure_date,
-                failure_reason,
-                search_attempts,
-                search_terms_json or '',
-                'Yes' if resolved else 'No',
-                resolved_at or '',
-                playlist_name or ''
-            ])
-
-    logger.info(f"Exported {cursor.rowcount} failures to {output_path}")
-    return cursor.rowcount
+        writer.writerow(CSV_HEADER)
+
+        for rows in _iter_export_rows(cursor, resolved, days, batch_size=1000):
+            writer.writerows(rows)
+            exported += len(rows)
+
+    logger.info(f"Exported {exported} failures to {output_path}")
+    return exported
 
 
 def cleanup_old_failures(db, days: int = 7) -> int:
@@ -0,0 +1,182 @@
+"""
+SQLite connection pool for Radio Monitor
+
+Background jobs (scraping) share one database file with the Flask app. Instead
+of serializing all their work on the app's single connection, they borrow
+connections from a small pool.
+
+Pooled connections, like RadioDatabase's own, get apply_pragmas():
+- foreign_keys=ON
+- journal_mode=WAL (readers don't block the writer)
+- synchronous=NORMAL (safe with WAL, far fewer fsyncs)
+- mmap_size=MMAP_SIZE (reads served from the mapped file, no copy into the page cache)
+and a larger prepared statement cache (STATEMENT_CACHE_SIZE).
+
+Database paths may also be SQLite URIs ("file:..."), e.g. a shared-cache
+in-memory database ("file:name?mode=memory&cache=shared") that several
+connections can open. Private in-memory databases can't be shared across
+connections; use is_poolable() to check a path before pooling it.
+"""
+
+import queue
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Default number of pooled connections (override with settings['database']['pool_size'])
+DEFAULT_POOL_SIZE = 4
+
+# Prepared statements kept per connection (sqlite3 default is 128). Scraping
+# cycles through many distinct statements per song, so keep them all compiled.
+STATEMENT_CACHE_SIZE = 256
+
+# Bytes of the database file to memory-map for reads (256 MB)
+MMAP_SIZE = 256 * 1024 * 1024
+
+
+class RadioConnection(sqlite3.Connection):
+    """sqlite3.Connection that can be weakly referenced
+
+    The base class can't, so per-connection caches (queries._count_total)
+    couldn't be keyed on the connection without keeping it alive.
+    """
+
+
+class ConnectionPool:
+    """Thread-safe pool of SQLite connections
+
+    Connections are created lazily up to `size`; once all are in use,
+    acquire() blocks until one is returned.
+
+    Usage:
+        pool = ConnectionPool('radio_songs.db', size=4)
+        with pool.acquire() as conn:
+            conn.execute("SELECT ...")
+        with pool.acquire_database() as db:
+            db.add_artist_and_song_if_new(...)
+    """
+
+    def __init__(self, db_path, size=DEFAULT_POOL_SIZE):
+        self.db_path = db_path
+        self.size = max(1, int(size))
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _create_connection(self):
+        """Open a new connection with the pool's pragmas applied"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30,
+                               cached_statements=STATEMENT_CACHE_SIZE,
+                               uri=is_uri(self.db_path), factory=RadioConnection)
+        apply_pragmas(conn, self.db_path)
+        return conn
+
+    def _get_connection(self):
+        """Take an idle connection, create one if under the limit, or wait"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                try:
+                    return self._create_connection()
+                except Exception:
+                    self._created -= 1
+                    raise
+
+        return self._idle.get()
+
+    @contextmanager
+    def acquire(self):
+        """Borrow a connection for the duration of a `with` block
+
+        Any transaction left open when the block exits is rolled back so the
+        next borrower starts clean.
+
+        Yields:
+            sqlite3.Connection
+        """
+        conn = self._get_connection()
+        try:
+            yield conn
+        finally:
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+                self._idle.put(conn)
+            except sqlite3.Error as e:
+                logger.warning(f"Discarding broken pooled connection: {e}")
+                with self._lock:
+                    self._created -= 1
+                conn.close()
+
+    @contextmanager
+    def acquire_database(self):
+        """Borrow a pooled connection wrapped in a RadioDatabase
+
+        Yields:
+            RadioDatabase bound to a pooled connection
+        """
+        from radio_monitor.database import RadioDatabase
+
+        with self.acquire() as conn:
+            pooled_db = RadioDatabase(self.db_path)
+            pooled_db.conn = conn
+            pooled_db.cursor = conn.cursor()
+            try:
+                yield pooled_db
+            finally:
+                pooled_db.cursor.close()
+
+    def close(self):
+        """Close all idle connections"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._created -= 1
+
+
+def apply_pragmas(conn, db_path):
+    """Apply the connection pragmas shared by every Radio Monitor connection
+
+    WAL, synchronous=NORMAL and mmap only apply to databases other
+    connections can share; private in-memory databases just get foreign keys.
+
+    Args:
+        conn: sqlite3.Connection (no transaction open)
+        db_path: Path or URI the connection was opened with
+    """
+    conn.execute("PRAGMA foreign_keys = ON")
+    if is_poolable(db_path):
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+
+
+def is_uri(db_path):
+    """Check whether a database path is an SQLite URI (file:...)"""
+    return str(db_path).startswith('file:')
+
+
+def is_poolable(db_path):
+    """Check whether a database path can be shared across connections"""
+    if not db_path or db_path == ':memory:' or str(db_path).startswith('file::memory:'):
+        return False
+    if is_uri(db_path) and 'mode=memory' in str(db_path):
+        # Named in-memory databases are only shared when using the shared cache
+        return 'cache=shared' in str(db_path)
+    return True
+
+
+__all__ = ['ConnectionPool', 'RadioConnection', 'DEFAULT_POOL_SIZE', 'STATEMENT_CACHE_SIZE', 'MMAP_SIZE',
+           'apply_pragmas', 'is_poolable', 'is_uri']
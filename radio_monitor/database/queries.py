@@ -6,13 +6,18 @@ All methods return data structures (dicts, lists, tuples) and do not modify the
 
 Query Categories:
 - Station queries: get_station_by_id, get_all_stations, get_all_stations_with_health
-- Artist queries: get_artist_by_mbid, get_artist_by_name, get_pending_artists
+- Artist queries: get_artist_by_mbid, get_artist_by_name, get_artist_mbids_by_names,
+  get_pending_artists, get_artist_import_stats
 - Song queries: get_top_songs, get_recent_songs, get_all_songs
 - Statistics: get_statistics, get_dashboard_stats, get_plays_over_time, get_station_distribution
 - Playlist queries: get_playlist, get_playlists, get_due_playlists
 """
 
+import base64
+import json
 import logging
+import threading
+import weakref
 from datetime import datetime
 import re
 
@@ -173,6 +178,7 @@ def get_all_stations_with_health(cursor):
               'scraper_type', 'wait_time', 'enabled', 'consecutive_failures',
               'last_failure_at', 'created_at', 'songs_scraped', 'last_scrape_at']
 
+    now = datetime.now()
     stations = []
     for row in cursor.fetchall():
         station = dict(zip(columns, row))
@@ -191,7 +197,7 @@ def get_all_stations_with_health(cursor):
                     failure_time = datetime.fromisoformat(station['last_failure_at'])
                 else:
                     failure_time = station['last_failure_at']
-                days_ago = (datetime.now() - failure_time).days
+                days_ago = (now - failure_time).days
                 if station['consecutive_failures'] >= 3:
                     station['status'] = 'Auto-disabled'
                     station['status_class'] = 'danger'
@@ -318,6 +324,34 @@ def get_artist_by_name(cursor, name):
         return dict(zip(columns, row))
     return None
 
+def get_artist_mbids_by_names(cursor, names):
+    """Get real (non-PENDING) MBIDs for many artist names at once
+
+    Args:
+        cursor: SQLite cursor object
+        names: Iterable of artist names (exact match, like get_artist_by_name)
+
+    Returns:
+        dict: {name: mbid} for artists that have a real MBID
+    """
+    names = list(dict.fromkeys(names))
+    mbids = {}
+
+    # Stay well under SQLite's bound-parameter limit
+    for start in range(0, len(names), 500):
+        chunk = names[start:start + 500]
+        placeholders = ','.join('?' * len(chunk))
+        cursor.execute(f"""
+            SELECT name, mbid FROM artists
+            WHERE name IN ({placeholders})
+            AND mbid IS NOT NULL AND mbid NOT LIKE 'PENDING-%'
+        """, chunk)
+
+        for name, mbid in cursor.fetchall():
+            mbids[name] = mbid
+
+    return mbids
+
 def get_all_artists(cursor):
     """Get all artists
 
@@ -349,6 +383,36 @@ def get_pending_artists(cursor):
 
     return cursor.fetchall()
 
+def get_artist_import_stats(cursor, include_imported=True):
+    """Get play and song totals for every artist in one aggregate pass
+
+    Used by the scraper to check Lidarr auto-import thresholds without
+    issuing a query per song.
+
+    Args:
+        cursor: SQLite cursor object
+        include_imported: Include artists already imported to Lidarr
+            (False skips them, since they never need a threshold check)
+
+    Returns:
+        Dict mapping artist mbid -> (total_plays, song_count, imported)
+    """
+    where_clause = "" if include_imported else "WHERE a.lidarr_imported_at IS NULL"
+
+    cursor.execute(f"""
+        SELECT
+            a.mbid,
+            COALESCE(SUM(s.play_count), 0) as total_plays,
+            COUNT(DISTINCT s.id) as song_count,
+            a.lidarr_imported_at IS NOT NULL as imported
+        FROM artists a
+        LEFT JOIN songs s ON a.mbid = s.artist_mbid
+        {where_clause}
+        GROUP BY a.mbid
+    """)
+
+    return {row[0]: (row[1], row[2], bool(row[3])) for row in cursor.fetchall()}
+
 def get_artists_for_import(cursor, min_plays=5, station_id=None, sort='total_plays', direction='desc'):
     """Get artists that need Lidarr import
 
@@ -425,7 +489,113 @@ def get_artists_for_import(cursor, min_plays=5, station_id=None, sort='total_pla
     columns = ['mbid', 'name', 'total_plays']
     return [dict(zip(columns, row)) for row in cursor.fetchall()]
 
-def get_artists_paginated(cursor, page=1, limit=50, filters=None, sort='name', direction='asc'):
+# Cached paginated-list totals: {conn: (stamp, {count query + params: total})}.
+# The stamp (PRAGMA data_version, conn.total_changes) changes whenever any
+# connection commits or this one writes, so stale totals are never served.
+# Keyed weakly, so entries go away with their connection (RadioConnection;
+# plain sqlite3 connections can't be weakly referenced and aren't cached).
+_TOTAL_CACHE_ENTRIES = 256
+_total_cache = weakref.WeakKeyDictionary()
+_total_cache_lock = threading.Lock()
+
+
+def _count_total(cursor, count_query, params):
+    """Run a COUNT query for a paginated list, reusing unchanged results
+
+    Args:
+        cursor: SQLite cursor object
+        count_query: SELECT COUNT(...) query
+        params: Query parameters
+
+    Returns:
+        Row count (int)
+    """
+    conn = cursor.connection
+    if not hasattr(conn, '__weakref__'):
+        cursor.execute(count_query, params)
+        return cursor.fetchone()[0]
+
+    cursor.execute("PRAGMA data_version")
+    stamp = (cursor.fetchone()[0], conn.total_changes)
+    key = (count_query, tuple(params))
+
+    with _total_cache_lock:
+        entry = _total_cache.get(conn)
+        if entry and entry[0] == stamp and key in entry[1]:
+            return entry[1][key]
+
+    cursor.execute(count_query, params)
+    total = cursor.fetchone()[0]
+
+    with _total_cache_lock:
+        entry = _total_cache.get(conn)
+        if not entry or entry[0] != stamp or len(entry[1]) >= _TOTAL_CACHE_ENTRIES:
+            entry = (stamp, {})
+            _total_cache[conn] = entry
+        entry[1][key] = total
+
+    return total
+
+
+def encode_page_cursor(sort_value, key):
+    """Encode the sort position of a page's last row as an opaque cursor
+
+    Args:
+        sort_value: Value of the sort column for the last row
+        key: Unique tie-breaker for the last row (artist MBID / row ID)
+
+    Returns:
+        URL-safe cursor string
+    """
+    return base64.urlsafe_b64encode(json.dumps([sort_value, key]).encode('utf-8')).decode('ascii')
+
+
+def decode_page_cursor(page_cursor):
+    """Decode a cursor created by encode_page_cursor()
+
+    Args:
+        page_cursor: Cursor string
+
+    Returns:
+        Tuple of (sort_value, key)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(page_cursor.encode('ascii')))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid page cursor: {e}")
+
+    if not isinstance(values, list) or len(values) != 2:
+        raise ValueError("Invalid page cursor")
+
+    return values[0], values[1]
+
+
+# Whether artists_fts exists, per connection (keyed weakly like _total_cache).
+# The schema is settled once migrations have run on connect.
+_fts_available = weakref.WeakKeyDictionary()
+
+
+def _has_artists_fts(cursor):
+    """Check whether the artists_fts search index exists (needs FTS5 trigram)"""
+    conn = cursor.connection
+    cacheable = hasattr(conn, '__weakref__')
+    if cacheable:
+        available = _fts_available.get(conn)
+        if available is not None:
+            return available
+
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'artists_fts'")
+    available = cursor.fetchone() is not None
+    if cacheable:
+        _fts_available[conn] = available
+    return available
+
+
+def get_artists_paginated(cursor, page=1, limit=50, filters=None, sort='name', direction='asc', after=None,
+                          include_total=True):
     """Get paginated list of artists with filtering and sorting
 
     Args:
@@ -435,20 +605,38 @@ def get_artists_paginated(cursor, page=1, limit=50, filters=None, sort='name', d
         filters: Dict with filter values (search, needs_import, station_id, first_seen_after, last_seen_after, total_plays_min, total_plays_max)
         sort: Sort field ('name', 'song_count', 'total_plays', 'last_seen', 'first_seen')
         direction: Sort direction ('asc' or 'desc')
+        after: Cursor from a previous page's next_cursor (optional). When sorting
+               by name, the page starts right after that row (keyset pagination,
+               no OFFSET scan); other sorts ignore it and use page.
+        include_total: If False, skip counting matching rows (total and pages
+                       are None). Totals are cached until the database changes.
 
     Returns:
-        Dict with keys: items, total, page, pages, limit
+        Dict with keys: items, total, page, pages, limit, next_cursor
+        (next_cursor is None on the last page or when sorting by other columns)
+
+    Raises:
+        ValueError: If after is not a valid cursor
     """
     offset = (page - 1) * limit
 
+    # Keyset pagination is only possible on a unique, non-aggregate sort key
+    use_keyset = sort == 'name'
+
     # Build WHERE clause (non-aggregate filters only)
     conditions = []
     having_conditions = []  # For aggregate filters like total_plays
     params = []
+    having_params = []  # Bound after the WHERE params (HAVING comes later in the SQL)
 
     if filters:
         if filters.get('search'):
-            conditions.append("a.name LIKE ?")
+            if len(filters['search']) >= 3 and _has_artists_fts(cursor):
+                # Trigram index resolves the substring LIKE without a scan
+                # (terms under 3 characters can't use a trigram index)
+                conditions.append("a.rowid IN (SELECT rowid FROM artists_fts WHERE name LIKE ?)")
+            else:
+                conditions.append("a.name LIKE ?")
             params.append(f"%{filters['search']}%")
 
         if filters.get('needs_import') == 'only':
@@ -469,11 +657,11 @@ def get_artists_paginated(cursor, page=1, limit=50, filters=None, sort='name', d
         # These are aggregate filters - need HAVING clause with full expression
         if filters.get('total_plays_min'):
             having_conditions.append("COALESCE(SUM(s.play_count), 0) >= ?")
-            params.append(int(filters['total_plays_min']))
+            having_params.append(int(filters['total_plays_min']))
 
         if filters.get('total_plays_max'):
             having_conditions.append("COALESCE(SUM(s.play_count), 0) <= ?")
-            params.append(int(filters['total_plays_max']))
+            having_params.append(int(filters['total_plays_max']))
 
         if filters.get('first_seen_after'):
             conditions.append("a.first_seen_at >= ?")
@@ -483,15 +671,10 @@ def get_artists_paginated(cursor, page=1, limit=50, filters=None, sort='name', d
             conditions.append("a.last_seen_at >= ?")
             params.append(filters['last_seen_after'])
 
-        # MBID status filter
-        if filters.get('mbid_status'):
-            mbid_status = filters.get('mbid_status')
-            if mbid_status == 'pending':
-                conditions.append("a.mbid LIKE 'PENDING-%'")
-            elif mbid_status == 'valid':
-                conditions.append("a.mbid NOT LIKE 'PENDING-%' AND a.mbid IS NOT NULL")
-            elif mbid_status == 'none':
-                conditions.append("a.mbid IS NULL")
+        # MBID status filter (indexed generated column: none/pending/valid)
+        if filters.get('mbid_status') in ('pending', 'valid', 'none'):
+            conditions.append("a.mbid_status = ?")
+            params.append(filters['mbid_status'])
 
     where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
     having_clause = "HAVING " + " AND ".join(having_conditions) if having_conditions else ""
@@ -516,6 +699,10 @@ def get_artists_paginated(cursor, page=1, limit=50, filters=None, sort='name', d
     else:
         order_by = f"{sort_column} {direction.upper()}"
 
+    if use_keyset:
+        # Tie-break on MBID so every row has a unique position
+        order_by += f", a.mbid {direction.upper()}"
+
     # Check if we need to join songs table for filtering/aggregation
     needs_song_join = (
         filters and (
@@ -542,12 +729,23 @@ def get_artists_paginated(cursor, page=1, limit=50, filters=None, sort='name', d
     else:
         # Simple count without JOIN
         count_query = f"""
-            SELECT COUNT(DISTINCT a.mbid)
+            SELECT COUNT(*)
             FROM artists a
             {where_clause}
         """
-    cursor.execute(count_query, params)
-    total = cursor.fetchone()[0]
+    total = _count_total(cursor, count_query, params + having_params) if include_total else None
+
+    # Start after the cursor row instead of skipping OFFSET rows
+    # (leading range condition lets SQLite seek idx_artists_name_nocase)
+    if use_keyset and after:
+        after_name, after_mbid = decode_page_cursor(after)
+        op = '<' if direction.lower() == 'desc' else '>'
+        keyset_condition = (f"a.name COLLATE NOCASE {op}= ? AND "
+                            f"(a.name COLLATE NOCASE, a.mbid) {op} (?, ?)")
+        where_clause = (f"{where_clause} AND {keyset_condition}" if where_clause
+                        else f"WHERE {keyset_condition}")
+        params.extend([after_name, after_name, after_mbid])
+        offset = 0
 
     # Get paginated results
     query = f"""
@@ -577,8 +775,7 @@ def get_artists_paginated(cursor, page=1, limit=50, filters=None, sort='name', d
         ORDER BY {order_by}
         LIMIT ? OFFSET ?
     """
-    params.extend([limit, offset])
-    cursor.execute(query, params)
+    cursor.execute(query, params + having_params + [limit, offset])
 
     columns = ['mbid', 'name', 'first_seen_station',
                'first_seen_at', 'last_seen_at', 'needs_lidarr_import',
@@ -586,6 +783,11 @@ def get_artists_paginated(cursor, page=1, limit=50, filters=None, sort='name', d
                'verified_mb_count', 'verified_lidarr_count', 'is_blocked']
     items = [dict(zip(columns, row)) for row in cursor.fetchall()]
 
+    # Cursor holds the stored (not display-capitalized) name of the last row
+    next_cursor = None
+    if use_keyset and len(items) == limit:
+        next_cursor = encode_page_cursor(items[-1]['name'], items[-1]['mbid'])
+
     # Capitalize artist names properly
     for item in items:
         item['name'] = capitalize_name_properly(item['name'])
@@ -610,8 +812,9 @@ def get_artists_paginated(cursor, page=1, limit=50, filters=None, sort='name', d
         'items': items,
         'total': total,
         'page': page,
-        'pages': (total + limit - 1) // limit,
-        'limit': limit
+        'pages': (total + limit - 1) // limit if total is not None else None,
+        'limit': limit,
+        'next_cursor': next_cursor
     }
 
 def get_artist_detail(cursor, mbid):
@@ -709,7 +912,8 @@ def get_artist_play_history(cursor, mbid, days=30):
 
 # ==================== SONG PAGINATION QUERIES ====================
 
-def get_songs_paginated(cursor, page=1, limit=50, filters=None, sort='title', direction='asc', exclude_blocklist=False):
+def get_songs_paginated(cursor, page=1, limit=50, filters=None, sort='title', direction='asc', exclude_blocklist=False,
+                        after=None, include_total=True):
     """Get paginated list of songs with filtering and sorting
 
     Args:
@@ -720,12 +924,24 @@ def get_songs_paginated(cursor, page=1, limit=50, filters=None, sort='title', di
         sort: Sort field ('title', 'artist_name', 'play_count', 'last_seen')
         direction: Sort direction ('asc' or 'desc')
         exclude_blocklist: If True, exclude blocked artists/songs (default: False)
+        after: Cursor from a previous page's next_cursor (optional). When sorting
+               by title or artist_name, the page starts right after that row
+               (keyset pagination, no OFFSET scan); other sorts use page.
+        include_total: If False, skip counting matching rows (total and pages
+                       are None). Totals are cached until the database changes.
 
     Returns:
-        Dict with keys: items, total, page, pages, limit
+        Dict with keys: items, total, page, pages, limit, next_cursor
+        (next_cursor is None on the last page or when sorting by other columns)
+
+    Raises:
+        ValueError: If after is not a valid cursor
     """
     offset = (page - 1) * limit
 
+    # Keyset pagination needs a non-NULL sort column (ties broken by song ID)
+    use_keyset = sort in ['title', 'artist_name']
+
     # Build WHERE clause
     conditions = []
     params = []
@@ -812,14 +1028,28 @@ def get_songs_paginated(cursor, page=1, limit=50, filters=None, sort='title', di
     else:
         order_by = f"{sort_column} {direction.upper()}"
 
+    if use_keyset:
+        # Tie-break on song ID so every row has a unique position
+        order_by += f", s.id {direction.upper()}"
+
     # Get total count
     count_query = f"""
         SELECT COUNT(DISTINCT s.id)
         FROM songs s
         {where_clause}
     """
-    cursor.execute(count_query, params)
-    total = cursor.fetchone()[0]
+    total = _count_total(cursor, count_query, params) if include_total else None
+
+    # Start after the cursor row instead of skipping OFFSET rows
+    if use_keyset and after:
+        after_value, after_id = decode_page_cursor(after)
+        op = '<' if direction.lower() == 'desc' else '>'
+        keyset_condition = (f"{sort_column} COLLATE NOCASE {op}= ? AND "
+                            f"({sort_column} COLLATE NOCASE, s.id) {op} (?, ?)")
+        where_clause = (f"{where_clause} AND {keyset_condition}" if where_clause
+                        else f"WHERE {keyset_condition}")
+        params.extend([after_value, after_value, after_id])
+        offset = 0
 
     # Get paginated results
     query = f"""
@@ -856,6 +1086,12 @@ def get_songs_paginated(cursor, page=1, limit=50, filters=None, sort='title', di
                'verified_mb', 'verified_lidarr', 'is_blocked']
     items = [dict(zip(columns, row)) for row in cursor.fetchall()]
 
+    # Cursor holds the stored (not display-capitalized) sort value of the last row
+    next_cursor = None
+    if use_keyset and len(items) == limit:
+        sort_key = 'song_title' if sort == 'title' else 'artist_name'
+        next_cursor = encode_page_cursor(items[-1][sort_key], items[-1]['id'])
+
     # Capitalize artist names properly
     for item in items:
         item['artist_name'] = capitalize_name_properly(item['artist_name'])
@@ -879,8 +1115,9 @@ def get_songs_paginated(cursor, page=1, limit=50, filters=None, sort='title', di
         'items': items,
         'total': total,
         'page': page,
-        'pages': (total + limit - 1) // limit,
-        'limit': limit
+        'pages': (total + limit - 1) // limit if total is not None else None,
+        'limit': limit,
+        'next_cursor': next_cursor
     }
 
 def get_song_detail(cursor, song_id):
@@ -1323,20 +1560,23 @@ def get_trending_songs(cursor, days=90):
     Returns:
         List of tuples: (song_title, artist_name, recent_plays, older_plays, growth)
     """
-    cursor.execute(f"""
+    # Bind the day counts so every call reuses the same prepared statement
+    recent_start = f"-{int(days)} days"
+    older_start = f"-{int(days) * 2} days"
+    cursor.execute("""
         SELECT s.song_title, s.artist_name,
-               SUM(CASE WHEN d.date >= DATE('now', '-{days} days')
+               SUM(CASE WHEN d.date >= DATE('now', ?)
                    THEN d.play_count ELSE 0 END) as recent,
-               SUM(CASE WHEN d.date >= DATE('now', '-{days*2} days')
-                      AND d.date < DATE('now', '-{days} days')
+               SUM(CASE WHEN d.date >= DATE('now', ?)
+                      AND d.date < DATE('now', ?)
                    THEN d.play_count ELSE 0 END) as older
         FROM song_plays_daily d
         JOIN songs s ON d.song_id = s.id
-        WHERE d.date >= DATE('now', '-{days*2} days')
+        WHERE d.date >= DATE('now', ?)
         GROUP BY s.id
         HAVING recent > older
         ORDER BY (recent - older) DESC
-    """)
+    """, (recent_start, older_start, recent_start, older_start))
 
     results = []
     for row in cursor.fetchall():
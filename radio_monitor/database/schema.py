@@ -24,11 +24,13 @@ Tables:
 - plex_manual_overrides: Manual Plex track matching overrides (v16)
 - spotiflac_downloads: SpotiFLAC download job tracking (v19)
 - artist_song_verification: Song verification tracking (v21)
+- artists_fts: Trigram search index over artist names (v24)
 
-Schema Version: 21
+Schema Version: 26
 """
 
 import logging
+import sqlite3
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +73,11 @@ def create_tables(cursor):
             last_seen_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             needs_lidarr_import BOOLEAN DEFAULT 1,
             lidarr_imported_at TIMESTAMP,
+            mbid_status TEXT GENERATED ALWAYS AS (
+                CASE WHEN mbid IS NULL THEN 'none'
+                     WHEN mbid LIKE 'PENDING-%' THEN 'pending'
+                     ELSE 'valid' END
+            ) VIRTUAL,
             FOREIGN KEY (first_seen_station) REFERENCES stations(id)
         )
     """)
@@ -80,6 +87,8 @@ def create_tables(cursor):
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_artists_needs_import ON artists(needs_lidarr_import) WHERE needs_lidarr_import = 1")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_artists_last_seen ON artists(last_seen_at DESC)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_artists_first_seen ON artists(first_seen_at DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_artists_name_nocase ON artists(name COLLATE NOCASE, mbid)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_artists_mbid_status ON artists(mbid_status, first_seen_station)")
 
     # 3. songs table
     cursor.execute("""
@@ -102,6 +111,8 @@ def create_tables(cursor):
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_songs_last_seen ON songs(last_seen_at DESC)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_songs_first_seen ON songs(first_seen_at DESC)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_songs_artist_title ON songs(artist_name, song_title)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_songs_title_nocase ON songs(song_title COLLATE NOCASE, id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_songs_artist_name_nocase ON songs(artist_name COLLATE NOCASE, id)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_songs_artist_name ON songs(artist_name)")
 
     # 4. song_plays_daily table
@@ -171,7 +182,7 @@ def create_tables(cursor):
         )
     """)
 
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_activity_timestamp ON activity_log(timestamp DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_activity_timestamp_id ON activity_log(timestamp, id)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_activity_type ON activity_log(event_type)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_activity_severity ON activity_log(event_severity)")
 
@@ -194,8 +205,8 @@ def create_tables(cursor):
     """)
 
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_failures_song ON plex_match_failures(song_id)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_failures_date ON plex_match_failures(failure_date DESC)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_failures_resolved ON plex_match_failures(resolved)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_failures_date_id ON plex_match_failures(failure_date, id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_failures_resolved_date_id ON plex_match_failures(resolved, failure_date, id)")
 
     # 9. notifications table (v5)
     cursor.execute("""
@@ -232,7 +243,7 @@ def create_tables(cursor):
     """)
 
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_notification ON notification_history(notification_id)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_sent_at ON notification_history(sent_at DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_sent_at_id ON notification_history(sent_at, id)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_event_type ON notification_history(event_type)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_success ON notification_history(success)")
 
@@ -405,6 +416,66 @@ def create_tables(cursor):
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_verification_song_id ON artist_song_verification(song_id)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_verification_source ON artist_song_verification(verification_source)")
 
+    # 20. artists_fts search index (v24)
+    create_artists_fts(cursor)
+
+
+def create_artists_fts(cursor):
+    """Create the artists_fts trigram index over artists.name and its sync triggers
+
+    artists_fts is an external-content FTS5 table: it stores only the index
+    and reads names from artists. With the trigram tokenizer, substring
+    searches (name LIKE '%term%') are index lookups instead of full scans.
+
+    Args:
+        cursor: SQLite cursor object
+
+    Returns:
+        True if the index exists, False if this SQLite build lacks FTS5
+    """
+    try:
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS artists_fts
+            USING fts5(name, content='artists', tokenize='trigram')
+        """)
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Artist search index unavailable (FTS5 trigram not supported): {e}")
+        return False
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS artists_fts_insert AFTER INSERT ON artists BEGIN
+            INSERT INTO artists_fts (rowid, name) VALUES (new.rowid, new.name);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS artists_fts_delete AFTER DELETE ON artists BEGIN
+            INSERT INTO artists_fts (artists_fts, rowid, name) VALUES ('delete', old.rowid, old.name);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS artists_fts_update AFTER UPDATE OF name ON artists BEGIN
+            INSERT INTO artists_fts (artists_fts, rowid, name) VALUES ('delete', old.rowid, old.name);
+            INSERT INTO artists_fts (rowid, name) VALUES (new.rowid, new.name);
+        END
+    """)
+    return True
+
+
+def rebuild_artists_fts(cursor):
+    """Re-index artists_fts from the artists table
+
+    Run after VACUUM: artists has no INTEGER PRIMARY KEY, so SQLite is
+    allowed to renumber its rowids, which artists_fts refers to.
+
+    Args:
+        cursor: SQLite cursor (or connection) object
+    """
+    exists = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'artists_fts'"
+    ).fetchone()
+    if exists:
+        cursor.execute("INSERT INTO artists_fts (artists_fts) VALUES ('rebuild')")
+
 
 def populate_stations(cursor):
     """Populate stations table with initial 28 stations (alphabetical by name)
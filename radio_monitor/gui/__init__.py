@@ -317,6 +317,13 @@ def cleanup():
     except Exception as e:
         logger.error(f"Error closing database: {e}")
 
+    try:
+        # Close pooled SMTP connections
+        from radio_monitor.notifications import close_smtp_connections
+        close_smtp_connections()
+    except Exception as e:
+        logger.error(f"Error closing SMTP connections: {e}")
+
 
 # Import wizard routes first (has before_request handler)
 from radio_monitor.gui.routes import wizard
@@ -81,6 +81,7 @@ def api_activity():
         event_type: Filter by event type (optional)
         severity: Filter by severity (optional)
         days: Only show entries from last N days (optional)
+        cursor: next_cursor from the previous page (optional, replaces page)
 
     Returns JSON:
         {
@@ -88,6 +89,7 @@ def api_activity():
             "page": 1,
             "limit": 50,
             "total": 150,
+            "next_cursor": "..." or null,
             "filters": {...}
         }
     """
@@ -96,9 +98,10 @@ def api_activity():
         return jsonify({'error': 'Database not initialized'}), 500
 
     try:
-        from radio_monitor.database.activity import get_activity_paginated
+        from radio_monitor.database.activity import get_activity_paginated, activity_page_cursor
 
         page = request.args.get('page', 1, type=int)
+        after = request.args.get('cursor')
         limit = request.args.get('limit', 50, type=int)
         event_type = request.args.get('event_type')
         severity = request.args.get('severity')
@@ -115,7 +118,8 @@ def api_activity():
                 limit=limit,
                 event_type=event_type,
                 severity=severity,
-                days=days
+                days=days,
+                after=after
             )
 
             # Get total count (simplified - for accurate total, need separate query)
@@ -125,6 +129,7 @@ def api_activity():
                 'page': page,
                 'limit': limit,
                 'total': len(activities),  # Simplified
+                'next_cursor': activity_page_cursor(activities, limit),
                 'filters': {
                     'event_type': event_type,
                     'severity': severity,
@@ -134,6 +139,8 @@ def api_activity():
         finally:
             cursor.close()
 
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error getting activity log: {e}")
         return jsonify({'error': str(e)}), 500
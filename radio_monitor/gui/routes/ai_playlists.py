@@ -7,6 +7,7 @@ Experimental AI-powered playlist generation using OpenRouter.ai.
 import json
 import logging
 import sys
+import time
 from datetime import datetime
 from flask import Blueprint, render_template, jsonify, request, current_app
 from radio_monitor.auth import requires_auth
@@ -15,7 +16,8 @@ logger = logging.getLogger(__name__)
 
 ai_playlists_bp = Blueprint('ai_playlists', __name__)
 
-# Rate limiting tracking (in-memory for simplicity)
+# Rate limiting tracking (in-memory for simplicity; time.monotonic() so clock
+# changes can't lift or extend the cooldown)
 _last_request_time = None
 _rate_limit_seconds = 60  # 1 request per minute
 
@@ -191,9 +193,9 @@ def api_generate_ai_playlist():
         }), 400
 
     # Rate limiting check
-    current_time = datetime.now()
-    if _last_request_time:
-        time_diff = (current_time - _last_request_time).total_seconds()
+    current_time = time.monotonic()
+    if _last_request_time is not None:
+        time_diff = current_time - _last_request_time
         if time_diff < _rate_limit_seconds:
             retry_after = int(_rate_limit_seconds - time_diff)
             return jsonify({
@@ -158,6 +158,8 @@ def api_artists():
     # Get query parameters
     page = int(request.args.get('page', 1))
     limit = int(request.args.get('limit', 50))
+    after = request.args.get('cursor', '')  # next_cursor from the previous page
+    include_total = request.args.get('include_total', '1') != '0'
     search = request.args.get('search', '')
     needs_import = request.args.get('needs_import', '')
     station_id = request.args.get('station_id', '')
@@ -202,7 +204,10 @@ def api_artists():
     # Get artists
     cursor = db.get_cursor()
     try:
-        result = get_artists_paginated(cursor, page, limit, filters, sort, direction)
+        result = get_artists_paginated(cursor, page, limit, filters, sort, direction, after=after or None,
+                                       include_total=include_total)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     finally:
         cursor.close()
 
@@ -212,7 +217,8 @@ def api_artists():
             'page': page,
             'pages': result['pages'],
             'total': result['total'],
-            'limit': limit
+            'limit': limit,
+            'next_cursor': result['next_cursor']
         }
     })
 
@@ -95,14 +95,9 @@ def api_create_notification():
         if field not in data:
             return jsonify({'error': f'Missing required field: {field}'}), 400
 
-    # Validate notification type (all 17 supported providers)
-    valid_types = [
-        'discord', 'slack', 'email', 'telegram',
-        'gotify', 'ntfy', 'mattermost', 'rocketchat',
-        'matrix', 'pushover', 'pushbullet', 'prowl',
-        'boxcar', 'mqtt'
-    ]
-    if data['notification_type'] not in valid_types:
+    # Validate notification type (all supported providers)
+    from radio_monitor.notifications import NOTIFICATION_HANDLERS
+    if data['notification_type'] not in NOTIFICATION_HANDLERS:
         return jsonify({'error': f'Invalid notification type: {data["notification_type"]}'}), 400
 
     cursor = db.get_cursor()
@@ -341,6 +336,7 @@ def api_get_notification_history(notification_id):
     Query params:
         - limit: Items per page (default 50)
         - offset: Pagination offset
+        - cursor: next_cursor from the previous page (optional, replaces offset)
         - success_only: Filter by success (true/false)
     """
     db = current_app.config.get('db')
@@ -349,6 +345,7 @@ def api_get_notification_history(notification_id):
 
     limit = int(request.args.get('limit', 50))
     offset = int(request.args.get('offset', 0))
+    after = request.args.get('cursor')
     success_only_param = request.args.get('success_only')
 
     success_only = None
@@ -361,13 +358,17 @@ def api_get_notification_history(notification_id):
     try:
         from radio_monitor.database import notifications as notif_db
 
-        history = notif_db.get_notification_history(
-            cursor,
-            notification_id=notification_id,
-            limit=limit,
-            offset=offset,
-            success_only=success_only
-        )
+        try:
+            history = notif_db.get_notification_history(
+                cursor,
+                notification_id=notification_id,
+                limit=limit,
+                offset=offset,
+                success_only=success_only,
+                after=after
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
 
         # Get total count
         cursor.execute("""
@@ -380,7 +381,8 @@ def api_get_notification_history(notification_id):
             'history': history,
             'total': total,
             'limit': limit,
-            'offset': offset
+            'offset': offset,
+            'next_cursor': notif_db.history_page_cursor(history, limit)
         })
     finally:
         cursor.close()
@@ -426,6 +428,7 @@ def api_get_all_history():
     Query params:
         - limit: Items per page (default 50)
         - offset: Pagination offset
+        - cursor: next_cursor from the previous page (optional, replaces offset)
         - success_only: Filter by success (true/false)
     """
     db = current_app.config.get('db')
@@ -434,6 +437,7 @@ def api_get_all_history():
 
     limit = int(request.args.get('limit', 50))
     offset = int(request.args.get('offset', 0))
+    after = request.args.get('cursor')
     success_only_param = request.args.get('success_only')
 
     success_only = None
@@ -446,13 +450,17 @@ def api_get_all_history():
     try:
         from radio_monitor.database import notifications as notif_db
 
-        history = notif_db.get_notification_history(
-            cursor,
-            notification_id=None,
-            limit=limit,
-            offset=offset,
-            success_only=success_only
-        )
+        try:
+            history = notif_db.get_notification_history(
+                cursor,
+                notification_id=None,
+                limit=limit,
+                offset=offset,
+                success_only=success_only,
+                after=after
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
 
         # Get total count
         query = "SELECT COUNT(*) FROM notification_history WHERE 1=1"
@@ -468,7 +476,8 @@ def api_get_all_history():
             'history': history,
             'total': total,
             'limit': limit,
-            'offset': offset
+            'offset': offset,
+            'next_cursor': notif_db.history_page_cursor(history, limit)
         })
     finally:
         cursor.close()
@@ -823,7 +823,7 @@ def api_load_manual_playlist(playlist_id):
             "song_count": 23
         }
     """
-    from radio_monitor.database.crud import clear_builder_state, add_song_to_builder_state
+    from radio_monitor.database.crud import clear_builder_state, add_songs_to_builder_state_batch
     from radio_monitor.database.queries import get_manual_playlist_songs, get_manual_playlist
 
     db = get_db()
@@ -839,14 +839,17 @@ def api_load_manual_playlist(playlist_id):
             if not playlist:
                 return jsonify({'error': 'Playlist not found'}), 404
 
-            # Clear current selections
-            session_id = get_session_id()
-            clear_builder_state(cursor, db.conn, session_id)
-
-            # Load playlist songs
             songs = get_manual_playlist_songs(cursor, playlist_id)
-            for song in songs:
-                add_song_to_builder_state(cursor, db.conn, session_id, song['id'])
+
+            # Replace current selections with the playlist songs, single commit
+            session_id = get_session_id()
+            try:
+                clear_builder_state(cursor, db.conn, session_id, commit=False)
+                add_songs_to_builder_state_batch(cursor, session_id, [song['id'] for song in songs])
+                db.conn.commit()
+            except Exception:
+                db.conn.rollback()
+                raise
 
             return jsonify({
                 'success': True,
@@ -10,10 +10,8 @@ This module handles all Plex failure tracking GUI operations:
 """
 
 import logging
-from flask import Blueprint, render_template, jsonify, request, send_file, current_app
+from flask import Blueprint, render_template, jsonify, request, current_app, Response, stream_with_context
 from radio_monitor.auth import requires_auth
-from io import StringIO
-import csv
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -39,6 +37,8 @@ def api_get_failures():
         - reason: Filter by failure reason
         - limit: Items per page (default 50)
         - offset: Pagination offset
+        - cursor: next_cursor from the previous page (optional, replaces
+          offset; failure_date sort only)
         - sort: Sort column (failure_date, song_title, artist_name, failure_reason, search_attempts)
         - direction: Sort direction (asc, desc)
     """
@@ -50,6 +50,7 @@ def api_get_failures():
     failure_reason = request.args.get('reason')
     limit = int(request.args.get('limit', 50))
     offset = int(request.args.get('offset', 0))
+    after = request.args.get('cursor')
     sort = request.args.get('sort', 'failure_date')
     direction = request.args.get('direction', 'desc')
 
@@ -80,7 +81,8 @@ def api_get_failures():
             resolved=resolved,
             failure_reason=failure_reason,
             sort=sort,
-            direction=direction
+            direction=direction,
+            after=after
         )
 
         total = plex_failures.get_failure_count(
@@ -93,8 +95,11 @@ def api_get_failures():
             'failures': failures,
             'total': total,
             'limit': limit,
-            'offset': offset
+            'offset': offset,
+            'next_cursor': plex_failures.failure_page_cursor(failures, limit) if sort == 'failure_date' else None
         })
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     finally:
         cursor.close()
 
@@ -307,43 +312,11 @@ def api_export_failures():
     elif resolved_param == 'false':
         resolved = False
 
+    from radio_monitor.database import plex_failures
+
     cursor = db.get_cursor()
     try:
-        from radio_monitor.database import plex_failures
-
-        # Create CSV in memory
-        output = StringIO()
-        writer = csv.writer(output)
-
-        # Write header
-        writer.writerow([
-            'Failure ID', 'Artist', 'Song Title', 'Failure Date',
-            'Failure Reason', 'Search Attempts', 'Search Terms',
-            'Resolved', 'Resolved At', 'Playlist'
-        ])
-
-        # Get failures
-        failures = plex_failures.get_failures(
-            cursor,
-            limit=10000,  # Large limit for export
-            offset=0,
-            resolved=resolved
-        )
-
-        # Write data
-        for failure in failures:
-            writer.writerow([
-                failure['id'],
-                failure['song']['artist_name'] if failure['song'] else '',
-                failure['song']['song_title'] if failure['song'] else '',
-                failure['failure_date'],
-                failure['failure_reason'],
-                failure['search_attempts'],
-                str(failure['search_terms']) if failure['search_terms'] else '',
-                'Yes' if failure['resolved'] else 'No',
-                failure['resolved_at'] or '',
-                failure['playlist']['name'] if failure.get('playlist') else ''
-            ])
+        count = plex_failures.get_failure_count(cursor, resolved=resolved, days=days)
 
         # Log activity
         from radio_monitor.database import activity
@@ -351,26 +324,31 @@ def api_export_failures():
             cursor,
             event_type='plex_failures_export',
             title='Plex Failures Exported',
-            description=f'Exported {len(failures)} failures to CSV',
-            metadata={'count': len(failures), 'resolved_filter': resolved_param},
+            description=f'Exported {count} failures to CSV',
+            metadata={'count': count, 'resolved_filter': resolved_param},
             severity='info',
             source='user'
         )
         db.conn.commit()
-
-        # Create file response
-        output.seek(0)
-        filename = f'plex_failures_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
-
-        return send_file(
-            output,
-            mimetype='text/csv',
-            as_attachment=True,
-            download_name=filename
-        )
     finally:
         cursor.close()
 
+    def generate():
+        # Stream the CSV in batches instead of building it in memory
+        export_cursor = db.get_cursor()
+        try:
+            yield from plex_failures.iter_failures_csv(export_cursor, resolved=resolved, days=days)
+        finally:
+            export_cursor.close()
+
+    filename = f'plex_failures_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/csv',
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
+
 
 @plex_failures_bp.route('/api/failures/clear-all', methods=['POST'])
 @requires_auth
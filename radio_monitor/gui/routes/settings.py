@@ -547,6 +547,7 @@ def api_vacuum_database():
         global _vacuum_status
         import sqlite3
         from radio_monitor.backup import backup_database
+        from radio_monitor.database.schema import rebuild_artists_fts
 
         try:
             # Get database file path
@@ -583,6 +584,8 @@ def api_vacuum_database():
             # Perform vacuum
             conn = sqlite3.connect(db_file)
             conn.execute('VACUUM')
+            rebuild_artists_fts(conn)
+            conn.commit()
             conn.close()
 
             # Get file size after vacuum
@@ -134,6 +134,8 @@ def api_songs():
     # Get query parameters
     page = int(request.args.get('page', 1))
     limit = int(request.args.get('limit', 50))
+    after = request.args.get('cursor', '')  # next_cursor from the previous page
+    include_total = request.args.get('include_total', '1') != '0'
     search = request.args.get('search', '')
     artist_name = request.args.get('artist_name', '')
     station_id = request.args.get('station_id', '')
@@ -175,7 +177,10 @@ def api_songs():
     # Get songs
     cursor = db.get_cursor()
     try:
-        result = get_songs_paginated(cursor, page, limit, filters, sort, direction)
+        result = get_songs_paginated(cursor, page, limit, filters, sort, direction, after=after or None,
+                                     include_total=include_total)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     finally:
         cursor.close()
 
@@ -185,7 +190,8 @@ def api_songs():
             'page': page,
             'pages': result['pages'],
             'total': result['total'],
-            'limit': limit
+            'limit': limit,
+            'next_cursor': result['next_cursor']
         }
     })
 
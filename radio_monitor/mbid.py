@@ -3,7 +3,7 @@ MBID Lookup module for Radio Monitor 1.0
 
 This module handles MusicBrainz API lookups for artist MBIDs:
 - MusicBrainz API client with proper User-Agent (contact info required)
-- Rate limiting: 1 request/second (well under MusicBrainz's 50/sec limit)
+- Rate limiting: shared 1 request/second limiter, backs off on HTTP 503
 - Database caching (avoid repeated lookups)
 - Error handling with retry (10 retries with exponential backoff)
 - Retry logic for failed lookups
@@ -24,6 +24,8 @@ import ssl
 import re
 from difflib import SequenceMatcher
 
+from radio_monitor.ratelimit import musicbrainz_limiter, parse_retry_after, MUSICBRAINZ_MAX_503_RETRIES
+
 # Get logger (will be configured properly in Phase 8)
 logger = logging.getLogger(__name__)
 
@@ -275,7 +277,8 @@ def safe_collaboration_match(our_collaboration, their_artist, threshold=NAME_SIM
 # ==================== END SAFE MATCHING FUNCTIONS ====================
 
 
-def lookup_artist_mbid(artist_name, db, user_agent=None, max_retries=10, auto_retry_pending=True):
+def lookup_artist_mbid(artist_name, db, user_agent=None, max_retries=MUSICBRAINZ_MAX_503_RETRIES,
+                      auto_retry_pending=True):
     """Look up artist MBID from MusicBrainz API with caching and retry logic
 
     This function implements a multi-tier lookup strategy:
@@ -303,8 +306,8 @@ def lookup_artist_mbid(artist_name, db, user_agent=None, max_retries=10, auto_re
         3. If exists and has PENDING MBID → auto-retry lookup
         4. If exists but MBID is NULL → retry lookup
         5. If not in database → query MusicBrainz API
-        6. On connection error: retry quickly (0.7s, 0.9s, 1.1s, 1.3s... increasing)
-        7. Rate limit: 1 second between requests (0.5s before + 0.5s after)
+        6. On connection error: retry with exponential backoff; on HTTP 503 back off 2s..60s
+        7. Rate limit: shared limiter, 1 request/second across all callers
         8. Short timeout (5s) - fail fast on connection issues
         9. Validate artist name with fuzzy matching (80% threshold)
         10. Return (MBID, verified_name) or (None, None) if not found
@@ -352,14 +355,9 @@ def lookup_artist_mbid(artist_name, db, user_agent=None, max_retries=10, auto_re
     # Retry loop for connection errors
     for attempt in range(max_retries):
         try:
-            # Add delay before request to avoid overwhelming MusicBrainz
-            # MusicBrainz allows 50/sec with proper User-Agent, we use 1/sec to be safe
-            if attempt > 0:
-                # For retries, use exponential backoff (fail fast, retry more)
-                time.sleep(0.5 + (attempt * 0.2))  # 0.7s, 0.9s, 1.1s, 1.3s...
-            else:
-                # First attempt - minimal delay to space out requests
-                time.sleep(0.5)
+            # Wait for a send slot on the shared MusicBrainz limiter (1 req/sec per IP)
+            # Only the send is gated - response waits overlap with other work
+            musicbrainz_limiter.acquire()
 
             # Create SSL context with proper certificate verification
             # MusicBrainz requires valid SSL certificates
@@ -369,10 +367,6 @@ def lookup_artist_mbid(artist_name, db, user_agent=None, max_retries=10, auto_re
 
             # Shorter timeout (5s) - fail fast if connection is bad
             with urllib.request.urlopen(req, timeout=5, context=ssl_context) as response:
-                # Rate limiting - wait after successful request
-                # (Total delay: 0.5s before + 0.5s after = 1 second between requests)
-                time.sleep(0.5)
-
                 if response.status == 200:
                     data = json.loads(response.read().decode('utf-8'))
 
@@ -586,6 +580,16 @@ def lookup_artist_mbid(artist_name, db, user_agent=None, max_retries=10, auto_re
                     logger.error(f"MusicBrainz API error for {artist_name}: HTTP {response.status}")
                     return None, None
 
+        except urllib.error.HTTPError as e:
+            # HTTP 503 = MusicBrainz rate limit / overload - back off and retry
+            if e.code == 503 and attempt < max_retries - 1:
+                delay = musicbrainz_limiter.backoff(attempt, parse_retry_after(e.headers.get('Retry-After')))
+                logger.warning(f"MusicBrainz overloaded (HTTP 503) for {artist_name} (attempt {attempt + 1}/{max_retries}), backing off {delay:.0f}s")
+                continue
+
+            logger.error(f"MusicBrainz API request failed for {artist_name}: {e}")
+            return None, None
+
         except urllib.error.URLError as e:
             # SSL, EOF, and connection errors - retry with exponential backoff
             if 'SSL' in str(e) or 'EOF' in str(e) or '10054' in str(e) or 'forcibly closed' in str(e).lower():
@@ -618,6 +622,104 @@ def lookup_artist_mbid(artist_name, db, user_agent=None, max_retries=10, auto_re
     return None, None
 
 
+def _lucene_phrase(text):
+    """Quote text as a Lucene phrase (escapes backslashes and double quotes)"""
+    return '"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def lookup_artist_mbids_batch(artist_names, user_agent=None, max_retries=MUSICBRAINZ_MAX_503_RETRIES,
+                              with_names=False):
+    """Look up several artist names with a single MusicBrainz search request
+
+    Builds one Lucene query of the form artist:("A" OR "B" OR "C") instead of
+    one request per name, which matters because MusicBrainz only allows one
+    request per second. Each name is matched against the combined results with
+    the same rules as lookup_artist_mbid (exact match first, then
+    safe_artist_match). No database updates are made.
+
+    Args:
+        artist_names: List of artist names to look up
+        user_agent: Custom User-Agent string (optional)
+        max_retries: Maximum retries after HTTP 503 (default: 10)
+        with_names: Map to (mbid, verified_name) tuples instead of bare MBIDs
+
+    Returns:
+        Dict mapping {artist_name: mbid or None}, or None if the request
+        failed (callers should fall back to lookup_artist_mbid). The search
+        only returns the top 100 hits, so a name can be crowded out by the
+        others; callers should also run lookup_artist_mbid for None entries.
+    """
+    names = list(dict.fromkeys(name for name in artist_names if name and name.strip()))
+    if not names:
+        return {}
+
+    from urllib.parse import quote
+    query = 'artist:(' + ' OR '.join(_lucene_phrase(name) for name in names) + ')'
+    url = f"https://musicbrainz.org/ws/2/artist/?query={quote(query, safe='')}&fmt=json&limit=100"
+
+    headers = {
+        'User-Agent': user_agent or 'RadioMonitor/1.0.0 (https://github.com/allurjj/radio-monitor)'
+    }
+
+    data = None
+    for attempt in range(max_retries):
+        try:
+            musicbrainz_limiter.acquire()
+            ssl_context = ssl.create_default_context()
+            req = urllib.request.Request(url, headers=headers)
+
+            with urllib.request.urlopen(req, timeout=10, context=ssl_context) as response:
+                data = json.loads(response.read().decode('utf-8'))
+            break
+
+        except urllib.error.HTTPError as e:
+            if e.code == 503 and attempt < max_retries - 1:
+                delay = musicbrainz_limiter.backoff(attempt, parse_retry_after(e.headers.get('Retry-After')))
+                logger.warning(f"MusicBrainz overloaded (HTTP 503) for batch lookup (attempt {attempt + 1}/{max_retries}), backing off {delay:.0f}s")
+                continue
+
+            logger.error(f"MusicBrainz batch lookup failed: {e}")
+            return None
+
+        except Exception as e:
+            logger.error(f"MusicBrainz batch lookup failed: {e}")
+            return None
+
+    if data is None:
+        return None
+
+    candidates = [(result['id'], result.get('name', '')) for result in data.get('artists', [])]
+    results = {}
+
+    for artist_name in names:
+        lowered = artist_name.lower()
+        match = next(((mbid, name) for mbid, name in candidates if name.lower() == lowered), None)
+
+        if match is None:
+            best_mbid = None
+            best_similarity = 0.0
+            for mbid, name in candidates:
+                similarity = calculate_similarity(artist_name, name)
+                if similarity > best_similarity:
+                    best_similarity = similarity
+                    best_mbid, best_name = mbid, name
+
+            if best_mbid and best_similarity >= NAME_SIMILARITY_THRESHOLD:
+                is_safe, reason = safe_artist_match(artist_name, best_name, NAME_SIMILARITY_THRESHOLD)
+                if is_safe:
+                    match = (best_mbid, best_name)
+                    logger.debug(f"Batch match: {artist_name} -> {best_name} ({best_similarity:.1%}, {reason})")
+
+        if with_names:
+            results[artist_name] = match or (None, None)
+        else:
+            results[artist_name] = match[0] if match else None
+
+    matched = sum(1 for artist_name in names if (results[artist_name][0] if with_names else results[artist_name]))
+    logger.debug(f"Batch MBID lookup: {matched}/{len(names)} names matched in one request")
+    return results
+
+
 def batch_lookup_mbids(artist_names, db, user_agent=None):
     """Look up multiple artists in batch (with rate limiting)
 
@@ -795,8 +897,8 @@ def verify_mbid_exists(mbid, user_agent=None):
     }
 
     try:
-        # Add delay to respect rate limiting
-        time.sleep(0.5)
+        # Respect the shared MusicBrainz rate limit
+        musicbrainz_limiter.acquire()
 
         # Create SSL context
         ssl_context = ssl.create_default_context()
@@ -805,9 +907,6 @@ def verify_mbid_exists(mbid, user_agent=None):
 
         # Query MusicBrainz API
         with urllib.request.urlopen(req, timeout=5, context=ssl_context) as response:
-            # Rate limiting - wait after successful request
-            time.sleep(0.5)
-
             if response.status == 200:
                 data = json.loads(response.read().decode('utf-8'))
 
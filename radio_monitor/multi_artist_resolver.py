@@ -14,7 +14,7 @@ Key Features:
 import re
 import logging
 from typing import List, Dict, Tuple, Optional
-from radio_monitor.mbid import lookup_artist_mbid
+from radio_monitor.mbid import lookup_artist_mbid, lookup_artist_mbids_batch
 from radio_monitor.database.crud import update_multi_artist_resolution
 
 logger = logging.getLogger(__name__)
@@ -287,6 +287,24 @@ def try_musicbrainz_search(
             artists_needing_api.append(artist_name)
 
         # Second pass: Only query MusicBrainz for artists not found locally
+        # Several names are resolved with one batched search request
+        if len(artists_needing_api) > 1:
+            batch_results = lookup_artist_mbids_batch(artists_needing_api, user_agent=user_agent)
+            if batch_results is not None:
+                batch_misses = []
+                for artist_name in artists_needing_api:
+                    mbid = batch_results.get(artist_name)
+                    if mbid:
+                        results[artist_name] = mbid
+                        cache[artist_name] = mbid
+                        logger.debug(f"[API BATCH] Found MBID for '{artist_name}': {mbid}")
+                    else:
+                        # The combined search only returns the top hits, so a
+                        # miss may just be crowded out - look it up on its own
+                        logger.debug(f"[API BATCH] No MBID found for '{artist_name}', trying single lookup")
+                        batch_misses.append(artist_name)
+                artists_needing_api = batch_misses
+
         for artist_name in artists_needing_api:
             try:
                 mbid, verified_name = lookup_artist_mbid(
@@ -25,9 +25,39 @@ Purpose: Test normalization impact on Lidarr and Plex matching
 
 import re
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Misinterpreted UTF-8 apostrophe: 'â' followed by a C1 control character
+_CP1252_APOSTROPHE_RE = re.compile(r'\xe2[\x80-\x9f]')
+
+# Capital letter directly after an apostrophe (AIN'T -> Ain'T needs fixing)
+_CONTRACTION_RE = re.compile(r"'([A-Z])")
+
+# One-to-one character fixes applied with str.translate() (single C pass)
+# Apostrophe variants -> '
+# Curly quotes (U+2018/U+2019/U+201B) are deliberately NOT folded: stored song
+# titles and artist names keep them, and folding would change existing keys.
+# Plex matching copes via normalize_text_aggressive(), which drops them.
+_APOSTROPHE_FOLD = {
+    0x00B4: "'",  # Acute accent
+    0x0060: "'",  # Backtick (grave accent)
+}
+# Unicode dashes/hyphens -> -
+_DASH_FOLD = dict.fromkeys(range(0x2010, 0x2016), '-')
+# Both at once, so apostrophes and dashes are fixed in one scan
+_CHAR_FOLD = {**_APOSTROPHE_FOLD, **_DASH_FOLD}
+
+# Aggressive normalization: anything that isn't a word character, space or
+# apostrophe is removed (apostrophes are dropped right after)
+_NON_WORD_RE = re.compile(r"[^\w\s']")
+# ASCII fast path: the same characters (punctuation and control characters)
+# plus the apostrophe, deleted via str.translate()
+_AGGRESSIVE_DELETE = dict.fromkeys(
+    code for code in range(128) if chr(code) == "'" or _NON_WORD_RE.match(chr(code))
+)
+
 
 def fix_encoding_corruption(text):
     """Fix common encoding corruption from misinterpreted UTF-8 bytes
@@ -72,14 +102,14 @@ def fix_encoding_corruption(text):
     # Fix already-misinterpreted Windows-1252 patterns
     # When UTF-8 bytes are read as Windows-1252: 0xE2 = â, 0x80 = control, 0x99 = ™
     # The pattern â followed by control chars needs to be converted to apostrophe
-    text = re.sub(r'\xe2[\x80\x81\x82\x83\x84\x85\x86\x87\x88\x89\x8a\x8b\x8c\x8d\x8e\x8f\x90\x91\x92\x93\x94\x95\x96\x97\x98\x99\x9a\x9b\x9c\x9d\x9e\x9f]', "'", text)
+    text = _CP1252_APOSTROPHE_RE.sub("'", text)
 
     return text
 
 
 # Known acronyms and stylized names that should stay ALL CAPS
 # These are common in music and should be preserved
-CAPS_EXCEPTIONS = {
+CAPS_EXCEPTIONS = frozenset({
     'ABBA', 'ACDC',
     'B2K', 'BTS', 'BIGBANG',
     'CNR',
@@ -100,10 +130,10 @@ CAPS_EXCEPTIONS = {
     'UB40',
     'XTC',
     'ZZ Top',
-}
+})
 
 # Common words that should NOT stay ALL CAPS even if short
-COMMON_WORDS = {
+COMMON_WORDS = frozenset({
     'THE', 'AND', 'BUT', 'FOR', 'NOR', 'OR', 'SO', 'YET',
     'MY', 'YOUR', 'HIS', 'HER', 'ITS', 'OUR', 'THEIR',
     'THIS', 'THAT', 'THESE', 'THOSE',
@@ -115,12 +145,30 @@ COMMON_WORDS = {
     'NOT', 'NO', 'YES',
     'FUN', 'BIG', 'BOI', 'BOY', 'CRY', 'HEY', 'NOR', 'NOW', 'OUT', 'SAY', 'SEE', 'WAY',  # Common short words in titles
     'FEAT', 'FT', 'FEATURING',  # Common abbreviations
+})
+
+# Known artist stylizations, applied to the fully normalized text
+# (keys are exact matches, e.g. both all-caps and title-case PINK -> P!NK)
+ARTIST_STYLIZATIONS = {
+    'PINK': 'P!NK',
+    'Pink': 'P!NK',
+    'Acdc': 'ACDC',
 }
 
+# A single word (text is already whitespace-normalized at this point)
+_WORD_RE = re.compile(r'\S+')
+
+# Standalone roman numeral (I, II, III, IV, V, ...)
+_ROMAN_NUMERAL_RE = re.compile(r'^[IVX]+$')
+
 
+@lru_cache(maxsize=4096)
 def should_preserve_caps(text):
     """Check if ALL CAPS text should be preserved
 
+    Results are cached: the same tokens (MY, THE, LOVE, ...) recur across
+    nearly every all-caps title.
+
     Args:
         text: Text to check (should be ALL CAPS)
 
@@ -149,7 +197,7 @@ def should_preserve_caps(text):
     # Check for roman numerals FIRST (before common words)
     # Only if it's a standalone roman numeral (I, II, III, IV, V, etc.)
     # This ensures "I" is recognized as a roman numeral, not a common word
-    if re.match(r'^[IVX]+$', text):
+    if _ROMAN_NUMERAL_RE.match(text):
         return True
 
     # Check against common words (they should NOT be preserved)
@@ -180,6 +228,20 @@ def should_preserve_caps(text):
     return False
 
 
+def _title_case_word(match):
+    """Title-case one ALL CAPS word matched by _WORD_RE
+
+    Words that should_preserve_caps() (roman numerals, etc.) are kept as-is.
+    Otherwise only the first letter is capitalized, so "SK8ER" becomes
+    "Sk8er" rather than "Sk8Er".
+    """
+    word = match.group(0)
+    if should_preserve_caps(word):
+        return word
+    word_lower = word.lower()
+    return word_lower[0].upper() + word_lower[1:]
+
+
 def normalize_text(text, preserve_caps=False):
     """Normalize text for storage and matching
 
@@ -217,10 +279,18 @@ def normalize_text(text, preserve_caps=False):
         'R.E.M.'  # Preserved
 
     Note: This is the SAFE normalization for production use.
+    Results are cached (the same artists and titles repeat all day);
+    empty/None input returns "" without touching the cache.
     """
     if not text:
         return ""
 
+    return _normalize_text_cached(text, bool(preserve_caps))
+
+
+@lru_cache(maxsize=8192)
+def _normalize_text_cached(text, preserve_caps):
+    """Cached body of normalize_text() (text must be a non-empty string)"""
     # Rule 0: Fix encoding corruption (MUST BE FIRST)
     # This fixes corrupted UTF-8 bytes before any other processing
     text = fix_encoding_corruption(text)
@@ -228,20 +298,17 @@ def normalize_text(text, preserve_caps=False):
     # Rule 1: Trim whitespace
     text = text.strip()
 
-    # Rule 2 & 3: Unify apostrophes and remove double apostrophes
-    # Convert all apostrophe variants to standard '
-    # Includes U+2019 (right single quote) used by Plex!
-    text = re.sub(r"[''''´`]", "'", text)
-    # Remove double apostrophes
+    # Rule 2 & 3.5: Unify apostrophes and unicode dashes in one pass
+    # Apostrophe variants (acute accent, backtick) → '
+    # Unicode dashes (U+2010..U+2015) → - (fixes All‐4‐One → All-4-One)
+    # Most radio metadata is plain ASCII, where only the backtick can occur
+    if text.isascii():
+        text = text.replace('`', "'")
+    else:
+        text = text.translate(_CHAR_FOLD)
+    # Rule 3: Remove double apostrophes
     text = text.replace("''", "'")
 
-    # Rule 3.5: Unify unicode dashes/hyphens to ASCII hyphen
-    # This fixes: All‐4‐One → All-4-One (U+2010 → U+002D)
-    # Converts various unicode dash characters to standard ASCII hyphen
-    # U+2010 (hyphen), U+2011 (non-breaking hyphen), U+2012 (figure dash),
-    # U+2013 (en dash), U+2014 (em dash), U+2015 (horizontal bar)
-    text = re.sub(r"[‐‑‒–—―]", '-', text)
-
     # Rule 4: Normalize whitespace
     # Multiple spaces, tabs, newlines → single space
     text = ' '.join(text.split())
@@ -253,45 +320,18 @@ def normalize_text(text, preserve_caps=False):
             # Fix contractions BEFORE calling .title()
             # This prevents "AIN'T" -> "Ain'T"
             # We need to lowercase the letter AFTER the apostrophe
-            text = re.sub(r"'([A-Z])", lambda m: "'" + m.group(1).lower(), text)
+            text = _CONTRACTION_RE.sub(lambda m: "'" + m.group(1).lower(), text)
 
             # Apply title case word-by-word to preserve Roman numerals
-            words = text.split()
-            normalized_words = []
-
-            for word in words:
-                # Check if this word should be preserved (roman numeral, etc.)
-                if should_preserve_caps(word):
-                    # Keep it as-is
-                    normalized_words.append(word)
-                else:
-                    # Custom title case: only capitalize first letter
-                    # This prevents "SK8ER" -> "Sk8Er" and gives "Sk8er" instead
-                    word_lower = word.lower()
-                    if word_lower:
-                        # Capitalize only the first character
-                        word_title = word_lower[0].upper() + word_lower[1:]
-                        normalized_words.append(word_title)
-                    else:
-                        normalized_words.append(word_lower)
-
-            text = ' '.join(normalized_words)
+            text = _WORD_RE.sub(_title_case_word, text)
 
             # Final pass: fix any remaining capital letters after apostrophes
             # This catches cases like "Ain'T" -> "Ain't"
-            text = re.sub(r"'([A-Z])", lambda m: "'" + m.group(1).lower(), text)
+            text = _CONTRACTION_RE.sub(lambda m: "'" + m.group(1).lower(), text)
 
     # Rule 7: Fix known artist stylizations
     # These are corrections after normalization
-    # Handle PINK -> P!NK (both all-caps and title-case versions)
-    if text == "PINK":
-        text = "P!NK"
-    elif text == "Pink":
-        text = "P!NK"
-    elif text == "Acdc":
-        text = "ACDC"
-
-    return text
+    return ARTIST_STYLIZATIONS.get(text, text)
 
 
 def normalize_text_aggressive(text):
@@ -327,11 +367,13 @@ def normalize_text_aggressive(text):
     # First apply conservative normalization
     text = normalize_text(text)
 
-    # Remove punctuation except apostrophes
-    text = re.sub(r"[^\w\s']", '', text)
-
-    # Remove apostrophes too (for aggressive matching)
-    text = text.replace("'", "")
+    # Remove punctuation and apostrophes (for aggressive matching)
+    if text.isascii():
+        # Single translate pass with a delete table, no regex needed
+        text = text.translate(_AGGRESSIVE_DELETE)
+    else:
+        text = _NON_WORD_RE.sub('', text)
+        text = text.replace("'", "")
 
     # Convert to lowercase
     text = text.lower()
@@ -419,9 +461,7 @@ def handle_special_hyphens(text):
         return ""
 
     # Convert all unicode dashes/hyphens to ASCII hyphen
-    text = re.sub(r"[‐‑‒–—―]", '-', text)
-
-    return text
+    return text.translate(_DASH_FOLD)
 
 
 def handle_special_apostrophes(text):
@@ -449,13 +489,9 @@ def handle_special_apostrophes(text):
     if not text:
         return ""
 
-    # Convert all apostrophe variants to standard ASCII apostrophe
-    text = re.sub(r"[''´`]", "'", text)
-
-    # Handle double apostrophes
-    text = text.replace("''", "'")
-
-    return text
+    # Convert all apostrophe variants to standard ASCII apostrophe,
+    # then handle double apostrophes
+    return text.translate(_APOSTROPHE_FOLD).replace("''", "'")
 
 
 def normalize_with_edge_cases(text):
@@ -484,9 +520,11 @@ def normalize_with_edge_cases(text):
     if not text:
         return ""
 
-    # Handle special characters first
-    text = handle_special_apostrophes(text)
-    text = handle_special_hyphens(text)
+    # Handle special characters first (plain ASCII has none to replace,
+    # and normalize_text() below already unifies backticks). Same result as
+    # handle_special_apostrophes() + handle_special_hyphens() in one pass.
+    if not text.isascii():
+        text = text.translate(_CHAR_FOLD).replace("''", "'")
 
     # Apply standard normalization
     text = normalize_text(text)
@@ -563,6 +601,33 @@ def detect_collaboration(artist_name):
     return False, [artist_name]
 
 
+# Collaboration split strategies, tried in order: (marker pattern, marker name)
+_COLLABORATION_SPLITS = [
+    # Strategy 1: Feat/ft/featuring
+    (r'\s+(?:feat|ft\.|featuring)\s+', 'feat'),
+
+    # Strategy 2: & (ampersand)
+    (r'\s+\&\s+', '&'),
+
+    # Strategy 3: + (plus)
+    (r'\s+\+\s+', '+'),
+
+    # Strategy 4: X (collaboration marker)
+    (r'\s+x\s+', 'x'),
+
+    # Strategy 5: And (only lowercase "and" in artist names)
+    (r'\s+and\s+', 'and'),
+]
+# Compiled once: (search in lowercased text, case-insensitive split, marker)
+_COLLABORATION_SPLIT_RES = [
+    (re.compile(pattern), re.compile(pattern, re.IGNORECASE), marker)
+    for pattern, marker in _COLLABORATION_SPLITS
+]
+
+# Trailing "feat. ..." left on a split part
+_TRAILING_FEAT_RE = re.compile(r'\s+(?:feat|ft\.?|featuring).*$', re.IGNORECASE)
+
+
 def split_collaboration_artists(artist_name):
     """Split collaboration artist string into individual artists
 
@@ -579,28 +644,11 @@ def split_collaboration_artists(artist_name):
     normalized = normalize_with_edge_cases(artist_name)
 
     # Try different splitting strategies in order
-    strategies = [
-        # Strategy 1: Feat/ft/featuring
-        (r'\s+(?:feat|ft\.|featuring)\s+', 'feat'),
-
-        # Strategy 2: & (ampersand)
-        (r'\s+\&\s+', '&'),
-
-        # Strategy 3: + (plus)
-        (r'\s+\+\s+', '+'),
-
-        # Strategy 4: X (collaboration marker)
-        (r'\s+x\s+', 'x'),
-
-        # Strategy 5: And (only lowercase "and" in artist names)
-        (r'\s+and\s+', 'and'),
-    ]
-
-    import re
-    for pattern, marker in strategies:
-        if re.search(pattern, normalized.lower()):
+    normalized_lower = normalized.lower()
+    for search_re, split_re, marker in _COLLABORATION_SPLIT_RES:
+        if search_re.search(normalized_lower):
             # Split using this pattern
-            parts = re.split(pattern, normalized, flags=re.IGNORECASE)
+            parts = split_re.split(normalized)
 
             # Clean up each part
             artists = []
@@ -608,7 +656,7 @@ def split_collaboration_artists(artist_name):
                 part = part.strip()
                 if part and len(part) >= 2:  # Minimum length check
                     # Remove common trailing markers like "feat." or "ft."
-                    part = re.sub(r'\s+(?:feat|ft\.?|featuring).*$', '', part, flags=re.IGNORECASE)
+                    part = _TRAILING_FEAT_RE.sub('', part)
                     part = part.strip()
                     if part and len(part) >= 2:
                         artists.append(part)
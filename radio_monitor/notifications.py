@@ -32,15 +32,59 @@ Notification Triggers:
 import json
 import logging
 import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
-from typing import Dict, Any, Optional, List
-import urllib.request
-import urllib.parse
+from typing import Callable, Dict, Any, Optional, List
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from radio_monitor.ratelimit import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Timeout (seconds) for provider HTTP requests
+HTTP_TIMEOUT = 10
+
+# Shared HTTP session for all providers (created on first use)
+_http_session = None
+_http_session_lock = threading.Lock()
+
+# Maximum providers notified in parallel for one event
+MAX_DELIVERY_WORKERS = 8
+
+# Provider rate limits: type -> (config key identifying the endpoint,
+# requests per second, burst). Each endpoint gets its own limiter.
+PROVIDER_RATE_LIMITS = {
+    'discord': ('webhook_url', 0.5, 5),     # 30 requests/minute per webhook
+    'slack': ('webhook_url', 1.0, 1),       # 1 message/second per webhook
+    'telegram': ('bot_token', 30.0, 30),    # 30 messages/second per bot
+}
+
+# Rate limiters by (notification type, endpoint), created on first use
+_provider_limiters = {}
+_provider_limiters_lock = threading.Lock()
+
+# Circuit breaker: after this many consecutive failures a notification is
+# skipped for CIRCUIT_COOLDOWN seconds, then a single probe send is allowed
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_COOLDOWN = 60
+
+# Circuit breakers by notification ID, created on first use
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+# Seconds an authenticated SMTP connection may sit idle before it is closed
+SMTP_IDLE_TIMEOUT = 60
+
+# Idle SMTP connections: (server, port, username) -> [(smtplib.SMTP, last used), ...]
+_smtp_pool = {}
+_smtp_pool_lock = threading.Lock()
+
 # Notification trigger definitions
 NOTIFICATION_TRIGGERS = {
     'on_scrape_complete': 'Scrape Completed',
@@ -54,6 +98,227 @@ NOTIFICATION_TRIGGERS = {
     'on_system_error': 'System Error'
 }
 
+# Severity lookup tables shared by the handlers (built once, not per send)
+SEVERITY_COLORS = {
+    'info': '#3498db',      # Blue
+    'success': '#2ecc71',   # Green
+    'warning': '#f39c12',   # Orange
+    'error': '#e74c3c',     # Red
+    'critical': '#8e44ad'   # Purple
+}
+
+# Discord embeds take colors as integers
+DISCORD_SEVERITY_COLORS = {severity: int(color[1:], 16) for severity, color in SEVERITY_COLORS.items()}
+
+SEVERITY_EMOJIS = {
+    'info': 'ℹ️',
+    'success': '✅',
+    'warning': '⚠️',
+    'error': '❌',
+    'critical': '🚨'
+}
+
+# Gotify priority (1-10)
+GOTIFY_SEVERITY_PRIORITY = {
+    'info': 5,
+    'success': 4,
+    'warning': 7,
+    'error': 9,
+    'critical': 10
+}
+
+# Ntfy priority (1-5)
+NTFY_SEVERITY_PRIORITY = {
+    'info': 3,
+    'success': 2,
+    'warning': 4,
+    'error': 5,
+    'critical': 5
+}
+
+# Pushover/Prowl priority (-2 to 2)
+PUSH_SEVERITY_PRIORITY = {
+    'info': 0,
+    'success': -1,
+    'warning': 1,
+    'error': 1,
+    'critical': 2
+}
+
+BOXCAR_SEVERITY_SOUNDS = {
+    'info': 'notifier-2',
+    'success': 'magic-1',
+    'warning': 'warning-1',
+    'error': 'glass',
+    'critical': 'alarm'
+}
+
+
+def get_http_session() -> requests.Session:
+    """Get the HTTP session shared by all notification handlers
+
+    Handlers are created per notification, so the session lives at module
+    level. Keep-alive connections to each provider host are reused across
+    notifications instead of paying a TCP + TLS handshake for every send.
+
+    Returns:
+        requests.Session with a pooled adapter mounted for http/https
+    """
+    global _http_session
+
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _http_session = session
+
+    return _http_session
+
+
+def _close_smtp(server: smtplib.SMTP):
+    """Close an SMTP connection, ignoring errors from an already-dead link"""
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+
+def _checkout_smtp(key: tuple) -> Optional[smtplib.SMTP]:
+    """Take an idle pooled SMTP connection, closing any that have expired
+
+    Args:
+        key: (server, port, username)
+
+    Returns:
+        Authenticated smtplib.SMTP, or None if no usable connection is idle
+    """
+    now = time.monotonic()
+    server = None
+    expired = []
+
+    with _smtp_pool_lock:
+        idle = _smtp_pool.get(key, [])
+        while idle:
+            candidate, last_used = idle.pop()
+            if now - last_used < SMTP_IDLE_TIMEOUT:
+                server = candidate
+                break
+            expired.append(candidate)
+
+    for candidate in expired:
+        _close_smtp(candidate)
+
+    return server
+
+
+def _checkin_smtp(key: tuple, server: smtplib.SMTP):
+    """Return an SMTP connection to the pool for reuse"""
+    with _smtp_pool_lock:
+        _smtp_pool.setdefault(key, []).append((server, time.monotonic()))
+
+
+def close_smtp_connections():
+    """Close all idle pooled SMTP connections"""
+    with _smtp_pool_lock:
+        idle = [server for servers in _smtp_pool.values() for server, _ in servers]
+        _smtp_pool.clear()
+
+    for server in idle:
+        _close_smtp(server)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one notification endpoint
+
+    Closed: sends go through. After `threshold` consecutive failures it opens
+    and sends are skipped (no connect/timeout cost) until `cooldown` seconds
+    pass; then one probe is let through (half-open). The probe's result
+    closes the breaker again or restarts the cooldown.
+    """
+
+    def __init__(self, threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 cooldown: float = CIRCUIT_COOLDOWN,
+                 clock: Callable[[], float] = time.monotonic):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Check whether a send may be attempted now"""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+
+            now = self._clock()
+            if now - self.opened_at >= self.cooldown:
+                # Half-open: admit one probe, hold everyone else until it reports
+                self.opened_at = now
+                return True
+
+            return False
+
+    def record(self, success: bool):
+        """Record the outcome of an attempted send"""
+        with self._lock:
+            if success:
+                self.failures = 0
+                self.opened_at = None
+            else:
+                self.failures += 1
+                if self.failures >= self.threshold:
+                    self.opened_at = self._clock()
+
+
+def get_circuit_breaker(notification_id: int) -> CircuitBreaker:
+    """Get the circuit breaker for a configured notification
+
+    Args:
+        notification_id: Notification ID
+
+    Returns:
+        CircuitBreaker for that notification
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(notification_id)
+        if breaker is None:
+            breaker = CircuitBreaker()
+            _breakers[notification_id] = breaker
+
+    return breaker
+
+
+def get_provider_limiter(notification_type: str, config: Dict[str, Any]) -> Optional[RateLimiter]:
+    """Get the rate limiter for a provider endpoint
+
+    Args:
+        notification_type: Type of notification (discord, slack, telegram, ...)
+        config: Provider configuration
+
+    Returns:
+        RateLimiter shared by all sends to the same endpoint, or None if the
+        provider has no published limit
+    """
+    limits = PROVIDER_RATE_LIMITS.get(notification_type)
+    if not limits:
+        return None
+
+    endpoint_key, rate, burst = limits
+    key = (notification_type, config.get(endpoint_key))
+
+    with _provider_limiters_lock:
+        limiter = _provider_limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(rate=rate, burst=burst)
+            _provider_limiters[key] = limiter
+
+    return limiter
+
 
 class NotificationHandler:
     """Base class for notification handlers"""
@@ -106,15 +371,7 @@ class DiscordHandler(NotificationHandler):
             logger.error("Discord webhook URL not configured")
             return False
 
-        # Map severity to colors
-        colors = {
-            'info': 0x3498db,      # Blue
-            'success': 0x2ecc71,   # Green
-            'warning': 0xf39c12,   # Orange
-            'error': 0xe74c3c,     # Red
-            'critical': 0x8e44ad   # Purple
-        }
-        color = colors.get(severity, colors['info'])
+        color = DISCORD_SEVERITY_COLORS.get(severity, DISCORD_SEVERITY_COLORS['info'])
 
         # Build embed
         embed = {
@@ -146,19 +403,13 @@ class DiscordHandler(NotificationHandler):
         }
 
         try:
-            data = json.dumps(payload).encode('utf-8')
-            req = urllib.request.Request(
-                webhook_url,
-                data=data,
-                headers={'Content-Type': 'application/json'}
-            )
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status == 204 or 200 <= response.status < 300:
-                    logger.info(f"Discord notification sent: {title}")
-                    return True
-                else:
-                    logger.error(f"Discord webhook returned status {response.status}")
-                    return False
+            response = get_http_session().post(webhook_url, json=payload, timeout=HTTP_TIMEOUT)
+            if 200 <= response.status_code < 300:
+                logger.info(f"Discord notification sent: {title}")
+                return True
+            else:
+                logger.error(f"Discord webhook returned status {response.status_code}")
+                return False
         except Exception as e:
             logger.error(f"Failed to send Discord notification: {e}")
             return False
@@ -186,15 +437,7 @@ class SlackHandler(NotificationHandler):
             logger.error("Slack webhook URL not configured")
             return False
 
-        # Map severity to colors
-        colors = {
-            'info': '#3498db',
-            'success': '#2ecc71',
-            'warning': '#f39c12',
-            'error': '#e74c3c',
-            'critical': '#8e44ad'
-        }
-        color = colors.get(severity, colors['info'])
+        color = SEVERITY_COLORS.get(severity, SEVERITY_COLORS['info'])
 
         # Build attachment
         attachment = {
@@ -223,19 +466,13 @@ class SlackHandler(NotificationHandler):
         }
 
         try:
-            data = json.dumps(payload).encode('utf-8')
-            req = urllib.request.Request(
-                webhook_url,
-                data=data,
-                headers={'Content-Type': 'application/json'}
-            )
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status == 200:
-                    logger.info(f"Slack notification sent: {title}")
-                    return True
-                else:
-                    logger.error(f"Slack webhook returned status {response.status}")
-                    return False
+            response = get_http_session().post(webhook_url, json=payload, timeout=HTTP_TIMEOUT)
+            if response.status_code == 200:
+                logger.info(f"Slack notification sent: {title}")
+                return True
+            else:
+                logger.error(f"Slack webhook returned status {response.status_code}")
+                return False
         except Exception as e:
             logger.error(f"Failed to send Slack notification: {e}")
             return False
@@ -270,14 +507,7 @@ class EmailHandler(NotificationHandler):
             return False
 
         # Build HTML message
-        severity_colors = {
-            'info': '#3498db',
-            'success': '#2ecc71',
-            'warning': '#f39c12',
-            'error': '#e74c3c',
-            'critical': '#8e44ad'
-        }
-        color = severity_colors.get(severity, severity_colors['info'])
+        color = SEVERITY_COLORS.get(severity, SEVERITY_COLORS['info'])
 
         html = f"""
         <html>
@@ -325,15 +555,36 @@ class EmailHandler(NotificationHandler):
 
         msg.attach(MIMEText(html, 'html'))
 
+        # Reuse an authenticated connection when one is idle (skips
+        # connect/EHLO/STARTTLS/AUTH); if it fails for any reason (dropped,
+        # 421 shutdown, socket error) discard it and send on a fresh one
+        pool_key = (smtp_server, smtp_port, username)
+        server = None
         try:
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
+            server = _checkout_smtp(pool_key)
+            sent = False
+            if server is not None:
+                try:
+                    server.send_message(msg)
+                    sent = True
+                except (smtplib.SMTPException, OSError) as e:
+                    logger.debug(f"Pooled SMTP connection to {smtp_server} failed ({e}), reconnecting")
+                    _close_smtp(server)
+                    server = None
+
+            if not sent:
+                server = smtplib.SMTP(smtp_server, smtp_port)
                 server.starttls()
                 server.login(username, password)
                 server.send_message(msg)
-                logger.info(f"Email notification sent: {title} to {to_addr}")
-                return True
+
+            _checkin_smtp(pool_key, server)
+            logger.info(f"Email notification sent: {title} to {to_addr}")
+            return True
         except Exception as e:
             logger.error(f"Failed to send email notification: {e}")
+            if server is not None:
+                _close_smtp(server)
             return False
 
 
@@ -362,14 +613,7 @@ class TelegramHandler(NotificationHandler):
             return False
 
         # Build message with markdown
-        severity_emojis = {
-            'info': 'ℹ️',
-            'success': '✅',
-            'warning': '⚠️',
-            'error': '❌',
-            'critical': '🚨'
-        }
-        emoji = severity_emojis.get(severity, severity_emojis['info'])
+        emoji = SEVERITY_EMOJIS.get(severity, SEVERITY_EMOJIS['info'])
 
         text = f"{emoji} *{title}*\n\n{message}"
 
@@ -392,16 +636,14 @@ class TelegramHandler(NotificationHandler):
         }
 
         try:
-            data = urllib.parse.urlencode(payload).encode('utf-8')
-            req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/x-www-form-urlencoded'})
-            with urllib.request.urlopen(req, timeout=10) as response:
-                result = json.loads(response.read().decode('utf-8'))
-                if result.get('ok'):
-                    logger.info(f"Telegram notification sent: {title}")
-                    return True
-                else:
-                    logger.error(f"Telegram API error: {result.get('description')}")
-                    return False
+            response = get_http_session().post(url, data=payload, timeout=HTTP_TIMEOUT)
+            result = response.json()
+            if result.get('ok'):
+                logger.info(f"Telegram notification sent: {title}")
+                return True
+            else:
+                logger.error(f"Telegram API error: {result.get('description')}")
+                return False
         except Exception as e:
             logger.error(f"Failed to send Telegram notification: {e}")
             return False
@@ -432,15 +674,7 @@ class GotifyHandler(NotificationHandler):
             logger.error("Gotify server URL or app token not configured")
             return False
 
-        # Map severity to priority (1-10)
-        severity_priority = {
-            'info': 5,
-            'success': 4,
-            'warning': 7,
-            'error': 9,
-            'critical': 10
-        }
-        final_priority = severity_priority.get(severity, priority)
+        final_priority = GOTIFY_SEVERITY_PRIORITY.get(severity, priority)
 
         # Build message
         full_message = message
@@ -462,19 +696,13 @@ class GotifyHandler(NotificationHandler):
 
         try:
             url = f"{server_url.rstrip('/')}/message?token={app_token}"
-            data = json.dumps(payload).encode('utf-8')
-            req = urllib.request.Request(
-                url,
-                data=data,
-                headers={'Content-Type': 'application/json'}
-            )
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if 200 <= response.status < 300:
-                    logger.info(f"Gotify notification sent: {title}")
-                    return True
-                else:
-                    logger.error(f"Gotify server returned status {response.status}")
-                    return False
+            response = get_http_session().post(url, json=payload, timeout=HTTP_TIMEOUT)
+            if 200 <= response.status_code < 300:
+                logger.info(f"Gotify notification sent: {title}")
+                return True
+            else:
+                logger.error(f"Gotify server returned status {response.status_code}")
+                return False
         except Exception as e:
             logger.error(f"Failed to send Gotify notification: {e}")
             return False
@@ -506,15 +734,7 @@ class NtfyHandler(NotificationHandler):
             logger.error("Ntfy topic not configured")
             return False
 
-        # Map severity to priority (1-5)
-        severity_priority = {
-            'info': 3,
-            'success': 2,
-            'warning': 4,
-            'error': 5,
-            'critical': 5
-        }
-        final_priority = severity_priority.get(severity, priority)
+        final_priority = NTFY_SEVERITY_PRIORITY.get(severity, priority)
 
         # Build message
         full_message = f"{title}\n\n{message}"
@@ -527,7 +747,6 @@ class NtfyHandler(NotificationHandler):
 
         try:
             url = f"{server_url.rstrip('/')}/{topic}"
-            req = urllib.request.Request(url, data=payload, method='POST')
 
             # Add headers
             headers = {
@@ -539,16 +758,13 @@ class NtfyHandler(NotificationHandler):
             if auth_token:
                 headers['Authorization'] = f"Bearer {auth_token}"
 
-            for key, value in headers.items():
-                req.add_header(key, value)
-
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status == 200:
-                    logger.info(f"Ntfy notification sent: {title}")
-                    return True
-                else:
-                    logger.error(f"Ntfy server returned status {response.status}")
-                    return False
+            response = get_http_session().post(url, data=payload, headers=headers, timeout=HTTP_TIMEOUT)
+            if response.status_code == 200:
+                logger.info(f"Ntfy notification sent: {title}")
+                return True
+            else:
+                logger.error(f"Ntfy server returned status {response.status_code}")
+                return False
         except Exception as e:
             logger.error(f"Failed to send Ntfy notification: {e}")
             return False
@@ -580,15 +796,7 @@ class MattermostHandler(NotificationHandler):
             logger.error("Mattermost webhook URL not configured")
             return False
 
-        # Map severity to colors
-        colors = {
-            'info': '#3498db',
-            'success': '#2ecc71',
-            'warning': '#f39c12',
-            'error': '#e74c3c',
-            'critical': '#8e44ad'
-        }
-        color = colors.get(severity, colors['info'])
+        color = SEVERITY_COLORS.get(severity, SEVERITY_COLORS['info'])
 
         # Build attachment
         text = f"**{title}**\n{message}"
@@ -620,19 +828,13 @@ class MattermostHandler(NotificationHandler):
                 payload['props']['attachments'][0]['fields'] = fields
 
         try:
-            data = json.dumps(payload).encode('utf-8')
-            req = urllib.request.Request(
-                webhook_url,
-                data=data,
-                headers={'Content-Type': 'application/json'}
-            )
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status == 200:
-                    logger.info(f"Mattermost notification sent: {title}")
-                    return True
-                else:
-                    logger.error(f"Mattermost webhook returned status {response.status}")
-                    return False
+            response = get_http_session().post(webhook_url, json=payload, timeout=HTTP_TIMEOUT)
+            if response.status_code == 200:
+                logger.info(f"Mattermost notification sent: {title}")
+                return True
+            else:
+                logger.error(f"Mattermost webhook returned status {response.status_code}")
+                return False
         except Exception as e:
             logger.error(f"Failed to send Mattermost notification: {e}")
             return False
@@ -663,15 +865,7 @@ class RocketchatHandler(NotificationHandler):
             logger.error("Rocket.Chat webhook URL not configured")
             return False
 
-        # Map severity to colors
-        colors = {
-            'info': '#3498db',
-            'success': '#2ecc71',
-            'warning': '#f39c12',
-            'error': '#e74c3c',
-            'critical': '#8e44ad'
-        }
-        color = colors.get(severity, colors['info'])
+        color = SEVERITY_COLORS.get(severity, SEVERITY_COLORS['info'])
 
         # Build attachment
         text = f"**{title}**\n{message}"
@@ -700,19 +894,13 @@ class RocketchatHandler(NotificationHandler):
                 payload['attachments'][0]['fields'] = fields
 
         try:
-            data = json.dumps(payload).encode('utf-8')
-            req = urllib.request.Request(
-                webhook_url,
-                data=data,
-                headers={'Content-Type': 'application/json'}
-            )
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status == 200:
-                    logger.info(f"Rocket.Chat notification sent: {title}")
-                    return True
-                else:
-                    logger.error(f"Rocket.Chat webhook returned status {response.status}")
-                    return False
+            response = get_http_session().post(webhook_url, json=payload, timeout=HTTP_TIMEOUT)
+            if response.status_code == 200:
+                logger.info(f"Rocket.Chat notification sent: {title}")
+                return True
+            else:
+                logger.error(f"Rocket.Chat webhook returned status {response.status_code}")
+                return False
         except Exception as e:
             logger.error(f"Failed to send Rocket.Chat notification: {e}")
             return False
@@ -763,20 +951,13 @@ class MatrixHandler(NotificationHandler):
 
         try:
             url = f"{homeserver.rstrip('/')}/_matrix/client/r0/rooms/{room_id}/send/m.room.message/{int(datetime.now().timestamp())}?access_token={access_token}"
-            data = json.dumps(payload).encode('utf-8')
-            req = urllib.request.Request(
-                url,
-                data=data,
-                headers={'Content-Type': 'application/json'},
-                method='PUT'
-            )
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if 200 <= response.status < 300:
-                    logger.info(f"Matrix notification sent: {title}")
-                    return True
-                else:
-                    logger.error(f"Matrix API returned status {response.status}")
-                    return False
+            response = get_http_session().put(url, json=payload, timeout=HTTP_TIMEOUT)
+            if 200 <= response.status_code < 300:
+                logger.info(f"Matrix notification sent: {title}")
+                return True
+            else:
+                logger.error(f"Matrix API returned status {response.status_code}")
+                return False
         except Exception as e:
             logger.error(f"Failed to send Matrix notification: {e}")
             return False
@@ -808,15 +989,7 @@ class PushoverHandler(NotificationHandler):
             logger.error("Pushover API token or user key not configured")
             return False
 
-        # Map severity to priority (-2 to 2)
-        severity_priority = {
-            'info': 0,
-            'success': -1,
-            'warning': 1,
-            'error': 1,
-            'critical': 2
-        }
-        final_priority = severity_priority.get(severity, priority)
+        final_priority = PUSH_SEVERITY_PRIORITY.get(severity, priority)
 
         # Build message
         full_message = message
@@ -837,20 +1010,18 @@ class PushoverHandler(NotificationHandler):
             payload['device'] = device
 
         try:
-            data = urllib.parse.urlencode(payload).encode('utf-8')
-            req = urllib.request.Request(
+            response = get_http_session().post(
                 'https://api.pushover.net/1/messages.json',
-                data=data,
-                headers={'Content-Type': 'application/x-www-form-urlencoded'}
+                data=payload,
+                timeout=HTTP_TIMEOUT
             )
-            with urllib.request.urlopen(req, timeout=10) as response:
-                result = json.loads(response.read().decode('utf-8'))
-                if result.get('status') == 1:
-                    logger.info(f"Pushover notification sent: {title}")
-                    return True
-                else:
-                    logger.error(f"Pushover API error: {result.get('errors', 'Unknown error')}")
-                    return False
+            result = response.json()
+            if result.get('status') == 1:
+                logger.info(f"Pushover notification sent: {title}")
+                return True
+            else:
+                logger.error(f"Pushover API error: {result.get('errors', 'Unknown error')}")
+                return False
         except Exception as e:
             logger.error(f"Failed to send Pushover notification: {e}")
             return False
@@ -891,23 +1062,19 @@ class PushbulletHandler(NotificationHandler):
             payload['device_iden'] = device_iden
 
         try:
-            data = json.dumps(payload).encode('utf-8')
             url = 'https://api.pushbullet.com/v2/pushes'
-            req = urllib.request.Request(
+            response = get_http_session().post(
                 url,
-                data=data,
-                headers={
-                    'Content-Type': 'application/json',
-                    'Access-Token': api_key
-                }
+                json=payload,
+                headers={'Access-Token': api_key},
+                timeout=HTTP_TIMEOUT
             )
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status == 200:
-                    logger.info(f"Pushbullet notification sent: {title}")
-                    return True
-                else:
-                    logger.error(f"Pushbullet API returned status {response.status}")
-                    return False
+            if response.status_code == 200:
+                logger.info(f"Pushbullet notification sent: {title}")
+                return True
+            else:
+                logger.error(f"Pushbullet API returned status {response.status_code}")
+                return False
         except Exception as e:
             logger.error(f"Failed to send Pushbullet notification: {e}")
             return False
@@ -938,15 +1105,7 @@ class ProwlHandler(NotificationHandler):
             logger.error("Prowl API key not configured")
             return False
 
-        # Map severity to priority (-2 to 2)
-        severity_priority = {
-            'info': 0,
-            'success': -1,
-            'warning': 1,
-            'error': 1,
-            'critical': 2
-        }
-        final_priority = severity_priority.get(severity, priority)
+        final_priority = PUSH_SEVERITY_PRIORITY.get(severity, priority)
 
         # Build application name
         application = self.config.get('application', 'Radio Monitor')
@@ -961,24 +1120,22 @@ class ProwlHandler(NotificationHandler):
                 'priority': final_priority
             }
 
-            data = urllib.parse.urlencode(params).encode('utf-8')
-            req = urllib.request.Request(
+            response = get_http_session().post(
                 'https://api.prowlapp.com/publicapi/add',
-                data=data,
-                headers={'Content-Type': 'application/x-www-form-urlencoded'}
+                data=params,
+                timeout=HTTP_TIMEOUT
             )
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status == 200:
-                    result = response.read().decode('utf-8')
-                    if 'success code="200"' in result:
-                        logger.info(f"Prowl notification sent: {title}")
-                        return True
-                    else:
-                        logger.error(f"Prowl API error: {result}")
-                        return False
+            if response.status_code == 200:
+                result = response.text
+                if 'success code="200"' in result:
+                    logger.info(f"Prowl notification sent: {title}")
+                    return True
                 else:
-                    logger.error(f"Prowl API returned status {response.status}")
+                    logger.error(f"Prowl API error: {result}")
                     return False
+            else:
+                logger.error(f"Prowl API returned status {response.status_code}")
+                return False
         except Exception as e:
             logger.error(f"Failed to send Prowl notification: {e}")
             return False
@@ -1015,33 +1172,22 @@ class BoxcarHandler(NotificationHandler):
         }
 
         # Map severity to sound
-        sounds = {
-            'info': 'notifier-2',
-            'success': 'magic-1',
-            'warning': 'warning-1',
-            'error': 'glass',
-            'critical': 'alarm'
-        }
-        if severity in sounds:
-            payload['sound'] = sounds[severity]
+        if severity in BOXCAR_SEVERITY_SOUNDS:
+            payload['sound'] = BOXCAR_SEVERITY_SOUNDS[severity]
 
         try:
-            data = json.dumps(payload).encode('utf-8')
-            req = urllib.request.Request(
+            response = get_http_session().post(
                 'https://boxcar-api-production.herokuapp.com/notifications',
-                data=data,
-                headers={
-                    'Content-Type': 'application/json',
-                    'Authorization': f"Bearer {access_token}"
-                }
+                json=payload,
+                headers={'Authorization': f"Bearer {access_token}"},
+                timeout=HTTP_TIMEOUT
             )
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status == 201:
-                    logger.info(f"Boxcar notification sent: {title}")
-                    return True
-                else:
-                    logger.error(f"Boxcar API returned status {response.status}")
-                    return False
+            if response.status_code == 201:
+                logger.info(f"Boxcar notification sent: {title}")
+                return True
+            else:
+                logger.error(f"Boxcar API returned status {response.status_code}")
+                return False
         except Exception as e:
             logger.error(f"Failed to send Boxcar notification: {e}")
             return False
@@ -1115,6 +1261,25 @@ class MQTTPublisher(NotificationHandler):
             return False
 
 
+# Handler class for each notification type
+NOTIFICATION_HANDLERS = {
+    'discord': DiscordHandler,
+    'slack': SlackHandler,
+    'email': EmailHandler,
+    'telegram': TelegramHandler,
+    'gotify': GotifyHandler,
+    'ntfy': NtfyHandler,
+    'mattermost': MattermostHandler,
+    'rocketchat': RocketchatHandler,
+    'matrix': MatrixHandler,
+    'pushover': PushoverHandler,
+    'pushbullet': PushbulletHandler,
+    'prowl': ProwlHandler,
+    'boxcar': BoxcarHandler,
+    'mqtt': MQTTPublisher
+}
+
+
 def get_handler(notification_type: str, config: Dict[str, Any]) -> Optional[NotificationHandler]:
     """Factory function to get notification handler
 
@@ -1125,24 +1290,7 @@ def get_handler(notification_type: str, config: Dict[str, Any]) -> Optional[Noti
     Returns:
         NotificationHandler instance or None if type not found
     """
-    handlers = {
-        'discord': DiscordHandler,
-        'slack': SlackHandler,
-        'email': EmailHandler,
-        'telegram': TelegramHandler,
-        'gotify': GotifyHandler,
-        'ntfy': NtfyHandler,
-        'mattermost': MattermostHandler,
-        'rocketchat': RocketchatHandler,
-        'matrix': MatrixHandler,
-        'pushover': PushoverHandler,
-        'pushbullet': PushbulletHandler,
-        'prowl': ProwlHandler,
-        'boxcar': BoxcarHandler,
-        'mqtt': MQTTPublisher
-    }
-
-    handler_class = handlers.get(notification_type)
+    handler_class = NOTIFICATION_HANDLERS.get(notification_type)
     if not handler_class:
         logger.error(f"Unknown notification type: {notification_type}")
         return None
@@ -1175,6 +1323,13 @@ def send_notification(notification_type: str, config: Dict[str, Any],
         logger.debug(f"Notification handler {notification_type} is disabled")
         return False
 
+    # Wait for a slot under the provider's limit instead of getting HTTP 429
+    limiter = get_provider_limiter(notification_type, config)
+    if limiter:
+        waited = limiter.acquire()
+        if waited > 0:
+            logger.debug(f"Waited {waited:.1f}s for {notification_type} rate limit")
+
     return handler.send(title, message, severity, metadata)
 
 
@@ -1201,29 +1356,49 @@ def send_notifications(db, event_type: str, title: str,
         # Get enabled notifications that should trigger on this event
         notifications = notif_db.get_notifications_for_event(cursor, event_type)
 
-        sent_count = 0
+        # Skip endpoints that keep failing instead of waiting out their timeouts
+        breakers = {}
+        available = []
         for notification in notifications:
-            # Config is already decoded as dict by get_notifications_for_event
-            config = notification['config']
-            success = send_notification(
-                notification['notification_type'],
-                config,
-                title,
-                message,
-                severity,
-                metadata
-            )
+            breaker = get_circuit_breaker(notification['id'])
+            if breaker.allow():
+                breakers[notification['id']] = breaker
+                available.append(notification)
+            else:
+                logger.info(f"Skipping notification '{notification['name']}': "
+                            f"{breaker.failures} consecutive failures, retrying after cooldown")
+        notifications = available
+
+        def deliver(notification):
+            # Config is already decoded as dict by get_notifications_for_event.
+            # One provider raising must not lose the other providers' results
+            try:
+                return send_notification(
+                    notification['notification_type'],
+                    notification['config'],
+                    title,
+                    message,
+                    severity,
+                    metadata
+                )
+            except Exception as e:
+                logger.error(f"Notification '{notification['name']}' failed: {e}")
+                return False
 
-            # Log to history
-            notif_db.log_notification_send(
-                cursor,
-                notification['id'],
-                event_type,
-                severity,
-                title,
-                message,
-                success
-            )
+        # Deliver to all providers in parallel so the event waits for the
+        # slowest provider rather than the sum of them; database updates stay
+        # on this thread
+        if len(notifications) > 1:
+            with ThreadPoolExecutor(max_workers=min(MAX_DELIVERY_WORKERS, len(notifications))) as executor:
+                results = list(executor.map(deliver, notifications))
+        else:
+            results = [deliver(notification) for notification in notifications]
+
+        sent_count = 0
+        history = []
+        for notification, success in zip(notifications, results):
+            breakers[notification['id']].record(success)
+            history.append((notification['id'], event_type, severity, title, message, success, None))
 
             # Update notification stats
             if success:
@@ -1232,6 +1407,10 @@ def send_notifications(db, event_type: str, title: str,
             else:
                 notif_db.increment_notification_failures(cursor, notification['id'])
 
+        # Log to history
+        if history:
+            notif_db.log_notification_sends(cursor, history)
+
         db.conn.commit()
         return sent_count
     finally:
@@ -1230,24 +1230,27 @@ def create_playlist(db, plex, playlist_name, mode='merge', filters=None):
             songs_to_add.append(track)
         else:
             not_found.append((song_id, song_title, artist_name))
-            # Log Plex failure to database
+
+    logger.info(f"Finished searching Plex: found {len(songs_to_add)}/{len(songs)} songs")
+
+    # Log Plex failures to database (one insert and commit for the whole run)
+    if not_found:
+        try:
+            from radio_monitor.database import plex_failures
+            cursor = db.get_cursor()
             try:
-                from radio_monitor.database import plex_failures
-                cursor = db.get_cursor()
-                plex_failures.log_plex_failure(
-                    cursor,
-                    song_id=song_id,
-                    playlist_id=None,  # We don't have playlist_id yet
-                    failure_reason='no_match',
-                    search_attempts=4,  # We try 4 strategies
-                    search_terms={'title': song_title, 'artist': artist_name}
-                )
+                plex_failures.log_plex_failures(cursor, [{
+                    'song_id': song_id,
+                    'playlist_id': None,  # We don't have playlist_id yet
+                    'failure_reason': 'no_match',
+                    'search_attempts': 4,  # We try 4 strategies
+                    'search_terms': {'title': song_title, 'artist': artist_name}
+                } for song_id, song_title, artist_name in not_found])
                 db.conn.commit()
+            finally:
                 cursor.close()
-            except Exception as e:
-                logger.error(f"Failed to log Plex failure: {e}")
-
-    logger.info(f"Finished searching Plex: found {len(songs_to_add)}/{len(songs)} songs")
+        except Exception as e:
+            logger.error(f"Failed to log Plex failures: {e}")
 
     # Trim to requested limit if we have too many matches
     if len(songs_to_add) > limit:
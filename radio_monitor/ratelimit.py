@@ -0,0 +1,114 @@
+"""
+Rate limiting for outbound API requests
+
+Provides a thread-safe token bucket that spaces out requests to an external
+service, plus exponential backoff when the service signals overload
+(e.g. MusicBrainz HTTP 503).
+
+The lock only covers reserving a send slot; callers sleep outside the lock,
+so waiting for a slot (or for a slow response) never blocks other threads
+from reserving theirs.
+"""
+
+import threading
+import time
+import logging
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Thread-safe token bucket rate limiter with overload backoff"""
+
+    def __init__(self, rate: float = 1.0, burst: int = 1,
+                 backoff_initial: float = 2.0, backoff_max: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """Create a rate limiter
+
+        Args:
+            rate: Average requests per second
+            burst: Maximum requests allowed back-to-back
+            backoff_initial: First backoff delay in seconds (doubles per attempt)
+            backoff_max: Maximum backoff delay in seconds
+            clock: Monotonic time source (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Reserve a send slot and return how long the caller must wait"""
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+            # Tokens may go negative: each waiting caller owns a future slot
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+            return max(wait, self._blocked_until - now)
+
+    def acquire(self) -> float:
+        """Block until a request may be sent
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self._reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Pause all callers after the service reported overload
+
+        Args:
+            attempt: Zero-based retry attempt (delay doubles each attempt)
+            retry_after: Server-provided Retry-After in seconds (optional)
+
+        Returns:
+            Backoff delay in seconds
+        """
+        delay = min(self.backoff_initial * (2 ** attempt), self.backoff_max)
+        if retry_after:
+            delay = min(max(delay, retry_after), self.backoff_max)
+
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + delay)
+
+        logger.debug("Rate limiter backing off for %.1fs (attempt %d)", delay, attempt + 1)
+        return delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds
+
+    Args:
+        value: Header value (may be None)
+
+    Returns:
+        Seconds as float, or None if missing/not numeric
+    """
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+# Shared MusicBrainz limiter: 1 request/second per IP (MusicBrainz rate limit)
+musicbrainz_limiter = RateLimiter(rate=1.0, burst=1)
+
+# Maximum retries after MusicBrainz HTTP 503 (service overloaded)
+MUSICBRAINZ_MAX_503_RETRIES = 10
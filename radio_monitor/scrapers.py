@@ -7,6 +7,7 @@ currently playing songs. Supports iHeartRadio stations only.
 Key Features:
 - Fast scraping system using requests+BeautifulSoup
   * 0.43s average scraping time
+  * Reads the embedded __NEXT_DATA__ JSON first, HTML parsing as fallback
 - Multiple retry attempts with exponential backoff (7 attempts, ~112 seconds max)
 - Artist/song validation to prevent swap bugs and data corruption
 - Smart duplicate detection (compares with previous scrape)
@@ -18,12 +19,25 @@ Key Features:
 
 import os
 import re
+import json
 import time
 import logging
 from datetime import datetime
 import requests
-from bs4 import BeautifulSoup
 import uuid
+import hashlib
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from radio_monitor.normalization import normalize_artist_name, normalize_song_title, handle_collaboration
+from radio_monitor.mbid import lookup_artist_mbid, lookup_artist_mbids_batch
+from radio_monitor.multi_artist_resolver import try_split_and_validate
+from radio_monitor.lidarr import import_artist_to_lidarr
+from radio_monitor.notifications import send_notifications
+from radio_monitor.database.activity import log_activity
+from radio_monitor.database.crud import get_manual_mbid_override, get_manual_mbid_override_map
+from radio_monitor.database.pool import ConnectionPool, DEFAULT_POOL_SIZE, is_poolable
 
 logger = logging.getLogger(__name__)
 
@@ -76,7 +90,6 @@ def get_artist_mbid_with_override(cursor, artist_name, mbid_from_station=None):
         return mbid_from_station, 'station'
 
     # Priority 2: Manual override (user's explicit choice)
-    from radio_monitor.database.crud import get_manual_mbid_override
     override_mbid = get_manual_mbid_override(cursor, artist_name)
     if override_mbid:
         logger.info(f"Using manual MBID override for '{artist_name}': {override_mbid}")
@@ -88,6 +101,40 @@ def get_artist_mbid_with_override(cursor, artist_name, mbid_from_station=None):
     return None, 'musicbrainz_needed'
 
 
+def make_pending_mbid(artist_name):
+    """Build a deterministic PENDING-xxx placeholder MBID for an artist
+
+    The hash is only an identifier (not security-sensitive), so BLAKE2b with a
+    16-byte digest is used: it's faster than MD5 on 64-bit CPUs and still
+    yields the same 32 hex characters.
+
+    Args:
+        artist_name: Artist name
+
+    Returns:
+        str: Placeholder MBID, e.g. 'PENDING-3f2a...'
+    """
+    return f"PENDING-{hashlib.blake2b(artist_name.encode(), digest_size=16).hexdigest()}"
+
+
+def make_pending_mbids(artist_names):
+    """Build PENDING-xxx placeholder MBIDs for many artists in one pass
+
+    Same placeholders as make_pending_mbid(), without a Python call per name.
+
+    Args:
+        artist_names: Iterable of artist names
+
+    Returns:
+        dict: {artist_name: placeholder MBID}
+    """
+    blake2b = hashlib.blake2b
+    return {
+        artist_name: f"PENDING-{blake2b(artist_name.encode(), digest_size=16).hexdigest()}"
+        for artist_name in artist_names
+    }
+
+
 # ==================== FILTERING LISTS ====================
 
 # Taglines and unwanted phrases to filter out
@@ -140,6 +187,35 @@ ADVERTISEMENT_PHRASES = [
     'contest', 'sweepstakes', 'giveaway', 'win', 'free'
 ]
 
+def _build_phrase_predicate(lower_phrases, cased_phrases):
+    """Generate a specialized phrase-matching function for fixed phrase lists
+
+    The phrase lists are fixed at import time, so instead of looping with
+    any(...) per call we emit a single short-circuiting `in` chain that
+    CPython compiles straight to CONTAINS_OP bytecode.
+
+    Args:
+        lower_phrases: Phrases to look for in the lowercased text
+        cased_phrases: Phrases to look for in the original text
+
+    Returns:
+        Function (text_lower, text) -> bool
+    """
+    checks = [f"{phrase!r} in text_lower" for phrase in lower_phrases]
+    checks += [f"{phrase!r} in text" for phrase in cased_phrases]
+    source = (
+        "def _matches_phrase(text_lower, text):\n"
+        f"    return {' or '.join(checks) or 'False'}\n"
+    )
+    namespace = {}
+    exec(compile(source, '<phrase-predicate>', 'exec'), namespace)
+    return namespace['_matches_phrase']
+
+
+# Specialized matcher for ADVERTISEMENT_PHRASES (lowercased) + STOP_PHRASES (as-is)
+_matches_ad_or_stop_phrase = _build_phrase_predicate(ADVERTISEMENT_PHRASES, STOP_PHRASES)
+
+
 def is_advertisement_or_website_content(text):
     """Check if text appears to be an advertisement, website UI element, or non-music content
 
@@ -154,12 +230,8 @@ def is_advertisement_or_website_content(text):
 
     text_lower = text.lower().strip()
 
-    # Check against advertisement phrases
-    if any(phrase in text_lower for phrase in ADVERTISEMENT_PHRASES):
-        return True
-
-    # Check against stop phrases
-    if any(phrase in text for phrase in STOP_PHRASES):
+    # Check against advertisement phrases and stop phrases
+    if _matches_ad_or_stop_phrase(text_lower, text):
         return True
 
     # Check for URLs
@@ -175,7 +247,7 @@ def is_advertisement_or_website_content(text):
         return True
 
     # Check for copyright symbol
-    if '©' in text or '(c)' in text.lower():
+    if '©' in text or '(c)' in text_lower:
         return True
 
     return False
@@ -207,23 +279,22 @@ def is_valid_artist_name(artist_name):
         return False
 
     # Check for multiple commas (indicates list, not single artist)
-    comma_count = artist_name.count(',')
-    if comma_count >= 2:
-        logger.debug(f"Rejecting artist name (too many commas): {artist_name}")
-        return False
+    first_comma = artist_name.find(',')
+    if first_comma != -1:
+        if artist_name.find(',', first_comma + 1) != -1:
+            logger.debug(f"Rejecting artist name (too many commas): {artist_name}")
+            return False
 
-    # Check for suspicious patterns that indicate multiple artists
-    # These are legitimate in some cases (e.g., "Post Malone Feat Blake Shelton")
-    # but we'll allow them - they'll be filtered by MBID lookup later
-    # Just reject obviously bad patterns like "Artist1, Artist2, Artist3"
-    if comma_count == 1:
+        # Check for suspicious patterns that indicate multiple artists
+        # These are legitimate in some cases (e.g., "Post Malone Feat Blake Shelton")
+        # but we'll allow them - they'll be filtered by MBID lookup later
+        # Just reject obviously bad patterns like "Artist1, Artist2, Artist3"
         # Check if it looks like "Last, First" (legitimate) or "Artist1, Artist2" (suspicious)
-        parts = [p.strip() for p in artist_name.split(',')]
-        if len(parts) == 2:
-            # If both parts have spaces, might be "Artist One, Artist Two"
-            if ' ' in parts[0] and ' ' in parts[1]:
-                logger.debug(f"Rejecting artist name (looks like list): {artist_name}")
-                return False
+        # If both parts have spaces, might be "Artist One, Artist Two"
+        if (' ' in artist_name[:first_comma].rstrip()
+                and ' ' in artist_name[first_comma + 1:].lstrip()):
+            logger.debug(f"Rejecting artist name (looks like list): {artist_name}")
+            return False
 
     # Check for only special characters or numbers
     if not re.search(r'[a-zA-Z]', artist_name):
@@ -406,7 +477,25 @@ def scrape_station_iheart_fast(config, max_retries=7, initial_wait=4):
             response = requests.get(config['url'], headers=headers, timeout=15)
             response.raise_for_status()
 
-            # Parse HTML
+            # Fast path: read the recently-played list from the embedded
+            # Next.js JSON payload (no HTML parse needed)
+            next_data_songs = _extract_iheart_next_data(response.content, config['url'])
+            if next_data_songs is not None:
+                seen = set()
+                for artist_name, song_title in next_data_songs:
+                    key = (song_title, artist_name)
+                    if key not in seen and _is_acceptable_song(artist_name, song_title):
+                        seen.add(key)
+                        songs.append((artist_name, song_title, None))
+                        logger.debug("Found: %s by %s", song_title, artist_name)
+
+            if len(songs) >= 2:
+                logger.info(f"Fast scraper successful with {len(songs)} songs from __NEXT_DATA__ in {attempt} attempt(s)")
+                return songs
+            songs = []
+
+            # Parse HTML (BeautifulSoup is only needed on this fallback path)
+            from bs4 import BeautifulSoup
             soup = BeautifulSoup(response.text, "html.parser")
 
             # Find all anchor tags that point to a song URL (contain '/songs/')
@@ -427,7 +516,7 @@ def scrape_station_iheart_fast(config, max_retries=7, initial_wait=4):
 
                     # Skip advertisements/website content
                     if is_advertisement_or_website_content(song_title):
-                        logger.debug(f"Skipping song that looks like ad: {song_title}")
+                        logger.debug("Skipping song that looks like ad: %s", song_title)
                         continue
 
                     # Try to find artist link inside same parent container
@@ -452,32 +541,14 @@ def scrape_station_iheart_fast(config, max_retries=7, initial_wait=4):
                             logger.debug(f"Cannot extract artist from URL: {href}")
                             continue
 
-                    # Validate artist name
-                    if not artist_name or len(artist_name) < 3 or len(artist_name) > 60:
-                        continue
-
-                    # Skip advertisements/website content (artist names too)
-                    if is_advertisement_or_website_content(artist_name):
-                        logger.debug(f"Skipping artist that looks like ad: {artist_name}")
-                        continue
-
-                    # Validate artist name to prevent corrupted data
-                    if not is_valid_artist_name(artist_name):
-                        logger.debug(f"Skipping artist with invalid name: {artist_name}")
-                        continue
-
-                    # CRITICAL VALIDATION: Prevent artist/song swap bugs
-                    # Artist names shouldn't contain digits (except collaborations)
-                    # Song titles shouldn't look like artist names
-                    if _validate_artist_song_pair(artist_name, song_title):
+                    # Validate artist/song (length, ads, corrupted names, swap bugs)
+                    if _is_acceptable_song(artist_name, song_title):
                         # Deduplicate by (song, artist) pair
                         key = (song_title, artist_name)
                         if key not in seen:
                             seen.add(key)
                             songs.append((artist_name, song_title, None))
-                            logger.debug(f"Found: {song_title} by {artist_name}")
-                    else:
-                        logger.warning(f"Validation failed - possible swap: '{song_title}' by '{artist_name}'")
+                            logger.debug("Found: %s by %s", song_title, artist_name)
 
                 except Exception as e:
                     logger.debug(f"Error parsing song link: {e}")
@@ -521,6 +592,87 @@ def scrape_station_iheart_fast(config, max_retries=7, initial_wait=4):
     return []
 
 
+# Next.js embeds the page state (including recently played tracks) as JSON
+_NEXT_DATA_RE = re.compile(rb'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.S)
+
+# iHeart live station URLs end with the numeric station ID (e.g. /live/us-99-10819/)
+_IHEART_STATION_ID_RE = re.compile(r'-(\d+)/?$')
+
+
+def _extract_iheart_next_data(content, url):
+    """Extract recently played songs from iHeart's embedded __NEXT_DATA__ JSON
+
+    Args:
+        content: Raw response body (bytes)
+        url: Station URL (used to derive the iHeart station ID)
+
+    Returns:
+        List of (artist, song) tuples, or None if the payload is missing or
+        doesn't have the expected shape (caller falls back to HTML parsing)
+    """
+    match = _NEXT_DATA_RE.search(content)
+    station_match = _IHEART_STATION_ID_RE.search(url)
+    if not match or not station_match:
+        return None
+
+    try:
+        data = json.loads(match.group(1))
+        stations = data['props']['pageProps']['initialState']['live']['stations']
+        tracks = stations[station_match.group(1)]['recentTracks']
+    except (ValueError, KeyError, TypeError) as e:
+        logger.debug(f"__NEXT_DATA__ payload not usable, falling back to HTML: {e}")
+        return None
+
+    results = []
+    for track in tracks:
+        if not isinstance(track, dict):
+            continue
+        song_title = (track.get('title') or '').strip()
+        artist_name = (track.get('artistName') or track.get('artist') or '')
+        if isinstance(artist_name, dict):
+            artist_name = artist_name.get('name') or artist_name.get('artistName') or ''
+        artist_name = artist_name.strip()
+        if artist_name and song_title:
+            results.append((artist_name, song_title))
+
+    return results
+
+
+def _is_acceptable_song(artist_name, song_title):
+    """Apply the scraper's length, advertisement and validity checks to a pair
+
+    Args:
+        artist_name: Artist name string
+        song_title: Song title string
+
+    Returns:
+        bool: True if the pair should be kept
+    """
+    if not song_title or len(song_title) < 3 or len(song_title) > 60:
+        return False
+
+    if not artist_name or len(artist_name) < 3 or len(artist_name) > 60:
+        return False
+
+    if is_advertisement_or_website_content(song_title):
+        logger.debug("Skipping song that looks like ad: %s", song_title)
+        return False
+
+    if is_advertisement_or_website_content(artist_name):
+        logger.debug("Skipping artist that looks like ad: %s", artist_name)
+        return False
+
+    if not is_valid_artist_name(artist_name):
+        logger.debug("Skipping artist with invalid name: %s", artist_name)
+        return False
+
+    if not _validate_artist_song_pair(artist_name, song_title):
+        logger.warning(f"Validation failed - possible swap: '{song_title}' by '{artist_name}'")
+        return False
+
+    return True
+
+
 def _validate_artist_song_pair(artist_name, song_title):
     """Validate artist/song pair to prevent swap bugs and data corruption
 
@@ -546,32 +698,32 @@ def _validate_artist_song_pair(artist_name, song_title):
     if artist_name.isdigit() and len(artist_name) == 4:
         year = int(artist_name)
         if 1000 <= year <= 2999:
-            logger.debug(f"Validation failed: Artist '{artist_name}' looks like a year")
+            logger.debug("Validation failed: Artist '%s' looks like a year", artist_name)
             return False
 
     # Rule 2: Song title shouldn't be ALL UPPERCASE with lots of spaces
     # (unless it's stylized, which is rare)
     if song_title.isupper() and len(song_title) > 15:
         # This might be an artist name
-        logger.debug(f"Validation failed: Song '{song_title}' is all uppercase and long")
+        logger.debug("Validation failed: Song '%s' is all uppercase and long", song_title)
         return False
 
     # Rule 3: Artist name shouldn't be extremely long (EXCEPT for collaborations)
     # Collaboration artists can have very long names like "Marky Mark And The Funky Bunch Feat Loleatta Holloway"
     if len(artist_name) > 40 and not has_collaboration_marker:
-        logger.debug(f"Validation failed: Artist '{artist_name}' is too long")
+        logger.debug("Validation failed: Artist '%s' is too long", artist_name)
         return False
 
     # Rule 4: Both should have reasonable character lengths
     if len(artist_name) < 3 or len(song_title) < 3:
-        logger.debug(f"Validation failed: Artist or song too short")
+        logger.debug("Validation failed: Artist or song too short")
         return False
 
     # Rule 5: Check for common website/content indicators
     skip_phrases = ['listen live', 'now playing', 'up next', 'advertisement', 'sponsor']
     combined = f"{artist_name} {song_title}".lower()
     if any(phrase in combined for phrase in skip_phrases):
-        logger.debug(f"Validation failed: Contains skip phrase")
+        logger.debug("Validation failed: Contains skip phrase")
         return False
 
     # Rule 6: Check for obvious swap - short title looks like artist name, long artist looks like song
@@ -581,7 +733,7 @@ def _validate_artist_song_pair(artist_name, song_title):
         # Title is short, artist is long - might be swapped
         # But only flag if title looks like artist name (capitalized words)
         if song_title and all(word[0].isupper() for word in song_title.split() if word):
-            logger.debug(f"Validation failed: Possible swap - short title '{song_title}' with long artist '{artist_name}'")
+            logger.debug("Validation failed: Possible swap - short title '%s' with long artist '%s'", song_title, artist_name)
             return False
 
     # All checks passed
@@ -642,6 +794,589 @@ def scrape_single_station(db, station_id):
         raise
 
 
+# Settings cache shared across scrape runs (reloaded when the file changes)
+_SETTINGS_FILE = 'radio_monitor_settings.json'
+_settings_cache = {'mtime': None, 'settings': None}
+
+
+def _load_scrape_settings():
+    """Load settings once and reuse them until the settings file changes
+
+    The GUI package (Flask) is only imported on a cache miss, so scheduled
+    scrapes don't pay for re-reading and re-parsing the settings every run.
+
+    Returns:
+        Settings dict or None if file doesn't exist
+    """
+    try:
+        mtime = os.path.getmtime(_SETTINGS_FILE)
+    except OSError:
+        mtime = None
+
+    if mtime is None or mtime != _settings_cache['mtime']:
+        from radio_monitor.gui import load_settings
+        _settings_cache['settings'] = load_settings()
+        _settings_cache['mtime'] = mtime
+
+    return _settings_cache['settings']
+
+
+def _resolve_multi_artist_mbid(db, primary_artist, user_agent, artist_cache):
+    """Resolve an unknown artist name as a collaboration with a missing separator
+
+    Note: This only returns the MBID - no database updates during scraping.
+    Database updates happen only during manual CLI command to avoid transaction conflicts.
+
+    Args:
+        db: RadioDatabase instance
+        primary_artist: Artist name that MusicBrainz didn't match
+        user_agent: User agent for MusicBrainz API
+        artist_cache: Session-level cache shared with the multi-artist resolver
+
+    Returns:
+        tuple: (mbid, verified_name) - mbid is None if nothing was found
+    """
+    primary_artist_mbid = None
+    primary_artist_verified_name = None
+
+    try:
+        # Try to resolve as multi-artist collaboration
+        logger.info(f"No MBID found for '{primary_artist}', trying multi-artist resolution...")
+
+        # Use the smart grouping resolver to find the primary MBID
+        validated_artists = try_split_and_validate(primary_artist, db, user_agent, artist_cache)
+
+        if validated_artists:
+            # Get the MBID of the first (primary) artist
+            primary_name = validated_artists[0]
+            primary_artist_mbid, primary_artist_verified_name = lookup_artist_mbid(
+                artist_name=primary_name,
+                db=db,
+                user_agent=user_agent
+            )
+
+        if primary_artist_mbid and not primary_artist_mbid.startswith('PENDING'):
+            logger.info(f"Multi-artist resolution successful for '{primary_artist}' -> '{primary_name}': {primary_artist_mbid} (verified: {primary_artist_verified_name})")
+        else:
+            logger.debug(f"Multi-artist resolution failed for '{primary_artist}'")
+    except Exception as e:
+        logger.warning(f"Multi-artist resolution error for '{primary_artist}': {e}")
+
+    return primary_artist_mbid, primary_artist_verified_name
+
+
+def _resolve_primary_mbid(db, primary_artist, user_agent, artist_cache):
+    """Resolve an artist's MBID for the scraper
+
+    Priority: Manual override > MusicBrainz API > multi-artist resolution.
+    scrape_all_stations memoizes the result per artist for the whole run.
+
+    Args:
+        db: RadioDatabase instance
+        primary_artist: Artist name (single artist, collaborations already split)
+        user_agent: User agent for MusicBrainz API
+        artist_cache: Session-level cache shared with the multi-artist resolver
+
+    Returns:
+        tuple: (mbid, verified_name) - mbid is None if nothing was found
+    """
+    primary_artist_mbid = None
+    primary_artist_verified_name = None
+
+    # Check for manual override first
+    cursor = db.get_cursor()
+    try:
+        mbid_with_source, source = get_artist_mbid_with_override(
+            cursor,
+            primary_artist,
+            None  # No station MBID at this point
+        )
+
+        # Log source for debugging
+        logger.debug("MBID for '%s': source=%s, mbid=%s", primary_artist, source, mbid_with_source)
+
+        if mbid_with_source:
+            primary_artist_mbid = mbid_with_source
+            primary_artist_verified_name = None  # Override doesn't provide verified name
+        elif source == 'musicbrainz_needed':
+            # No override found, try MusicBrainz lookup
+            try:
+                primary_artist_mbid, primary_artist_verified_name = lookup_artist_mbid(primary_artist, db, user_agent=user_agent)
+                if primary_artist_mbid:
+                    logger.debug("MBID from MusicBrainz for '%s': %s (verified: %s)", primary_artist, primary_artist_mbid, primary_artist_verified_name)
+            except Exception as e:
+                logger.warning(f"MBID lookup failed for '{primary_artist}': {e}")
+                primary_artist_verified_name = None
+    finally:
+        cursor.close()
+
+    # If still no MBID, try multi-artist resolution (ONE-TIME attempt)
+    if not primary_artist_mbid:
+        primary_artist_mbid, primary_artist_verified_name = _resolve_multi_artist_mbid(
+            db, primary_artist, user_agent, artist_cache
+        )
+
+    return primary_artist_mbid, primary_artist_verified_name
+
+
+def _resolve_artist_mbids(db, artist_names, user_agent, artist_cache, manual_overrides):
+    """Resolve MBIDs for all of a station's new artists in one pass
+
+    Instead of one override query and one MusicBrainz request per artist,
+    this checks the preloaded overrides, runs one artists-table query and one
+    batched MusicBrainz search for every name still unknown. Names the batch
+    can't match (or every remaining name, if the batch request fails) go
+    through _resolve_primary_mbid: override, single-name MusicBrainz lookup,
+    then multi-artist resolution.
+
+    Args:
+        db: RadioDatabase instance
+        artist_names: List of unique artist names to resolve
+        user_agent: User agent for MusicBrainz API
+        artist_cache: Session-level cache shared with the multi-artist resolver
+        manual_overrides: Preloaded {artist_name_normalized: mbid} overrides
+
+    Returns:
+        dict: {artist_name: (mbid or None, verified_name)}
+    """
+    known_mbids = db.get_artist_mbids_by_names(artist_names)
+
+    resolved = {}
+    needs_lookup = []
+    for artist_name in artist_names:
+        override_mbid = manual_overrides.get(normalize_artist_name(artist_name).lower())
+        if override_mbid:
+            logger.info(f"Using manual MBID override for '{artist_name}': {override_mbid}")
+            resolved[artist_name] = (override_mbid, None)
+        elif artist_name in known_mbids:
+            resolved[artist_name] = (known_mbids[artist_name], artist_name)
+        else:
+            needs_lookup.append(artist_name)
+
+    batch_results = None
+    if len(needs_lookup) > 1:
+        batch_results = lookup_artist_mbids_batch(needs_lookup, user_agent=user_agent, with_names=True)
+
+    for artist_name in needs_lookup:
+        if batch_results is None:
+            resolved[artist_name] = _resolve_primary_mbid(db, artist_name, user_agent, artist_cache)
+        elif batch_results[artist_name][0]:
+            resolved[artist_name] = batch_results[artist_name]
+        else:
+            # Batch misses may just be crowded out of the combined search's
+            # top hits, so they get the full single-name resolution
+            resolved[artist_name] = _resolve_primary_mbid(db, artist_name, user_agent, artist_cache)
+
+    return resolved
+
+
+# Connection pools for scrape jobs, keyed by database path
+_scrape_pools = {}
+_scrape_pools_lock = threading.Lock()
+
+
+@contextmanager
+def _station_database(db, settings):
+    """Borrow a pooled database connection for scrape work (a station's songs, reporting)
+
+    Keeps the scraper's writes off the shared Flask connection. Falls back to
+    `db` itself for in-memory databases, which can't be shared.
+
+    Args:
+        db: RadioDatabase instance
+        settings: Settings dict (database.pool_size sets the pool size)
+
+    Yields:
+        RadioDatabase instance to use for this station
+    """
+    if not is_poolable(db.db_path):
+        yield db
+        return
+
+    pool = _scrape_pools.get(db.db_path)
+    if pool is None:
+        with _scrape_pools_lock:
+            # Check again: another scrape worker may have created it meanwhile
+            pool = _scrape_pools.get(db.db_path)
+            if pool is None:
+                pool_size = (settings or {}).get('database', {}).get('pool_size', DEFAULT_POOL_SIZE)
+                pool = _scrape_pools[db.db_path] = ConnectionPool(db.db_path, size=pool_size)
+
+    with pool.acquire_database() as station_db:
+        yield station_db
+
+
+def _validate_scraped_song(artist_name, song_title, artist_mbid):
+    """Normalize a scraped song and reject ads, noise and too-short entries
+
+    Args:
+        artist_name: Raw artist name from the scraper
+        song_title: Raw song title from the scraper
+        artist_mbid: MBID provided by the station (or None)
+
+    Returns:
+        tuple: (artist_name, song_title, artists_to_process), or None if rejected
+    """
+    # Clean up the data with proper normalization
+    artist_name = normalize_artist_name(artist_name.strip())
+    song_title = normalize_song_title(song_title.strip())
+
+    # Skip if too short (probably not a real song)
+    if len(artist_name) < 3 or len(song_title) < 3:
+        return None
+
+    # SAFETY NET: Final check for advertisements/website content before database insertion
+    if is_advertisement_or_website_content(artist_name):
+        logger.warning(f"BLOCKED: Artist name appears to be advertisement/website content: '{artist_name}' (skipping)")
+        return None
+
+    if is_advertisement_or_website_content(song_title):
+        logger.warning(f"BLOCKED: Song title appears to be advertisement/website content: '{song_title}' (skipping)")
+        return None
+
+    # Handle collaborations: Use comprehensive collaboration detection
+    # Split collaboration into individual artists
+    # Returns list of (artist, song, mbid) tuples
+    collaboration_results = handle_collaboration(artist_name, song_title, artist_mbid)
+
+    # Extract just the artist names for processing
+    artists_to_process = [result[0] for result in collaboration_results]
+
+    # Log collaboration splits
+    if len(artists_to_process) > 1:
+        logger.info(f"Collaboration detected: '{artist_name}' split into {len(artists_to_process)} artists: {artists_to_process}")
+
+    if not artists_to_process:
+        return None
+
+    return artist_name, song_title, artists_to_process
+
+
+def _scrape_station(db, station_id, settings, user_agent, run_caches):
+    """Scrape one station and write its songs and plays
+
+    Runs on a worker thread of scrape_all_stations. All database work uses a
+    pooled connection. Per-station counters are returned rather than shared;
+    only the per-run caches in `run_caches` are shared between stations.
+
+    Args:
+        db: RadioDatabase instance
+        station_id: Station identifier
+        settings: Settings dict (database.pool_size sets the pool size)
+        user_agent: User agent for MusicBrainz API
+        run_caches: Per-run caches shared by all stations
+            ('artist_cache', 'mbid_resolution_cache', 'processed_pairs', 'manual_overrides')
+
+    Returns:
+        dict: Station result (success, counters, artist_events, recorded_mbids),
+        or None if scraping was cancelled before the station started
+    """
+    # Check for cancellation before each station
+    if is_scraping_cancelled():
+        return None
+
+    artist_cache = run_caches['artist_cache']
+    mbid_resolution_cache = run_caches['mbid_resolution_cache']
+    processed_pairs = run_caches['processed_pairs']
+
+    station_result = {
+        'station_id': station_id,
+        'success': False,
+        'songs_found': 0,
+        'artists_added': 0,
+        'songs_added': 0,
+        'plays_recorded': 0,
+        'artist_events': [],  # (artist mbid, artist name, artist_added, song_added) per written song
+        'recorded_mbids': []  # artist mbid per recorded play
+    }
+
+    with _station_database(db, settings) as station_db:
+        try:
+            # Look up the station once (plays are recorded against it for every song)
+            station = station_db.get_station_by_id(station_id)
+            if not station:
+                logger.warning(f"Station {station_id} not found in database (skipping)")
+                return station_result
+
+            # Scrape the station
+            songs_data = scrape_single_station(station_db, station_id)
+
+            if not songs_data:
+                logger.warning(f"No songs found for {station_id}")
+                station_db.record_scrape_failure(station_id)
+                return station_result
+
+            # Record success and reset failure counter
+            station_db.record_scrape_success(station_id)
+            station_result['songs_found'] = len(songs_data)
+
+            # Phase 1: validate songs and resolve MBIDs (may call MusicBrainz,
+            # so this runs before the write transaction is opened)
+            validated_songs = []
+            resolved_songs = []
+            for artist_name, song_title, artist_mbid in songs_data:
+                try:
+                    pair_key = (artist_name, song_title, artist_mbid)
+                    if pair_key not in processed_pairs:
+                        processed_pairs[pair_key] = _validate_scraped_song(artist_name, song_title, artist_mbid)
+
+                    validated_pair = processed_pairs[pair_key]
+                    if validated_pair:
+                        validated_songs.append((*validated_pair, artist_mbid))
+
+                except Exception as e:
+                    logger.warning(f"Error processing song '{song_title}' by '{artist_name}': {e}")
+                    continue
+
+            # Resolve every artist this station introduces in one batch
+            # (overrides, local MBIDs and MusicBrainz), once per artist per run
+            unresolved_artists = {}
+            for artist_name, song_title, artists_to_process, artist_mbid in validated_songs:
+                if artist_mbid and len(artists_to_process) == 1:
+                    continue
+                for primary_artist in artists_to_process:
+                    resolution_key = primary_artist.strip().casefold()
+                    if resolution_key not in mbid_resolution_cache:
+                        unresolved_artists.setdefault(resolution_key, primary_artist)
+
+            if unresolved_artists:
+                batch_resolved = _resolve_artist_mbids(
+                    station_db, list(unresolved_artists.values()), user_agent, artist_cache,
+                    run_caches['manual_overrides']
+                )
+                for resolution_key, primary_artist in unresolved_artists.items():
+                    mbid_resolution_cache[resolution_key] = batch_resolved[primary_artist]
+
+            # Placeholder (PENDING) MBIDs for every artist still unresolved, built in one pass
+            pending_mbids = make_pending_mbids({
+                primary_artist
+                for artist_name, song_title, artists_to_process, artist_mbid in validated_songs
+                if not (artist_mbid and len(artists_to_process) == 1)
+                for primary_artist in artists_to_process
+                if not mbid_resolution_cache[primary_artist.strip().casefold()][0]
+            })
+
+            for artist_name, song_title, artists_to_process, artist_mbid in validated_songs:
+                # The station's MBID only applies when the song has a single artist
+                single_artist = len(artists_to_process) == 1
+
+                # Process each primary artist from the collaboration
+                for primary_artist in artists_to_process:
+                    # Get MBID with manual override support
+                    # Priority: Station MBID > Manual override > MusicBrainz API > PENDING
+                    primary_artist_mbid = artist_mbid if single_artist else None
+                    primary_artist_verified_name = None  # Will be set by MusicBrainz lookup
+
+                    if not primary_artist_mbid:
+                        primary_artist_mbid, primary_artist_verified_name = mbid_resolution_cache[primary_artist.strip().casefold()]
+
+                    # If still no MBID, use a placeholder (PENDING)
+                    if not primary_artist_mbid:
+                        # Temporary MBID placeholder
+                        primary_artist_mbid = pending_mbids[primary_artist]
+                        logger.debug("Using placeholder MBID for %s: %s", primary_artist, primary_artist_mbid)
+
+                # Use MusicBrainz's canonical name if available, otherwise fall back to scraped name
+                # This prevents artist name corruption in the artists table
+                artist_name_for_db = primary_artist_verified_name if primary_artist_verified_name else primary_artist
+                resolved_songs.append((artist_name, song_title, primary_artist, primary_artist_mbid, artist_name_for_db))
+
+            # Phase 2: write the station's artists, songs and plays in one transaction
+            # (one commit per station instead of several per song)
+            play_buffer = []  # (song_id, artist mbid) in play order, recorded in one batch
+            with station_db.transaction():
+                for artist_name, song_title, primary_artist, primary_artist_mbid, artist_name_for_db in resolved_songs:
+                    try:
+                        # Each song is atomic on its own (prevents orphaned artists)
+                        with station_db.savepoint('scraped_song'):
+                            artist_added, song_added, play_id = station_db.add_artist_and_song_if_new(
+                                primary_artist_mbid, artist_name_for_db, song_title, commit=False
+                            )
+
+                        if artist_added:
+                            station_result['artists_added'] += 1
+                            logger.info(f"New artist: {artist_name_for_db} ({primary_artist_mbid})")
+
+                        if song_added:
+                            station_result['songs_added'] += 1
+                            logger.info(f"New song: {song_title} by {primary_artist}")
+
+                        station_result['artist_events'].append((primary_artist_mbid, primary_artist, artist_added, song_added))
+
+                        if play_id:
+                            play_buffer.append((play_id, primary_artist_mbid))
+
+                    except Exception as e:
+                        logger.warning(f"Error processing song '{song_title}' by '{artist_name}': {e}")
+                        continue
+
+                # Record plays for this station in one batch (duplicates are silently skipped)
+                if play_buffer:
+                    try:
+                        with station_db.savepoint('station_plays'):
+                            recorded = station_db.record_plays(
+                                [song_id for song_id, _ in play_buffer], station['id'], commit=False
+                            )
+                    except Exception as e:
+                        logger.warning(f"Error recording plays for {station_id}: {e}")
+                        recorded = []
+
+                    play_artists = dict(play_buffer)
+                    station_result['plays_recorded'] = len(recorded)
+                    station_result['recorded_mbids'] = [play_artists[song_id] for song_id in recorded]
+
+            station_result['success'] = True
+            logger.info(f"Completed scraping {station_id}: {len(songs_data)} songs found")
+
+        except Exception as e:
+            logger.error(f"Failed to scrape {station_id}: {e}")
+            station_db.record_scrape_failure(station_id)
+
+    return station_result
+
+
+def _auto_import_station_artists(db, station_result, threshold_stats, settings,
+                                 min_plays_for_import, min_songs_for_import):
+    """Update auto-import stats with a station's writes and import artists that qualify
+
+    Runs on the scrape_all_stations thread, so threshold_stats is never
+    updated concurrently.
+
+    Args:
+        db: RadioDatabase instance
+        station_result: Result dict from _scrape_station
+        threshold_stats: Per-run {mbid: (total_plays, song_count, imported)}
+        settings: Settings dict (for Lidarr)
+        min_plays_for_import: Minimum total plays for auto-import
+        min_songs_for_import: Minimum song count for auto-import
+    """
+    # Keep in-memory threshold stats current for new artists/songs and recorded plays
+    new_song_artists = []  # (artist mbid, artist name) for songs added this station
+    for primary_artist_mbid, primary_artist, artist_added, song_added in station_result['artist_events']:
+        if artist_added:
+            threshold_stats.setdefault(primary_artist_mbid, (0, 0, False))
+        if song_added and primary_artist_mbid in threshold_stats:
+            total_plays, song_count, imported = threshold_stats[primary_artist_mbid]
+            threshold_stats[primary_artist_mbid] = (total_plays, song_count + 1, imported)
+            new_song_artists.append((primary_artist_mbid, primary_artist))
+
+    for primary_artist_mbid in station_result['recorded_mbids']:
+        if primary_artist_mbid in threshold_stats:
+            total_plays, song_count, imported = threshold_stats[primary_artist_mbid]
+            threshold_stats[primary_artist_mbid] = (total_plays + 1, song_count, imported)
+
+    # Auto-import to Lidarr if artist meets threshold (checked for artists with new songs)
+    for primary_artist_mbid, primary_artist in new_song_artists:
+        # Artist's current play count and song count
+        total_plays, song_count, imported = threshold_stats[primary_artist_mbid]
+
+        # Artists already imported (before or during this run) are skipped
+        if imported:
+            continue
+
+        # Check if artist meets threshold
+        if total_plays < min_plays_for_import or song_count < min_songs_for_import:
+            logger.debug("Artist %s doesn't meet threshold yet (%d/%d plays, %d/%d songs)",
+                         primary_artist, total_plays, min_plays_for_import, song_count, min_songs_for_import)
+            continue
+
+        # Flag as imported now so later songs don't queue the artist again
+        threshold_stats[primary_artist_mbid] = (total_plays, song_count, True)
+        try:
+            success, message = import_artist_to_lidarr(
+                primary_artist_mbid, primary_artist, settings
+            )
+            if success:
+                logger.info(f"Auto-imported {primary_artist} to Lidarr ({total_plays} plays, {song_count} songs)")
+                db.mark_artist_imported_to_lidarr(primary_artist_mbid)
+            else:
+                # Mark for manual import later
+                logger.warning(f"Auto-import failed for {primary_artist}: {message}")
+                threshold_stats[primary_artist_mbid] = (total_plays, song_count, False)
+        except Exception as e:
+            logger.warning(f"Auto-import error for {primary_artist}: {e}")
+            threshold_stats[primary_artist_mbid] = (total_plays, song_count, False)
+            # Continue scraping even if auto-import fails
+
+
+# Runs the post-scrape activity log write and notifications off the scheduler thread
+_post_scrape_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='post-scrape')
+
+
+def _report_scrape_result(db, settings, result, stations_requested):
+    """Log a finished scrape to the activity log and send notifications
+
+    Runs on _post_scrape_executor, using its own pooled connection (or on
+    the scraping thread for in-memory databases, whose only connection is
+    the caller's).
+
+    Args:
+        db: RadioDatabase instance
+        settings: Settings dict (database.pool_size sets the pool size)
+        result: Result dict returned by scrape_all_stations
+        stations_requested: Number of stations the scrape attempted
+    """
+    failed_stations = result['failed_stations']
+    failed_count = len(failed_stations)
+
+    with _station_database(db, settings) as report_db:
+        # Log activity
+        try:
+            severity = 'success' if not failed_count else 'warning' if failed_count < stations_requested else 'error'
+            cursor = report_db.get_cursor()
+            try:
+                log_activity(
+                    cursor,
+                    event_type='scrape',
+                    title=f"Scraping complete: {result['stations_scraped']} stations",
+                    description=result["message"],
+                    metadata={
+                        'stations_scraped': result['stations_scraped'],
+                        'songs_found': result['songs_found'],
+                        'artists_added': result['artists_added'],
+                        'songs_added': result['songs_added'],
+                        'plays_recorded': result['plays_recorded'],
+                        'failed_stations': failed_stations
+                    },
+                    severity=severity,
+                    source='scheduler'
+                )
+                report_db.conn.commit()
+            finally:
+                cursor.close()
+        except Exception as e:
+            logger.error(f"Failed to log scrape activity: {e}")
+
+        # Send notifications
+        try:
+            if result['success']:
+                send_notifications(
+                    report_db,
+                    'on_scrape_complete',
+                    'Scraping Complete',
+                    f"Scraped {result['stations_scraped']} stations, found {result['songs_found']} songs",
+                    'info' if not failed_count else 'warning',
+                    {
+                        'stations_scraped': result['stations_scraped'],
+                        'songs_found': result['songs_found'],
+                        'artists_added': result['artists_added'],
+                        'songs_added': result['songs_added'],
+                        'failed_stations': failed_stations
+                    }
+                )
+            else:
+                send_notifications(
+                    report_db,
+                    'on_scrape_error',
+                    'Scraping Failed',
+                    result.get('message', 'Scraping operation failed'),
+                    'error',
+                    {'stations_scraped': result.get('stations_scraped', 0)}
+                )
+        except Exception as e:
+            logger.error(f"Failed to send scrape notifications: {e}")
+
+
 def scrape_all_stations(db=None, station_ids=None):
     """Scrape all enabled stations and update database
 
@@ -673,18 +1408,24 @@ def scrape_all_stations(db=None, station_ids=None):
     # Load station configurations from database
     load_station_configs_from_db(db)
 
-    # Import MusicBrainz lookup
-    from radio_monitor.mbid import lookup_artist_mbid
-
     # Load settings for auto-import
-    from radio_monitor.gui import load_settings
-    settings = load_settings()
+    settings = _load_scrape_settings()
     auto_import_enabled = settings.get('lidarr', {}).get('auto_import', False) if settings else False
     min_plays_for_import = settings.get('lidarr', {}).get('min_plays_for_import', 5) if settings else 5
     min_songs_for_import = settings.get('lidarr', {}).get('min_songs_for_import', 1) if settings else 1
 
+    # MusicBrainz user agent, read once for every lookup in this run
+    user_agent = (settings or {}).get('musicbrainz', {}).get('user_agent')
+
+    # Per-artist (total_plays, song_count, imported) for auto-import threshold checks
+    # Loaded in one aggregate query, then kept current in memory as songs/plays are added
+    threshold_stats = {}
+
     if auto_import_enabled:
         logger.info(f"Lidarr auto-import is ENABLED (min_plays={min_plays_for_import}, min_songs={min_songs_for_import})")
+        # Already-imported artists are left out: they never need a threshold check,
+        # and artists missing from threshold_stats are skipped by auto-import
+        threshold_stats = db.get_artist_import_stats(include_imported=False)
 
     # Get stations to scrape
     if station_ids:
@@ -715,222 +1456,73 @@ def scrape_all_stations(db=None, station_ids=None):
     stations_scraped = 0
     failed_stations = []
 
-    # Session-level cache for artist MBID lookups (prevents redundant API calls)
-    # Key: artist_name, Value: mbid
-    artist_cache = {}
-
-    for station_id in stations_to_scrape:
-        # Check for cancellation before each station
-        if is_scraping_cancelled():
-            logger.info("Scraping cancelled by user. Stopping.")
-            break
-
-        try:
-            # Scrape the station
-            songs_data = scrape_single_station(db, station_id)
+    run_caches = {
+        # Session-level cache for artist MBID lookups (prevents redundant API calls)
+        # Key: artist_name, Value: mbid
+        'artist_cache': {},
+
+        # Per-run cache of MBID resolutions (including misses), so an artist that
+        # appears on many stations only hits overrides/MusicBrainz once
+        # Key: casefolded artist name, Value: (mbid or None, verified_name)
+        'mbid_resolution_cache': {},
+
+        # Per-run cache of already-validated (artist, song) pairs
+        # Stations sharing hit playlists report the same pairs, so normalization,
+        # advertisement checks and collaboration splitting only run once per pair.
+        # Key: (raw_artist, raw_song, station_mbid)
+        # Value: (artist_name, song_title, artists_to_process) or None if rejected
+        'processed_pairs': {},
+
+        # Manual MBID overrides, loaded once per run (read-only during the run)
+        # Key: normalized lowercase artist name, Value: mbid
+        'manual_overrides': {}
+    }
 
-            if not songs_data:
-                logger.warning(f"No songs found for {station_id}")
-                db.record_scrape_failure(station_id)
-                failed_stations.append(station_id)
+    cursor = db.get_cursor()
+    try:
+        run_caches['manual_overrides'] = get_manual_mbid_override_map(cursor)
+    finally:
+        cursor.close()
+
+    # Scrape stations concurrently, one pooled connection per worker
+    # (in-memory databases share one connection, so they are scraped one at a time)
+    if is_poolable(db.db_path):
+        max_workers = (settings or {}).get('database', {}).get('pool_size', DEFAULT_POOL_SIZE)
+    else:
+        max_workers = 1
+    max_workers = max(1, min(max_workers, len(stations_to_scrape)))
+
+    cancelled = False
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scrape') as executor:
+        futures = [
+            executor.submit(_scrape_station, db, station_id, settings, user_agent, run_caches)
+            for station_id in stations_to_scrape
+        ]
+
+        for future in as_completed(futures):
+            station_result = future.result()
+            if station_result is None:
+                cancelled = True
                 continue
 
-            # Record success and reset failure counter
-            db.record_scrape_success(station_id)
-            total_songs_found += len(songs_data)
-
-            # Process each song
-            for artist_name, song_title, artist_mbid in songs_data:
-                try:
-                    # Clean up the data with proper normalization
-                    from radio_monitor.normalization import normalize_artist_name, normalize_song_title
-                    artist_name = normalize_artist_name(artist_name.strip())
-                    song_title = normalize_song_title(song_title.strip())
-
-                    # Skip if too short (probably not a real song)
-                    if len(artist_name) < 3 or len(song_title) < 3:
-                        continue
-
-                    # SAFETY NET: Final check for advertisements/website content before database insertion
-                    if is_advertisement_or_website_content(artist_name):
-                        logger.warning(f"BLOCKED: Artist name appears to be advertisement/website content: '{artist_name}' (skipping)")
-                        continue
-
-                    if is_advertisement_or_website_content(song_title):
-                        logger.warning(f"BLOCKED: Song title appears to be advertisement/website content: '{song_title}' (skipping)")
-                        continue
-
-                    # Handle collaborations: Use comprehensive collaboration detection
-                    from radio_monitor.normalization import handle_collaboration
-
-                    # Split collaboration into individual artists
-                    # Returns list of (artist, song, mbid) tuples
-                    collaboration_results = handle_collaboration(artist_name, song_title, artist_mbid)
-
-                    # Extract just the artist names for processing
-                    artists_to_process = [result[0] for result in collaboration_results]
-
-                    # Log collaboration splits
-                    if len(artists_to_process) > 1:
-                        logger.info(f"Collaboration detected: '{artist_name}' split into {len(artists_to_process)} artists: {artists_to_process}")
-
-                    # Process each primary artist from the collaboration
-                    for primary_artist in artists_to_process:
-                        # Get MBID with manual override support
-                        # Priority: Station MBID > Manual override > MusicBrainz API > PENDING
-                        primary_artist_mbid = artist_mbid if len(artists_to_process) == 1 else None
-                        primary_artist_verified_name = None  # Will be set by MusicBrainz lookup
-
-                        if not primary_artist_mbid:
-                            # Check for manual override first
-                            cursor = db.get_cursor()
-                            try:
-                                mbid_with_source, source = get_artist_mbid_with_override(
-                                    cursor,
-                                    primary_artist,
-                                    None  # No station MBID at this point
-                                )
-
-                                # Log source for debugging
-                                logger.debug(f"MBID for '{primary_artist}': source={source}, mbid={mbid_with_source}")
-
-                                if mbid_with_source:
-                                    primary_artist_mbid = mbid_with_source
-                                    primary_artist_verified_name = None  # Override doesn't provide verified name
-                                elif source == 'musicbrainz_needed':
-                                    # No override found, try MusicBrainz lookup
-                                    try:
-                                        from radio_monitor.mbid import lookup_artist_mbid
-                                        # Get user_agent from settings for MusicBrainz API
-                                        user_agent = settings.get('musicbrainz', {}).get('user_agent') if settings else None
-                                        primary_artist_mbid, primary_artist_verified_name = lookup_artist_mbid(primary_artist, db, user_agent=user_agent)
-                                        if primary_artist_mbid:
-                                            logger.debug(f"MBID from MusicBrainz for '{primary_artist}': {primary_artist_mbid} (verified: {primary_artist_verified_name})")
-                                    except Exception as e:
-                                        logger.warning(f"MBID lookup failed for '{primary_artist}': {e}")
-                                        primary_artist_verified_name = None
-                            finally:
-                                cursor.close()
-
-                        # If still no MBID, try multi-artist resolution (ONE-TIME attempt)
-                        # Note: This only returns the MBID - no database updates during scraping
-                        # Database updates happen only during manual CLI command to avoid transaction conflicts
-                        if not primary_artist_mbid:
-                            try:
-                                from radio_monitor.multi_artist_resolver import try_split_and_validate
-
-                                # Try to resolve as multi-artist collaboration
-                                logger.info(f"No MBID found for '{primary_artist}', trying multi-artist resolution...")
-
-                                # Use the smart grouping resolver to find the primary MBID
-                                validated_artists = try_split_and_validate(primary_artist, db, user_agent, artist_cache)
-
-                                if validated_artists:
-                                    # Get the MBID of the first (primary) artist
-                                    from radio_monitor.mbid import lookup_artist_mbid
-                                    primary_name = validated_artists[0]
-                                    primary_artist_mbid, primary_artist_verified_name = lookup_artist_mbid(
-                                        artist_name=primary_name,
-                                        db=db,
-                                        user_agent=user_agent
-                                    )
-
-                                if primary_artist_mbid and not primary_artist_mbid.startswith('PENDING'):
-                                    logger.info(f"Multi-artist resolution successful for '{primary_artist}' -> '{primary_name}': {primary_artist_mbid} (verified: {primary_artist_verified_name})")
-                                else:
-                                    logger.debug(f"Multi-artist resolution failed for '{primary_artist}'")
-                            except Exception as e:
-                                logger.warning(f"Multi-artist resolution error for '{primary_artist}': {e}")
-
-                        # If still no MBID, use a placeholder (PENDING)
-                        if not primary_artist_mbid:
-                            # Create temporary MBID placeholder
-                            import hashlib
-                            artist_hash = hashlib.md5(primary_artist.encode()).hexdigest()[:32]
-                            primary_artist_mbid = f"PENDING-{artist_hash}"
-                            logger.debug(f"Using placeholder MBID for {primary_artist}: {primary_artist_mbid}")
-
-                    # Add artist and song to database atomically (prevents orphaned artists)
-                    # Use MusicBrainz's canonical name if available, otherwise fall back to scraped name
-                    # This prevents artist name corruption in the artists table
-                    artist_name_for_db = primary_artist_verified_name if primary_artist_verified_name else primary_artist
-                    artist_added, song_added, play_id = db.add_artist_and_song_if_new(
-                        primary_artist_mbid, artist_name_for_db, song_title
-                    )
-
-                    if artist_added:
-                        total_artists_added += 1
-                        logger.info(f"New artist: {artist_name_for_db} ({primary_artist_mbid})")
-
-                    if song_added:
-                        total_songs_added += 1
-                        logger.info(f"New song: {song_title} by {primary_artist}")
-
-                    # Auto-import to Lidarr if enabled and artist meets threshold (check after song is added)
-                    if auto_import_enabled and song_added:
-                        # Get artist's current play count and song count (including the song we just added)
-                        cursor = db.get_cursor()
-                        try:
-                            cursor.execute("""
-                                SELECT
-                                    COALESCE(SUM(s.play_count), 0) as total_plays,
-                                    COUNT(DISTINCT s.id) as song_count
-                                FROM artists a
-                                LEFT JOIN songs s ON a.mbid = s.artist_mbid
-                                WHERE a.mbid = ?
-                                GROUP BY a.mbid
-                            """, (primary_artist_mbid,))
-
-                            result = cursor.fetchone()
-                            if result:
-                                total_plays = result[0]
-                                song_count = result[1]
-
-                                # Check if artist meets threshold
-                                if total_plays >= min_plays_for_import and song_count >= min_songs_for_import:
-                                    try:
-                                        from radio_monitor.lidarr import import_artist_to_lidarr
-                                        success, message = import_artist_to_lidarr(
-                                            primary_artist_mbid, primary_artist, settings
-                                        )
-                                        if success:
-                                            logger.info(f"Auto-imported {primary_artist} to Lidarr ({total_plays} plays, {song_count} songs)")
-                                            db.mark_artist_imported_to_lidarr(primary_artist_mbid)
-                                        else:
-                                            # Mark for manual import later
-                                            logger.warning(f"Auto-import failed for {primary_artist}: {message}")
-                                    except Exception as e:
-                                        logger.warning(f"Auto-import error for {primary_artist}: {e}")
-                                        # Continue scraping even if auto-import fails
-                                else:
-                                    logger.debug(f"Artist {primary_artist} doesn't meet threshold yet ({total_plays}/{min_plays_for_import} plays, {song_count}/{min_songs_for_import} songs)")
-                        finally:
-                            cursor.close()
-
-                    # Record play for this station (may be skipped as duplicate)
-                    station = db.get_station_by_id(station_id)
-                    if station and play_id:
-                        recorded = db.record_play(
-                            song_id=play_id,
-                            station_id=station['id'],
-                            play_count=1
-                        )
-                        if recorded:
-                            total_plays_recorded += 1
-                        # Silently skip duplicates (no logging, no counter)
-
-                except Exception as e:
-                    logger.warning(f"Error processing song '{song_title}' by '{artist_name}': {e}")
-                    continue
+            total_songs_found += station_result['songs_found']
+            if not station_result['success']:
+                failed_stations.append(station_result['station_id'])
+                continue
 
             stations_scraped += 1
-            logger.info(f"Completed scraping {station_id}: {len(songs_data)} songs found")
+            total_artists_added += station_result['artists_added']
+            total_songs_added += station_result['songs_added']
+            total_plays_recorded += station_result['plays_recorded']
+
+            if auto_import_enabled:
+                _auto_import_station_artists(
+                    db, station_result, threshold_stats, settings,
+                    min_plays_for_import, min_songs_for_import
+                )
 
-        except Exception as e:
-            logger.error(f"Failed to scrape {station_id}: {e}")
-            db.record_scrape_failure(station_id)
-            failed_stations.append(station_id)
-            continue
+    if cancelled:
+        logger.info("Scraping cancelled by user. Stopping.")
 
     # Compile results
     result = {
@@ -950,57 +1542,13 @@ def scrape_all_stations(db=None, station_ids=None):
 
     logger.info(f"Scraping complete: {result}")
 
-    # Log activity
-    try:
-        from radio_monitor.database.activity import log_activity
-        severity = 'success' if len(failed_stations) == 0 else 'warning' if len(failed_stations) < len(stations_to_scrape) else 'error'
-        log_activity(
-            db.get_cursor(),
-            event_type='scrape',
-            title=f"Scraping complete: {stations_scraped} stations",
-            description=result["message"],
-            metadata={
-                'stations_scraped': stations_scraped,
-                'songs_found': total_songs_found,
-                'artists_added': total_artists_added,
-                'songs_added': total_songs_added,
-                'plays_recorded': total_plays_recorded,
-                'failed_stations': failed_stations
-            },
-            severity=severity,
-            source='scheduler'
-        )
-    except Exception as e:
-        logger.error(f"Failed to log scrape activity: {e}")
-
-    # Send notifications
-    try:
-        from radio_monitor.notifications import send_notifications
-        if result['success']:
-            send_notifications(
-                db,
-                'on_scrape_complete',
-                'Scraping Complete',
-                f"Scraped {result['stations_scraped']} stations, found {result['songs_found']} songs",
-                'info' if result['failed_stations'] == 0 else 'warning',
-                {
-                    'stations_scraped': result['stations_scraped'],
-                    'songs_found': result['songs_found'],
-                    'artists_added': result['artists_added'],
-                    'songs_added': result['songs_added'],
-                    'failed_stations': result['failed_stations']
-                }
-            )
-        else:
-            send_notifications(
-                db,
-                'on_scrape_error',
-                'Scraping Failed',
-                result.get('message', 'Scraping operation failed'),
-                'error',
-                {'stations_scraped': result.get('stations_scraped', 0)}
-            )
-    except Exception as e:
-        logger.error(f"Failed to send scrape notifications: {e}")
+    # Log activity and send notifications in the background so the scheduler
+    # isn't held up by the activity log write or notification HTTP calls.
+    # In-memory databases have no pool, and committing on the caller's shared
+    # connection from another thread could race its transactions.
+    if is_poolable(db.db_path):
+        _post_scrape_executor.submit(_report_scrape_result, db, settings, result, len(stations_to_scrape))
+    else:
+        _report_scrape_result(db, settings, result, len(stations_to_scrape))
 
     return result
@@ -9,7 +9,6 @@ Sources:
 
 import logging
 import json
-import time
 import urllib.request
 import urllib.error
 from urllib.parse import quote
@@ -17,6 +16,8 @@ from datetime import datetime
 from difflib import SequenceMatcher
 import requests
 
+from radio_monitor.ratelimit import musicbrainz_limiter
+
 logger = logging.getLogger(__name__)
 
 # Constants
@@ -29,10 +30,6 @@ PENDING = 'PENDING'
 # Thresholds
 SONG_SIMILARITY_THRESHOLD = 0.85
 
-# Rate limiting (respect MusicBrainz rules)
-MUSICBRAINZ_RATE_LIMIT = 1.0  # 1 second between requests
-_last_musicbrainz_request = 0
-
 # ============================================================================
 # MUSICBRAINZ VERIFICATION
 # ============================================================================
@@ -62,8 +59,6 @@ def verify_artist_song_musicbrainz(artist_name, song_title, artist_mbid, user_ag
             'verified_at': str
         }
     """
-    global _last_musicbrainz_request
-
     if not song_title or not artist_mbid:
         return {
             'is_verified': False,
@@ -74,10 +69,8 @@ def verify_artist_song_musicbrainz(artist_name, song_title, artist_mbid, user_ag
     logger.info(f"[MusicBrainz] Verifying: {artist_name} - {song_title}")
 
     try:
-        # Rate limiting
-        time_since_last = time.time() - _last_musicbrainz_request
-        if time_since_last < MUSICBRAINZ_RATE_LIMIT:
-            time.sleep(MUSICBRAINZ_RATE_LIMIT - time_since_last)
+        # Rate limiting (shared with artist lookups - MusicBrainz limits per IP)
+        musicbrainz_limiter.acquire()
 
         # Search for the recording
         encoded_song = quote(song_title, safe='')
@@ -89,8 +82,6 @@ def verify_artist_song_musicbrainz(artist_name, song_title, artist_mbid, user_ag
 
         req = urllib.request.Request(url, headers=headers)
         with urllib.request.urlopen(req, timeout=10) as response:
-            _last_musicbrainz_request = time.time()
-
             if response.status != 200:
                 logger.warning(f"MusicBrainz API returned HTTP {response.status}")
                 return {
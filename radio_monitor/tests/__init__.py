@@ -5,4 +5,12 @@ This package contains unit tests for all major components:
 - test_mbid.py: MBID lookup and caching tests
 - test_database.py: Database CRUD and query tests
 - test_plex_matching.py: Plex fuzzy matching tests
+- test_normalization.py: Artist/title normalization tests
+
+Running:
+    python -m pytest radio_monitor/tests
+
+Tests share no state (each database test gets its own in-memory database),
+so the suite can also run in parallel with pytest-xdist if it is installed:
+    python -m pytest -n auto radio_monitor/tests
 """
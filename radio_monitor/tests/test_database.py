@@ -13,20 +13,53 @@ Tests:
 import unittest
 import sys
 import os
-from datetime import datetime
+import uuid
+import sqlite3
+import tempfile
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from radio_monitor.database import RadioDatabase
+from radio_monitor.database.pool import MMAP_SIZE, is_poolable
+
+# Schema-only database built once and copied into each test's database
+_template_db = None
+
+
+def create_test_database(template=None):
+    """Create a fresh in-memory RadioDatabase with the current schema
+
+    The schema is created once into a template database; each call copies
+    it with SQLite's backup API instead of re-running the schema setup.
+
+    Args:
+        template: Seeded RadioDatabase to copy instead of the empty schema
+                  (lets a test class seed its data once in setUpClass)
+
+    Returns:
+        Connected RadioDatabase
+    """
+    global _template_db
+    if template is None:
+        if _template_db is None:
+            _template_db = RadioDatabase(":memory:")
+            _template_db.connect()
+        template = _template_db
+
+    db = RadioDatabase(":memory:")
+    db.conn = sqlite3.connect(":memory:", check_same_thread=False)
+    template.conn.backup(db.conn)
+    db.cursor = db.conn.cursor()
+    db.cursor.execute("PRAGMA foreign_keys = ON")
+    return db
 
 class TestDatabaseArtist(unittest.TestCase):
     """Test artist CRUD operations"""
 
     def setUp(self):
         """Set up test database"""
-        self.db = RadioDatabase(":memory:")
-        self.db.connect()
+        self.db = create_test_database()
 
     def tearDown(self):
         """Clean up test database"""
@@ -101,8 +134,7 @@ class TestDatabaseSong(unittest.TestCase):
 
     def setUp(self):
         """Set up test database"""
-        self.db = RadioDatabase(":memory:")
-        self.db.connect()
+        self.db = create_test_database()
         # Add test artist
         self.mbid = "test-mbid-songs"
         self.db.add_artist(self.mbid, "Test Artist")
@@ -171,8 +203,7 @@ class TestDatabaseStats(unittest.TestCase):
 
     def setUp(self):
         """Set up test database"""
-        self.db = RadioDatabase(":memory:")
-        self.db.connect()
+        self.db = create_test_database()
 
         # Add test data
         self.mbid1 = "mbid-stats-1"
@@ -187,7 +218,7 @@ class TestDatabaseStats(unittest.TestCase):
 
         # Add more plays
         for i in range(9):  # 9 more = 10 total with add_song
-            self.db.increment_play_count("2025-01-07", i, self.song1)
+            self.db.increment_play_count("2025-01-07", i, self.song1, "wtmx")
         for i in range(4):  # 4 more = 5 total with add_song
             self.db.increment_play_count("2025-01-07", i, self.song2, "us99")
 
@@ -215,16 +246,159 @@ class TestDatabaseStats(unittest.TestCase):
         # Play count includes 1 from add_song + 9 from increment = 10 total
         self.assertGreaterEqual(songs[0][2], 9, "Song One should have at least 9 plays")
 
+class TestArtistImportStats(unittest.TestCase):
+    """Test aggregate auto-import threshold stats"""
+
+    def setUp(self):
+        """Set up test database"""
+        self.db = create_test_database()
+
+    def tearDown(self):
+        """Clean up test database"""
+        self.db.close()
+
+    def test_get_artist_import_stats(self):
+        """Test play/song totals are aggregated per artist in one pass"""
+        self.db.add_artist_and_song_if_new("mbid-import-1", "Artist One", "Song One")
+        self.db.add_artist_and_song_if_new("mbid-import-1", "Artist One", "Song Two")
+        self.db.add_artist_and_song_if_new("mbid-import-2", "Artist Two", "Song Three")
+        self.db.conn.execute("UPDATE songs SET play_count = 3 WHERE song_title = 'Song One'")
+        self.db.mark_artist_imported_to_lidarr("mbid-import-2")
+
+        stats = self.db.get_artist_import_stats()
+
+        self.assertEqual(stats["mbid-import-1"], (3, 2, False), "Artist One should have 3 plays, 2 songs")
+        self.assertEqual(stats["mbid-import-2"], (0, 1, True), "Artist Two should have 0 plays, 1 song, imported")
+
+        pending_stats = self.db.get_artist_import_stats(include_imported=False)
+        self.assertNotIn("mbid-import-2", pending_stats, "Imported artists should be skipped")
+        self.assertIn("mbid-import-1", pending_stats)
+
+    def test_get_artist_mbids_by_names(self):
+        """Test bulk name lookup skips PENDING MBIDs and unknown names"""
+        self.db.add_artist_and_song_if_new("mbid-bulk-1", "Bulk Artist", "Song One")
+        self.db.add_artist_and_song_if_new("PENDING-bulk", "Pending Artist", "Song Two")
+
+        mbids = self.db.get_artist_mbids_by_names(["Bulk Artist", "Pending Artist", "Missing Artist"])
+
+        self.assertEqual(mbids, {"Bulk Artist": "mbid-bulk-1"})
+
+class TestKeysetPagination(unittest.TestCase):
+    """Test cursor-based pagination of artists and songs"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Seed the artists and songs once for the whole class"""
+        cls.seeded_db = create_test_database()
+        with cls.seeded_db.transaction():
+            for i, name in enumerate(["delta", "Alpha", "charlie", "Bravo", "echo"]):
+                cls.seeded_db.add_artist_and_song_if_new(f"mbid-keyset-{i}", name, f"Song {name}",
+                                                         commit=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Close the seeded database"""
+        cls.seeded_db.close()
+
+    def setUp(self):
+        """Set up test database from the seeded copy"""
+        self.db = create_test_database(self.seeded_db)
+
+    def tearDown(self):
+        """Clean up test database"""
+        self.db.close()
+
+    def _walk_pages(self, fetch):
+        """Follow next_cursor until the last page, returning all items"""
+        items, after = [], None
+        while True:
+            page = fetch(after)
+            items.extend(page['items'])
+            after = page['next_cursor']
+            if not after:
+                return items
+
+    def test_artist_pages_follow_cursor(self):
+        """Test artist pages chained by cursor cover every artist once, in order"""
+        from radio_monitor.database.queries import get_artists_paginated
+
+        cursor = self.db.get_cursor()
+        items = self._walk_pages(lambda after: get_artists_paginated(cursor, limit=2, after=after))
+        names = [item['name'].lower() for item in items]
+        self.assertEqual(names, ["alpha", "bravo", "charlie", "delta", "echo"])
+
+        items = self._walk_pages(lambda after: get_artists_paginated(cursor, limit=2, direction='desc', after=after))
+        self.assertEqual([item['name'].lower() for item in items], list(reversed(names)))
+
+    def test_song_pages_follow_cursor(self):
+        """Test song pages chained by cursor cover every song once, in order"""
+        from radio_monitor.database.queries import get_songs_paginated
+
+        cursor = self.db.get_cursor()
+        items = self._walk_pages(lambda after: get_songs_paginated(cursor, limit=3, after=after))
+        titles = [item['song_title'] for item in items]
+        self.assertEqual(titles, sorted(titles, key=str.lower))
+        self.assertEqual(len(titles), 5)
+
+    def test_total_refreshes_after_write(self):
+        """Test cached list totals are recomputed once the data changes"""
+        from radio_monitor.database.queries import get_artists_paginated
+
+        cursor = self.db.get_cursor()
+        self.assertEqual(get_artists_paginated(cursor, limit=2)['total'], 5)
+        self.assertEqual(get_artists_paginated(cursor, limit=2)['total'], 5)
+
+        self.db.add_artist_and_song_if_new("mbid-keyset-new", "Foxtrot", "Song Foxtrot")
+        self.assertEqual(get_artists_paginated(cursor, limit=2)['total'], 6)
+        self.assertIsNone(get_artists_paginated(cursor, limit=2, include_total=False)['total'])
+
+    def _add_artists_with_mbid_states(self, n_pending=0, n_null=0):
+        """Insert song-less artists with PENDING and NULL MBIDs in one statement"""
+        rows = ([(f"PENDING-test-{i}", f"Pending {i}") for i in range(n_pending)] +
+                [(None, f"Unmatched {i}") for i in range(n_null)])
+        with self.db.transaction():
+            self.db.conn.executemany("INSERT INTO artists (mbid, name) VALUES (?, ?)", rows)
+
+    def test_mbid_status_filter(self):
+        """Test filtering artists by pending/valid/none MBID status"""
+        from radio_monitor.database.queries import get_artists_paginated
+
+        self._add_artists_with_mbid_states(n_pending=2, n_null=1)
+        cursor = self.db.get_cursor()
+        totals = {status: get_artists_paginated(cursor, limit=10, filters={'mbid_status': status})['total']
+                  for status in ('pending', 'none', 'valid')}
+        self.assertEqual(totals, {'pending': 2, 'none': 1, 'valid': 5})
+
+    def test_search_filter(self):
+        """Test substring search through the artist name index stays in sync with renames"""
+        from radio_monitor.database.queries import get_artists_paginated
+
+        cursor = self.db.get_cursor()
+        search = lambda term: [item['name'].lower() for item in
+                               get_artists_paginated(cursor, limit=10, filters={'search': term})['items']]
+        self.assertEqual(search("HARL"), ["charlie"])
+        self.assertEqual(search("a"), ["alpha", "bravo", "charlie", "delta"])
+
+        self.db.conn.execute("UPDATE artists SET name = 'Charles' WHERE name = 'charlie'")
+        self.assertEqual(search("harl"), ["charles"])
+        self.assertEqual(search("charlie"), [])
+
+    def test_invalid_cursor_raises(self):
+        """Test a malformed cursor is rejected"""
+        from radio_monitor.database.queries import get_artists_paginated
+
+        with self.assertRaises(ValueError):
+            get_artists_paginated(self.db.get_cursor(), limit=2, after="not-a-cursor")
+
 class TestStationHealth(unittest.TestCase):
     """Test station health tracking"""
 
     def setUp(self):
         """Set up test database"""
-        self.db = RadioDatabase(":memory:")
-        self.db.connect()
+        self.db = create_test_database()
 
         # Add a test station
-        self.db.cursor.execute("""
+        self.db.conn.execute("""
             INSERT INTO stations (id, name, url, genre, market)
             VALUES ('test1', 'Test Station', 'http://test.com', 'Pop', 'Chicago')
         """)
@@ -287,5 +461,209 @@ class TestStationHealth(unittest.TestCase):
         self.assertIn('Degraded', health['status'], "Status should be Degraded")
         self.assertEqual(health['status_class'], 'warning', "Class should be warning")
 
+class TestRecordPlays(unittest.TestCase):
+    """Test play recording with duplicate detection"""
+
+    def setUp(self):
+        """Set up test database"""
+        self.db = create_test_database()
+
+        # Add a test station
+        self.db.conn.execute("""
+            INSERT INTO stations (id, name, url, genre, market)
+            VALUES ('test1', 'Test Station', 'http://test.com', 'Pop', 'Chicago')
+        """)
+        self.db.conn.commit()
+
+    def tearDown(self):
+        """Clean up test database"""
+        self.db.close()
+
+    def test_record_plays_batch_skips_duplicates(self):
+        """Test batched play recording skips a song repeated within the window"""
+        _, _, song1 = self.db.add_artist_and_song_if_new("mbid-plays-1", "Play Artist", "Song One")
+        _, _, song2 = self.db.add_artist_and_song_if_new("mbid-plays-1", "Play Artist", "Song Two")
+
+        recorded = self.db.record_plays([song1, song2, song1], "test1")
+        self.assertEqual(recorded, [song1, song2], "Repeated song should be recorded once")
+
+        # Plays already recorded this hour are duplicates on the next scrape
+        self.assertEqual(self.db.record_plays([song1], "test1"), [])
+
+        plays = self.db.conn.execute("SELECT SUM(play_count) FROM song_plays_daily").fetchone()[0]
+        self.assertEqual(plays, 2, "Should have 2 plays recorded")
+
+class TestSharedMemoryDatabase(unittest.TestCase):
+    """Test shared-cache in-memory database URIs"""
+
+    def setUp(self):
+        """Set up test database"""
+        self.db = RadioDatabase(f"file:testdb_{uuid.uuid4().hex}?mode=memory&cache=shared")
+        self.db.connect()
+
+    def tearDown(self):
+        """Clean up test database"""
+        self.db.close()
+
+    def test_second_connection_sees_same_database(self):
+        """Test that other connections share the in-memory database"""
+        self.db.add_artist_if_new("mbid-shared", "Shared Artist")
+        self.assertTrue(is_poolable(self.db.db_path))
+
+        other = self.db.get_thread_local_connection()
+        try:
+            artist = other.get_artist_by_mbid("mbid-shared")
+            self.assertIsNotNone(artist)
+        finally:
+            other.close()
+
+class TestPlaylistBuilderState(unittest.TestCase):
+    """Test playlist builder selections"""
+
+    def setUp(self):
+        """Set up test database with three songs"""
+        self.db = create_test_database()
+        self.song_ids = [self.db.add_artist_and_song_if_new(f"mbid-builder-{i}", f"Builder Artist {i}", f"Song {i}")[2]
+                         for i in range(3)]
+
+    def tearDown(self):
+        """Clean up test database"""
+        self.db.close()
+
+    def test_batch_add_skips_duplicates_and_unknown_songs(self):
+        """Test batch add counts only new selections of existing songs"""
+        from radio_monitor.database import crud
+
+        cursor = self.db.get_cursor()
+        self.assertEqual(crud.add_songs_to_builder_state_batch(cursor, "session-1", self.song_ids[:2]), 2)
+        self.assertEqual(crud.add_songs_to_builder_state_batch(cursor, "session-1", self.song_ids + [999999]), 1)
+        self.db.conn.commit()
+
+        selected = self.db.conn.execute(
+            "SELECT COUNT(*) FROM playlist_builder_state WHERE session_id = ?", ("session-1",)).fetchone()[0]
+        self.assertEqual(selected, 3)
+
+    def test_selection_lookups_use_index(self):
+        """Test session lookups seek the (session_id, song_id) index instead of scanning"""
+        for sql, params in [
+            ("SELECT song_id FROM playlist_builder_state WHERE session_id = ?", ("session-1",)),
+            ("DELETE FROM playlist_builder_state WHERE session_id = ? AND song_id = ?", ("session-1", 1)),
+        ]:
+            plan = " ".join(row[3] for row in self.db.conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+            self.assertIn("USING", plan)
+            self.assertNotIn("SCAN", plan)
+
+class TestFileDatabase(unittest.TestCase):
+    """Test pragmas applied to on-disk databases"""
+
+    def setUp(self):
+        """Set up test database in a temporary directory"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = RadioDatabase(os.path.join(self.tmpdir.name, "radio_songs.db"))
+        self.db.connect()
+
+    def tearDown(self):
+        """Clean up test database"""
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_wal_and_mmap_enabled(self):
+        """Test that file databases use WAL, synchronous=NORMAL and mmap"""
+        other = self.db.get_thread_local_connection()
+        try:
+            for conn in (self.db.conn, other.conn):
+                self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+                self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)  # NORMAL
+                self.assertEqual(conn.execute("PRAGMA mmap_size").fetchone()[0], MMAP_SIZE)
+                self.assertEqual(conn.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+        finally:
+            other.close()
+
+class TestActivityLog(unittest.TestCase):
+    """Test activity log writes"""
+
+    def setUp(self):
+        """Set up test database"""
+        self.db = create_test_database()
+
+    def tearDown(self):
+        """Clean up test database"""
+        self.db.close()
+
+    def test_log_activity_in_transaction(self):
+        """Test several events logged inside one transaction"""
+        from radio_monitor.database import activity
+
+        cursor = self.db.get_cursor()
+        with self.db.transaction():
+            activity.log_activity(cursor, 'scrape', 'Scrape 1')
+            activity.log_activity(cursor, 'scrape', 'Scrape 2', severity='success')
+            activity.log_activity(cursor, 'error', 'Failed', metadata={'station': 'wtmx'}, severity='error')
+
+        entries = activity.get_activity_paginated(cursor, limit=10)
+        self.assertEqual(len(entries), 3)
+        self.assertEqual(sum(1 for e in entries if e['event_type'] == 'scrape'), 2)
+
+    def test_activity_pages_follow_cursor(self):
+        """Test activity pages chained by cursor list every entry once, newest first"""
+        from radio_monitor.database import activity
+
+        cursor = self.db.get_cursor()
+        for i in range(5):
+            activity.log_activity(cursor, 'scrape', f'Scrape {i}')
+        self.db.conn.commit()
+
+        ids, after = [], None
+        while True:
+            entries = activity.get_activity_paginated(cursor, limit=2, after=after)
+            ids.extend(entry['id'] for entry in entries)
+            after = activity.activity_page_cursor(entries, 2)
+            if not after:
+                break
+
+        self.assertEqual(ids, sorted(ids, reverse=True))
+        self.assertEqual(len(ids), 5)
+
+
+class TestPlexFailures(unittest.TestCase):
+    """Test Plex failure tracking"""
+
+    def setUp(self):
+        """Set up test database"""
+        self.db = create_test_database()
+
+    def tearDown(self):
+        """Clean up test database"""
+        self.db.close()
+
+    def test_failure_pages_follow_cursor(self):
+        """Test failure pages chained by cursor match the unpaged list"""
+        from radio_monitor.database import plex_failures
+
+        self.db.add_artist_and_song_if_new(str(uuid.uuid4()), "Artist", "Song")
+        cursor = self.db.get_cursor()
+        song_id = cursor.execute("SELECT id FROM songs").fetchone()[0]
+        plex_failures.log_plex_failures(cursor, [
+            {'song_id': song_id, 'failure_reason': 'no_match'} for _ in range(5)
+        ])
+        # Shared timestamps exercise the id tie-break
+        cursor.execute("UPDATE plex_match_failures SET failure_date = datetime('now', '-' || (id % 2) || ' minutes')")
+        self.db.conn.commit()
+
+        for direction in ('desc', 'asc'):
+            expected = [f['id'] for f in plex_failures.get_failures(cursor, direction=direction)]
+
+            ids, after = [], None
+            while True:
+                failures = plex_failures.get_failures(cursor, limit=2, direction=direction, after=after)
+                ids.extend(failure['id'] for failure in failures)
+                after = plex_failures.failure_page_cursor(failures, 2)
+                if not after:
+                    break
+
+            self.assertEqual(ids, expected)
+            self.assertEqual(len(ids), 5)
+
+
 if __name__ == '__main__':
     unittest.main()
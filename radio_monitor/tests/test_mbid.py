@@ -7,19 +7,35 @@ Tests:
 2. MBID lookup for not found artist
 3. MBID caching
 4. Rate limiting
+5. Batched lookups (mocked MusicBrainz responses)
+
+Lookup and cache tests call the live MusicBrainz API and are skipped unless
+RUN_INTEGRATION_TESTS=1 is set.
 """
 
 import unittest
 import sys
 import os
+import json
+from unittest import mock
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from radio_monitor.mbid import lookup_artist_mbid
+from radio_monitor.mbid import lookup_artist_mbid, lookup_artist_mbids_batch
+from radio_monitor.multi_artist_resolver import try_musicbrainz_search
+from radio_monitor.scrapers import _resolve_artist_mbids
+from radio_monitor.ratelimit import RateLimiter
 from radio_monitor.database import RadioDatabase
 
+# Tests that call the live MusicBrainz API only run when opted in
+RUN_INTEGRATION_TESTS = bool(os.environ.get('RUN_INTEGRATION_TESTS'))
+requires_network = unittest.skipUnless(
+    RUN_INTEGRATION_TESTS, "requires MusicBrainz API access (set RUN_INTEGRATION_TESTS=1)"
+)
+
 
+@requires_network
 class TestMBIDLookup(unittest.TestCase):
     """Test MBID lookup functionality"""
 
@@ -125,6 +141,7 @@ class TestMBIDLookup(unittest.TestCase):
                         "MBID should be valid UUID format")
 
 
+@requires_network
 class TestMBIDCache(unittest.TestCase):
     """Test MBID caching functionality"""
 
@@ -179,5 +196,110 @@ class TestMBIDCache(unittest.TestCase):
                            "Different artists should have different MBIDs")
 
 
+class FakeClock:
+    """Manual clock for RateLimiter tests: sleep() advances time instantly"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test the shared MusicBrainz rate limiter"""
+
+    def test_requests_are_spaced_by_rate(self):
+        """Test that requests beyond the burst wait for a slot"""
+        clock = FakeClock()
+        limiter = RateLimiter(rate=50.0, burst=1, clock=clock, sleep=clock.sleep)
+
+        for _ in range(3):
+            limiter.acquire()
+
+        # First request is free, the next two wait 1/50s each
+        self.assertEqual(len(clock.sleeps), 2)
+        for wait in clock.sleeps:
+            self.assertAlmostEqual(wait, 0.02)
+
+    def test_backoff_doubles_and_caps(self):
+        """Test 503 backoff grows exponentially up to the cap"""
+        clock = FakeClock()
+        limiter = RateLimiter(rate=1000.0, backoff_initial=0.01, backoff_max=0.04,
+                              clock=clock, sleep=clock.sleep)
+
+        self.assertAlmostEqual(limiter.backoff(0), 0.01)
+        self.assertAlmostEqual(limiter.backoff(1), 0.02)
+        self.assertAlmostEqual(limiter.backoff(5), 0.04)
+
+        # Next acquire waits out the backoff window
+        self.assertAlmostEqual(limiter.acquire(), 0.04)
+        self.assertEqual(len(clock.sleeps), 1, "Acquire should sleep once after backoff")
+
+
+def _mock_search_response(artists):
+    """Build a urlopen() stand-in returning a MusicBrainz artist search"""
+    response = mock.MagicMock()
+    response.read.return_value = json.dumps({'artists': artists}).encode('utf-8')
+    response.__enter__.return_value = response
+    return mock.Mock(return_value=response)
+
+
+@mock.patch('radio_monitor.mbid.musicbrainz_limiter.acquire', mock.Mock(return_value=0))
+class TestBatchLookup(unittest.TestCase):
+    """Test batched MBID lookups against mocked search results"""
+
+    SEARCH_RESULTS = [
+        {'id': 'mbid-taylor', 'name': 'Taylor Swift'},
+        {'id': 'mbid-bad-bunny', 'name': 'Bad Bunny'},
+    ]
+
+    def setUp(self):
+        """Set up test database"""
+        self.db = RadioDatabase(":memory:")
+        self.db.connect()
+
+    def tearDown(self):
+        """Clean up test database"""
+        self.db.close()
+
+    def test_batch_hit_and_miss(self):
+        """Test names in the combined results match and others come back None"""
+        with mock.patch('radio_monitor.mbid.urllib.request.urlopen',
+                        _mock_search_response(self.SEARCH_RESULTS)) as urlopen:
+            results = lookup_artist_mbids_batch(['Taylor Swift', 'Zzyzx Unknown'])
+
+        self.assertEqual(urlopen.call_count, 1, "All names should share one request")
+        self.assertEqual(results, {'Taylor Swift': 'mbid-taylor', 'Zzyzx Unknown': None})
+
+    def test_resolver_looks_up_crowded_out_names(self):
+        """Test batch misses fall back to a single-name lookup in the resolver"""
+        with mock.patch('radio_monitor.mbid.urllib.request.urlopen',
+                        _mock_search_response(self.SEARCH_RESULTS)), \
+             mock.patch('radio_monitor.multi_artist_resolver.lookup_artist_mbid',
+                        return_value=('mbid-common', 'Common')) as single_lookup:
+            results = try_musicbrainz_search(['Taylor Swift', 'Common'], self.db, 'test-agent')
+
+        single_lookup.assert_called_once_with(artist_name='Common', db=self.db, user_agent='test-agent')
+        self.assertEqual(results, {'Taylor Swift': 'mbid-taylor', 'Common': 'mbid-common'})
+
+    def test_scraper_looks_up_crowded_out_names(self):
+        """Test batch misses get the full single-name resolution in the scraper"""
+        with mock.patch('radio_monitor.mbid.urllib.request.urlopen',
+                        _mock_search_response(self.SEARCH_RESULTS)), \
+             mock.patch('radio_monitor.scrapers._resolve_primary_mbid',
+                        return_value=('mbid-common', 'Common')) as single_lookup:
+            resolved = _resolve_artist_mbids(self.db, ['Bad Bunny', 'Common'], 'test-agent', {}, {})
+
+        single_lookup.assert_called_once_with(self.db, 'Common', 'test-agent', {})
+        self.assertEqual(resolved, {'Bad Bunny': ('mbid-bad-bunny', 'Bad Bunny'),
+                                    'Common': ('mbid-common', 'Common')})
+
+
 if __name__ == '__main__':
     unittest.main()
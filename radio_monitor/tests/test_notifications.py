@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+"""
+Unit tests for notification delivery
+
+Tests:
+1. SMTP connection pooling (reuse, reconnect, close)
+2. Parallel delivery and batched history writes
+3. Per-provider rate limiters
+4. Circuit breaker state transitions
+
+Providers are mocked; no network access is needed.
+"""
+
+import unittest
+import smtplib
+import sys
+import os
+import threading
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from radio_monitor import notifications
+from radio_monitor.notifications import (
+    CircuitBreaker, EmailHandler, close_smtp_connections, send_notifications, get_provider_limiter
+)
+from radio_monitor.database import RadioDatabase
+from radio_monitor.database import notifications as notif_db
+
+EMAIL_CONFIG = {
+    'smtp_server': 'smtp.example.com',
+    'smtp_port': 587,
+    'username': 'radio@example.com',
+    'password': 'secret',
+    'to_addr': 'me@example.com',
+}
+
+
+class TestSMTPPool(unittest.TestCase):
+    """Test pooled SMTP connections used by EmailHandler"""
+
+    def setUp(self):
+        """Start each test with an empty pool and a mocked smtplib.SMTP"""
+        notifications._smtp_pool.clear()
+        patcher = mock.patch('radio_monitor.notifications.smtplib.SMTP')
+        self.smtp_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(notifications._smtp_pool.clear)
+
+    def test_connection_reused(self):
+        """Test a second send reuses the pooled, already authenticated connection"""
+        handler = EmailHandler(EMAIL_CONFIG)
+
+        self.assertTrue(handler.send('First', 'message'))
+        self.assertTrue(handler.send('Second', 'message'))
+
+        self.smtp_class.assert_called_once_with('smtp.example.com', 587)
+        server = self.smtp_class.return_value
+        server.login.assert_called_once()
+        self.assertEqual(server.send_message.call_count, 2)
+
+    def test_failed_pooled_connection_replaced(self):
+        """Test a pooled connection that fails (421) is discarded, not returned"""
+        stale, fresh = mock.Mock(name='stale'), mock.Mock(name='fresh')
+        self.smtp_class.side_effect = [stale, fresh]
+        handler = EmailHandler(EMAIL_CONFIG)
+
+        self.assertTrue(handler.send('First', 'message'))   # opens stale, pools it
+        stale.send_message.side_effect = smtplib.SMTPResponseException(421, b'Service closing')
+        self.assertTrue(handler.send('Second', 'message'))  # stale fails, fresh sends
+
+        stale.quit.assert_called_once()
+        fresh.send_message.assert_called_once()
+        pooled = [server for servers in notifications._smtp_pool.values() for server, _ in servers]
+        self.assertEqual(pooled, [fresh])
+
+    def test_failed_new_connection_not_pooled(self):
+        """Test a connection whose send fails (socket error) is closed, not pooled"""
+        self.smtp_class.return_value.send_message.side_effect = OSError('Connection reset')
+        handler = EmailHandler(EMAIL_CONFIG)
+
+        self.assertFalse(handler.send('Title', 'message'))
+
+        self.smtp_class.return_value.quit.assert_called_once()
+        self.assertEqual(notifications._smtp_pool, {})
+
+    def test_close_smtp_connections(self):
+        """Test closing the pool quits every idle connection"""
+        handler = EmailHandler(EMAIL_CONFIG)
+        handler.send('Title', 'message')
+
+        close_smtp_connections()
+
+        self.smtp_class.return_value.quit.assert_called_once()
+        self.assertEqual(notifications._smtp_pool, {})
+
+
+class TestSendNotifications(unittest.TestCase):
+    """Test fan-out of one event to every configured provider"""
+
+    def setUp(self):
+        """Set up test database with three providers for one trigger"""
+        notifications._breakers.clear()
+        self.addCleanup(notifications._breakers.clear)
+
+        self.db = RadioDatabase(":memory:")
+        self.db.connect()
+        cursor = self.db.get_cursor()
+        self.ids = [
+            notif_db.create_notification(cursor, 'discord', name, {'webhook_url': name}, ['on_scrape_complete'])
+            for name in ('ok', 'fails', 'raises')
+        ]
+        self.db.conn.commit()
+        cursor.close()
+
+    def tearDown(self):
+        """Clean up test database"""
+        self.db.close()
+
+    def test_every_provider_attempted_despite_failures(self):
+        """Test a failing or raising provider doesn't stop the others"""
+        attempted = []
+        lock = threading.Lock()
+
+        def fake_send(notification_type, config, *args):
+            with lock:
+                attempted.append(config['webhook_url'])
+            if config['webhook_url'] == 'raises':
+                raise RuntimeError('provider exploded')
+            return config['webhook_url'] == 'ok'
+
+        with mock.patch('radio_monitor.notifications.send_notification', side_effect=fake_send), \
+             mock.patch.object(notif_db, 'log_notification_sends', wraps=notif_db.log_notification_sends) as log_sends:
+            sent = send_notifications(self.db, 'on_scrape_complete', 'Scrape', 'Done')
+
+        self.assertEqual(sent, 1)
+        self.assertEqual(sorted(attempted), ['fails', 'ok', 'raises'])
+        log_sends.assert_called_once()
+
+        cursor = self.db.get_cursor()
+        history = dict(cursor.execute("SELECT notification_id, success FROM notification_history").fetchall())
+        self.assertEqual(history, {self.ids[0]: 1, self.ids[1]: 0, self.ids[2]: 0})
+        failures = dict(cursor.execute("SELECT id, failure_count FROM notifications").fetchall())
+        self.assertEqual(failures, {self.ids[0]: 0, self.ids[1]: 1, self.ids[2]: 1})
+
+
+class TestProviderLimiters(unittest.TestCase):
+    """Test rate limiters are shared per provider endpoint"""
+
+    def setUp(self):
+        """Start each test without cached limiters"""
+        notifications._provider_limiters.clear()
+        self.addCleanup(notifications._provider_limiters.clear)
+
+    def test_limiter_shared_per_endpoint(self):
+        """Test the same webhook shares one limiter and other endpoints get their own"""
+        discord = get_provider_limiter('discord', {'webhook_url': 'https://discord/a'})
+
+        self.assertIs(get_provider_limiter('discord', {'webhook_url': 'https://discord/a'}), discord)
+        self.assertIsNot(get_provider_limiter('discord', {'webhook_url': 'https://discord/b'}), discord)
+        self.assertIsNot(get_provider_limiter('slack', {'webhook_url': 'https://discord/a'}), discord)
+        self.assertEqual((discord.rate, discord.burst), (0.5, 5))
+
+        telegram = get_provider_limiter('telegram', {'bot_token': 'token'})
+        self.assertEqual((telegram.rate, telegram.burst), (30.0, 30))
+
+    def test_unknown_provider_unthrottled(self):
+        """Test providers without a published limit get no limiter"""
+        self.assertIsNone(get_provider_limiter('email', {'smtp_server': 'smtp.example.com'}))
+        self.assertIsNone(get_provider_limiter('gotify', {}))
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test circuit breaker transitions with an injected clock"""
+
+    def setUp(self):
+        """Create a breaker that opens after 3 failures for 60 seconds"""
+        self.now = 1000.0
+        self.breaker = CircuitBreaker(threshold=3, cooldown=60, clock=lambda: self.now)
+
+    def fail(self, times):
+        """Record `times` failed sends"""
+        for _ in range(times):
+            self.breaker.record(False)
+
+    def test_opens_after_threshold(self):
+        """Test consecutive failures below the threshold keep it closed"""
+        self.fail(2)
+        self.assertTrue(self.breaker.allow())
+
+        self.fail(1)
+        self.assertFalse(self.breaker.allow())
+
+    def test_success_resets_failure_count(self):
+        """Test a success between failures restarts the count"""
+        self.fail(2)
+        self.breaker.record(True)
+        self.fail(2)
+        self.assertTrue(self.breaker.allow())
+
+    def test_half_open_after_cooldown(self):
+        """Test one probe is allowed after the cooldown, others wait for it"""
+        self.fail(3)
+        self.now += 59
+        self.assertFalse(self.breaker.allow())
+
+        self.now += 1
+        self.assertTrue(self.breaker.allow(), "Probe should be allowed after cooldown")
+        self.assertFalse(self.breaker.allow(), "Only one probe while half-open")
+
+    def test_probe_result_closes_or_reopens(self):
+        """Test a successful probe closes the breaker and a failed one restarts the cooldown"""
+        self.fail(3)
+        self.now += 60
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record(False)
+        self.now += 30
+        self.assertFalse(self.breaker.allow(), "Failed probe should reopen the breaker")
+
+        self.now += 30
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record(True)
+        self.assertTrue(self.breaker.allow())
+        self.assertTrue(self.breaker.allow(), "Successful probe should close the breaker")
+
+
+if __name__ == '__main__':
+    unittest.main()
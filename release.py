@@ -21,21 +21,28 @@ Example:
 """
 
 import os
+import re
 import sys
 import subprocess
 import shutil
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 
+# The version line in radio_monitor/__init__.py
+VERSION_LINE_RE = re.compile(r'^__version__ =.*$', re.MULTILINE)
+
+# File types that are already compressed (re-deflating them only costs CPU)
+PRECOMPRESSED_EXTENSIONS = {'.zip', '.gz', '.png', '.jpg', '.jpeg', '.gif', '.woff', '.woff2'}
+
 def run_command(cmd, check=True, capture_output=False, cwd=None):
-    """Run a shell command and return the result."""
-    print(f"  $ {cmd}")
+    """Run a command (list of arguments, no shell) and return the result."""
+    print(f"  $ {subprocess.list2cmdline(cmd)}")
     if capture_output:
         result = subprocess.run(
             cmd,
-            shell=True,
             capture_output=True,
             text=True,
             check=check,
@@ -43,9 +50,19 @@ def run_command(cmd, check=True, capture_output=False, cwd=None):
         )
         return result.stdout.strip()
     else:
-        subprocess.run(cmd, shell=True, check=check, cwd=cwd)
+        subprocess.run(cmd, check=check, cwd=cwd)
     return None
 
+def iter_files(root, prefix=''):
+    """Yield (path, archive name) for every file under root, recursively."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            arcname = prefix + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path, arcname + '/')
+            elif entry.is_file():
+                yield entry.path, arcname
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python release.py <version>")
@@ -53,6 +70,9 @@ def main():
         sys.exit(1)
 
     new_version = sys.argv[1]
+    if not re.fullmatch(r'\d+\.\d+\.\d+', new_version):
+        print(f"Invalid version: {new_version} (expected MAJOR.MINOR.PATCH, e.g. 1.1.11)")
+        sys.exit(1)
 
     print("=" * 70)
     print(f"Radio Monitor - Release v{new_version}")
@@ -63,36 +83,33 @@ def main():
     print("Step 1: Updating version...")
     init_file = os.path.join(PROJECT_ROOT, 'radio_monitor', '__init__.py')
     with open(init_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+        content = f.read()
 
-    # Find and replace the version line
-    for i, line in enumerate(lines):
-        if line.startswith('__version__ ='):
-            lines[i] = f'__version__ = "{new_version}"\n'
-            break
+    # Replace the version line
+    content = VERSION_LINE_RE.sub(f'__version__ = "{new_version}"', content, count=1)
 
     with open(init_file, 'w', encoding='utf-8') as f:
-        f.writelines(lines)
+        f.write(content)
 
     print(f"  Updated __version__ to {new_version}")
     print()
 
     # Step 2: Commit version change
     print("Step 2: Committing version change...")
-    run_command('git add radio_monitor/__init__.py')
-    run_command(f'git commit -m "chore: Bump version to {new_version}"')
+    run_command(['git', 'add', 'radio_monitor/__init__.py'])
+    run_command(['git', 'commit', '-m', f'chore: Bump version to {new_version}'])
     print()
 
     # Step 3: Create git tag
     print("Step 3: Creating git tag...")
     tag_name = f"v{new_version}"
-    run_command(f'git tag -a {tag_name} -m "Release {tag_name}"')
+    run_command(['git', 'tag', '-a', tag_name, '-m', f'Release {tag_name}'])
     print()
 
     # Step 4: Push to GitHub
     print("Step 4: Pushing to GitHub...")
-    run_command('git push origin main')
-    run_command(f'git push origin {tag_name}')
+    run_command(['git', 'push', 'origin', 'main'])
+    run_command(['git', 'push', 'origin', tag_name])
     print()
 
     # Step 5: Build EXE locally
@@ -100,14 +117,14 @@ def main():
     print("  This will take several minutes...")
     build_dir = os.path.join(PROJECT_ROOT, 'pyinstaller')
 
-    # Clean previous builds
-    for dir_name in ['build', 'dist/pyinstaller']:
-        dir_path = os.path.join(PROJECT_ROOT, dir_name)
-        if os.path.exists(dir_path):
-            shutil.rmtree(dir_path)
+    # Clean previous builds (separate trees, so remove them concurrently)
+    dir_paths = [os.path.join(PROJECT_ROOT, dir_name) for dir_name in ['build', 'dist/pyinstaller']]
+    dir_paths = [dir_path for dir_path in dir_paths if os.path.exists(dir_path)]
+    with ThreadPoolExecutor(max_workers=len(dir_paths) or 1) as executor:
+        list(executor.map(shutil.rmtree, dir_paths))
 
     # Run build.py
-    run_command('python build.py', cwd=build_dir)
+    run_command([sys.executable, 'build.py'], cwd=build_dir)
     print()
 
     # Step 6: Create release ZIP
@@ -119,11 +136,12 @@ def main():
     if os.path.exists(zip_path):
         os.remove(zip_path)
 
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(exe_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, exe_dir)
+    # Fast DEFLATE level; already-compressed files are stored as-is
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+        for file_path, arcname in iter_files(exe_dir):
+            if os.path.splitext(file_path)[1].lower() in PRECOMPRESSED_EXTENSIONS:
+                zipf.write(file_path, arcname, compress_type=zipfile.ZIP_STORED)
+            else:
                 zipf.write(file_path, arcname)
 
     zip_size = os.path.getsize(zip_path)
@@ -154,7 +172,7 @@ See CHANGELOG.md for details.
             gh_path = 'gh'
 
         # Verify gh works
-        subprocess.run([gh_path, '--version'], capture_output=True, check=True)
+        subprocess.run([gh_path, '--version'], stdout=subprocess.DEVNULL, check=True)
 
         # Use gh to create release
         release_cmd = [